@@ -5,7 +5,9 @@ This Flask app serves as the API backend for the VibeDispatch React frontend.
 All page rendering has been moved to the React microfrontend.
 """
 
+import gzip
 import os
+import threading
 
 from flask import Flask, request, jsonify
 
@@ -20,6 +22,8 @@ except ImportError:
 URL_PREFIX = os.environ.get("URL_PREFIX", "/dispatch")
 
 app = Flask(__name__)
+# Keep dict insertion order in responses; sorting every payload's keys is wasted work
+app.json.sort_keys = False
 
 
 # ============ CORS Support ============
@@ -37,6 +41,34 @@ def add_cors_headers(response):
     return response
 
 
+# ============ Compression ============
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 1  # JSON and diffs compress well even at the fastest level
+
+
+@app.after_request
+def gzip_response(response):
+    """Gzip buffered JSON/text responses when the client accepts it."""
+    if (
+        response.status_code != 200
+        or response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+        or not (response.mimetype == "application/json" or response.mimetype.startswith("text/"))
+        or "gzip" not in request.headers.get("Accept-Encoding", "").lower()
+    ):
+        return response
+
+    body = response.get_data()
+    if len(body) < GZIP_MIN_SIZE:
+        return response
+
+    response.set_data(gzip.compress(body, compresslevel=GZIP_LEVEL))
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
+
 @app.route('/')
 def api_root():
     """API info endpoint."""
@@ -47,8 +79,49 @@ def api_root():
 app.register_blueprint(bp, url_prefix=URL_PREFIX)
 
 
+# ============ Cache Prefetch ============
+# PREFETCH_ENABLED=1 keeps the dashboard's cached endpoints warm from a
+# background thread, refreshing them a minute before the default cache TTL.
+# Only `python app.py` starts it, so importing the app (tests, tooling, WSGI
+# workers) never spawns gh calls; other servers can call start_prefetch().
+PREFETCH_ENABLED = os.environ.get("PREFETCH_ENABLED", "").lower() in ("1", "true")
+PREFETCH_INTERVAL = int(os.environ.get("PREFETCH_INTERVAL", "240"))
+PREFETCH_ENDPOINTS = (
+    "api_global_workflow_runs",
+    "api_stage1_repos",
+    "api_stage2_repos",
+    "api_stage3_issues",
+    "api_stage4_prs",
+)
+_prefetch_stop = threading.Event()
+
+
+def _prefetch_loop():
+    """Refresh each prefetched endpoint's cache, then sleep until the next round."""
+    while not _prefetch_stop.is_set():
+        for name in PREFETCH_ENDPOINTS:
+            view = app.view_functions[f"{bp.name}.{name}"]
+            try:
+                with app.test_request_context():
+                    view.refresh()
+            except Exception as e:
+                print(f"[PREFETCH] {name} failed: {e}")
+        _prefetch_stop.wait(PREFETCH_INTERVAL)
+
+
+def start_prefetch():
+    """Start the background prefetch thread. Set _prefetch_stop to end it."""
+    thread = threading.Thread(target=_prefetch_loop, name="cache-prefetch", daemon=True)
+    thread.start()
+    return thread
+
+
 if __name__ == "__main__":
     # Use environment variable to control debug mode (defaults to False for security)
     # Set FLASK_ENV=development to enable debug mode in local development
     debug_mode = os.environ.get("FLASK_ENV") == "development"
+    # With the debug reloader only the child process (WERKZEUG_RUN_MAIN=true)
+    # serves requests; the watching parent must not prefetch too
+    if PREFETCH_ENABLED and (not debug_mode or os.environ.get("WERKZEUG_RUN_MAIN") == "true"):
+        start_prefetch()
     app.run(debug=debug_mode, port=5000)
@@ -2,6 +2,8 @@
 VibeDispatch Configuration Constants
 """
 
+import base64
+
 # VibeCheck workflow template
 VIBECHECK_WORKFLOW = """name: vibeCheck
 on:
@@ -43,3 +45,6 @@ jobs:
           retention-days: 14
           if-no-files-found: ignore
 """
+
+# The bundled workflow is constant; encode it once rather than on every install
+VIBECHECK_WORKFLOW_B64 = base64.b64encode(VIBECHECK_WORKFLOW.encode("utf-8")).decode("ascii")
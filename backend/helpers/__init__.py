@@ -2,13 +2,15 @@
 Helpers package - shared utility functions for route handlers.
 """
 
-from .stage_helpers import is_demo_pr, get_severity_score, check_copilot_completed
-from .oss_helpers import score_issue_fallback, format_upstream_pr_body
+from .stage_helpers import is_demo_pr, get_severity_score, get_label_severity, check_copilot_completed
+from .oss_helpers import score_issue_fallback, normalize_gh_issue, format_upstream_pr_body
 
 __all__ = [
     'is_demo_pr',
     'get_severity_score',
+    'get_label_severity',
     'check_copilot_completed',
     'score_issue_fallback',
+    'normalize_gh_issue',
     'format_upstream_pr_body'
 ]
@@ -7,9 +7,14 @@ or when the request fails.
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
 
 DISCORD_WEBHOOK_URL = os.environ.get("DISCORD_WEBHOOK_URL", "")
 
+# Keep-alive session so bursts of notifications reuse one TLS connection
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
 # Colors for Discord embeds
 COLOR_SUCCESS = 0x2ECC71  # Green
 COLOR_INFO = 0x3498DB     # Blue
@@ -38,7 +43,7 @@ def send_discord_notification(title, description, color=None, fields=None):
         embed["fields"] = fields
 
     try:
-        requests.post(
+        _session.post(
             DISCORD_WEBHOOK_URL,
             json={"embeds": [embed]},
             timeout=5,
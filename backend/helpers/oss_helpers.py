@@ -2,15 +2,70 @@
 OSS helpers — scoring fallback and PR template formatting.
 """
 
+from bisect import bisect_right
 from datetime import datetime, timezone
 
+# Tier lower bounds: <20 skip, 20-39 risky, 40-59 maybe, 60-79 likely, >=80 go
+_TIER_THRESHOLDS = (20, 40, 60, 80)
+_TIERS = ("skip", "risky", "maybe", "likely", "go")
+# Scores are clamped to 0-100, so the tier for every score is precomputed
+_TIER_BY_SCORE = tuple(_TIERS[bisect_right(_TIER_THRESHOLDS, s)] for s in range(101))
 
-def score_issue_fallback(issue):
+
+def _parse_gh_timestamp(value):
+    """Parse a GitHub timestamp into an aware UTC datetime.
+
+    GitHub emits the fixed `YYYY-MM-DDTHH:MM:SSZ` form, which is sliced
+    directly; anything else goes through fromisoformat.
+    """
+    if len(value) == 20 and value[19] == "Z":
+        return datetime(
+            int(value[0:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19]),
+            tzinfo=timezone.utc,
+        )
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _label_name_set(labels):
+    """Lowercased label names as a frozenset, from gh dicts or aggregator strings."""
+    return frozenset(
+        (label.get("name", "") if isinstance(label, dict) else label).lower()
+        for label in labels
+        if isinstance(label, (dict, str))
+    )
+
+
+def normalize_gh_issue(issue):
+    """Flatten a gh CLI issue to the aggregator shape, once at ingest.
+
+    labels and assignees become string lists and comments an int, so the
+    scorer and the response builder read plain values.
+    """
+    comments = issue.get("comments", 0)
+    return {
+        **issue,
+        "labels": [
+            label.get("name", "") if isinstance(label, dict) else label
+            for label in issue.get("labels", [])
+            if isinstance(label, (dict, str))
+        ],
+        "assignees": [
+            a.get("login", "") if isinstance(a, dict) else a
+            for a in issue.get("assignees", [])
+            if isinstance(a, (dict, str))
+        ],
+        "comments": len(comments) if isinstance(comments, list) else comments,
+    }
+
+
+def score_issue_fallback(issue, now=None):
     """Heuristic scoring when aggregator is unavailable.
 
     Args:
         issue: dict from gh issue list --json with keys:
             number, title, labels, createdAt, updatedAt, comments, assignees
+        now: current UTC datetime; pass one in when scoring a batch
 
     Returns:
         dict with cvs (int), cvsTier (str), dataCompleteness (str)
@@ -21,22 +76,21 @@ def score_issue_fallback(issue):
         return {"cvs": 0, "cvsTier": "skip", "dataCompleteness": "partial"}
 
     score = 50  # Base score
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
 
     # Parse updatedAt
     updated_at_str = issue.get("updatedAt") or issue.get("createdAt", "")
     try:
-        updated_at = datetime.fromisoformat(updated_at_str.replace("Z", "+00:00"))
-        days_since_update = (now - updated_at).days
-    except (ValueError, AttributeError):
+        days_since_update = (now - _parse_gh_timestamp(updated_at_str)).days
+    except (ValueError, TypeError, AttributeError):
         days_since_update = 0
 
     # Parse createdAt
     created_at_str = issue.get("createdAt", "")
     try:
-        created_at = datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
-        days_since_creation = (now - created_at).days
-    except (ValueError, AttributeError):
+        days_since_creation = (now - _parse_gh_timestamp(created_at_str)).days
+    except (ValueError, TypeError, AttributeError):
         days_since_creation = 0
 
     # Penalize stale issues (updated > 90 days ago)
@@ -52,13 +106,7 @@ def score_issue_fallback(issue):
 
     # Boost "good first issue" label
     # gh CLI returns [{name: "...", color: "..."}], aggregator returns string[]
-    labels = issue.get("labels", [])
-    label_names = []
-    for label in labels:
-        if isinstance(label, dict):
-            label_names.append(label.get("name", "").lower())
-        elif isinstance(label, str):
-            label_names.append(label.lower())
+    label_names = _label_name_set(issue.get("labels", []))
 
     if "good first issue" in label_names:
         score += 20
@@ -67,16 +115,7 @@ def score_issue_fallback(issue):
     score = max(0, min(100, score))
 
     # Map score to tier
-    if score >= 80:
-        tier = "go"
-    elif score >= 60:
-        tier = "likely"
-    elif score >= 40:
-        tier = "maybe"
-    elif score >= 20:
-        tier = "risky"
-    else:
-        tier = "skip"
+    tier = _TIER_BY_SCORE[score]
 
     return {"cvs": score, "cvsTier": tier, "dataCompleteness": "partial"}
 
@@ -3,53 +3,60 @@ Stage helpers - shared logic for pipeline stage routes.
 """
 
 import json
+import re
 
 try:
-    from ..services import run_gh_command
+    from ..services import run_gh_command, json_io
 except ImportError:
-    from services import run_gh_command
+    from services import run_gh_command, json_io
+
+# Severity labels look like "severity:high"; lower score = more severe
+_SEVERITY_RE = re.compile(r"severity:(critical|high|medium)", re.IGNORECASE)
+_SEVERITY_SCORES = {"critical": 0, "high": 1, "medium": 2}
+# Copilot posts "Completed task"/"Completed work" when it finishes a WIP PR
+_COMPLETED_RE = re.compile(r"completed (?:task|work)", re.IGNORECASE)
 
 
 def is_demo_pr(pr):
     """Check if a PR has the 'demo' label (case-insensitive)."""
-    pr_labels = [label.get("name", "").lower() for label in pr.get("labels", [])]
-    return "demo" in pr_labels
+    return any(label.get("name", "").lower() == "demo" for label in pr.get("labels", []))
+
+
+def get_label_severity(label_names):
+    """Score a list of label names by severity. Lower = more severe."""
+    return min(
+        (_SEVERITY_SCORES[match.lower()] for match in _SEVERITY_RE.findall(";".join(label_names))),
+        default=3,
+    )
 
 
 def get_severity_score(issue):
     """Score an issue by severity label for sorting. Lower = more severe."""
-    labels = [label.get("name", "").lower() for label in issue.get("labels", [])]
-    if any("severity:critical" in label for label in labels):
-        return 0
-    if any("severity:high" in label for label in labels):
-        return 1
-    if any("severity:medium" in label for label in labels):
-        return 2
-    return 3
+    return get_label_severity([label.get("name", "") for label in issue.get("labels", [])])
 
 
-def check_copilot_completed(owner, repo_name, pr_number, pr_title):
+def check_copilot_completed(owner, repo_name, pr_number, pr_title, comments=None):
     """Check if Copilot has completed work on a PR.
 
     Returns True if:
     - Title no longer starts with [WIP]
     - OR a comment contains 'completed task' or 'completed work'
+
+    Pass the PR's already-fetched comments to skip the `gh pr view` lookup.
     """
     if not pr_title.startswith("[WIP]"):
         return True
 
-    result = run_gh_command([
-        "pr", "view", str(pr_number), "-R", f"{owner}/{repo_name}",
-        "--json", "comments"
-    ])
-    if result["success"]:
+    if comments is None:
+        result = run_gh_command([
+            "pr", "view", str(pr_number), "-R", f"{owner}/{repo_name}",
+            "--json", "comments"
+        ])
+        if not result["success"]:
+            return False
         try:
-            data = json.loads(result["output"])
-            comments = data.get("comments", [])
-            for comment in comments:
-                body = (comment.get("body") or "").lower()
-                if "completed task" in body or "completed work" in body:
-                    return True
+            comments = json_io.loads(result["output"]).get("comments", [])
         except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
-            pass
-    return False
+            return False
+
+    return any(_COMPLETED_RE.search(comment.get("body") or "") for comment in comments)
@@ -2,16 +2,14 @@
 Action routes - PR and issue operations (assign, approve, merge, etc.)
 """
 
-import json
-
 from flask import request, jsonify
 
 from . import bp
 
 try:
-    from ..services import run_gh_command, get_workflow_runs
+    from ..services import run_gh_command, get_workflow_runs, merge_pull_request
 except ImportError:
-    from services import run_gh_command, get_workflow_runs
+    from services import run_gh_command, get_workflow_runs, merge_pull_request
 
 
 @bp.route("/api/assign-copilot", methods=["POST"])
@@ -91,33 +89,22 @@ def api_merge_pr():
     if not all([owner, repo, pr_number]):
         return jsonify({"success": False, "error": "Missing required fields"})
 
-    # Check if PR is a draft and mark it as ready first
-    check_result = run_gh_command([
-        "pr", "view", str(pr_number),
-        "-R", f"{owner}/{repo}",
-        "--json", "isDraft"
-    ])
-
-    if check_result["success"]:
-        try:
-            pr_data = json.loads(check_result["output"])
-            if pr_data.get("isDraft", False):
-                ready_result = run_gh_command([
-                    "pr", "ready", str(pr_number),
-                    "-R", f"{owner}/{repo}"
-                ])
-                if not ready_result["success"]:
-                    return jsonify({"success": False, "error": f"Failed to mark PR as ready: {ready_result.get('error')}"})
-        except (json.JSONDecodeError, KeyError, TypeError):
-            pass
-
-    # Merge can take a while, use longer timeout (60s)
-    result = run_gh_command([
-        "pr", "merge", str(pr_number),
-        "-R", f"{owner}/{repo}",
-        "--squash",
-        "--delete-branch"
-    ], timeout=60)
+    result = None
+    if data.get("is_draft") is False:
+        # Caller believes it isn't a draft: skip the lookup, one gh exec
+        result = run_gh_command([
+            "pr", "merge", str(pr_number),
+            "-R", f"{owner}/{repo}",
+            "--squash",
+            "--delete-branch"
+        ], timeout=60)
+        # The caller's PR list can be stale; a PR turned back into a draft
+        # takes the lookup path below instead of failing
+        if not result["success"] and "draft" in result.get("error", "").lower():
+            result = None
+    if result is None:
+        # Draft PRs are marked ready in the same mutation as the merge
+        result = merge_pull_request(owner, repo, pr_number, delete_branch=True)
 
     if result["success"]:
         return jsonify({"success": True, "message": f"PR #{pr_number} merged!"})
@@ -131,7 +118,7 @@ def api_workflow_status():
     owner = data.get("owner")
     repo = data.get("repo")
 
-    runs = get_workflow_runs(owner, repo, "vibeCheck")
+    runs = get_workflow_runs(owner, repo, "vibecheck.yml")
     if runs:
         return jsonify({"success": True, "run": runs[0]})
     return jsonify({"success": False, "error": "No workflow runs found"})
@@ -4,31 +4,50 @@ OSS routes — all endpoints for the OSS contribution pipeline (Stages 1-5).
 
 import json
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 
-from flask import request, jsonify
+from flask import request, jsonify, Response, stream_with_context
 
 from . import bp
 
 try:
-    from ..services import run_gh_command, get_authenticated_user, OSSService, cached_endpoint, clear_cache
+    from ..services import (
+        run_gh_command, stream_gh_command, get_authenticated_user, merge_pull_request,
+        batch_open_prs, batch_repo_metadata, batch_repo_issues, batch_pr_states,
+        OSSService, cached_endpoint, clear_cache, json_io,
+    )
     from ..services.oss_service import _call_aggregator
-    from ..helpers.oss_helpers import format_upstream_pr_body, score_issue_fallback
+    from ..helpers.oss_helpers import format_upstream_pr_body, normalize_gh_issue, score_issue_fallback
     from ..helpers.notifications import (
         notify_go_tier_issue, notify_pr_ready_for_review,
         notify_upstream_merged, notify_upstream_feedback,
     )
 except ImportError:
-    from services import run_gh_command, get_authenticated_user, OSSService, cached_endpoint, clear_cache
+    from services import (
+        run_gh_command, stream_gh_command, get_authenticated_user, merge_pull_request,
+        batch_open_prs, batch_repo_metadata, batch_repo_issues, batch_pr_states,
+        OSSService, cached_endpoint, clear_cache, json_io,
+    )
     from services.oss_service import _call_aggregator
-    from helpers.oss_helpers import format_upstream_pr_body, score_issue_fallback
+    from helpers.oss_helpers import format_upstream_pr_body, normalize_gh_issue, score_issue_fallback
     from helpers.notifications import (
         notify_go_tier_issue, notify_pr_ready_for_review,
         notify_upstream_merged, notify_upstream_feedback,
     )
 
-# Track GO-tier issue IDs already notified (avoid re-firing on cache refresh)
-_notified_go_issues = set()
+# Track GO-tier issue IDs already notified (avoid re-firing on cache refresh or restart).
+# Oldest-first and capped; seeded from the OSS tracking file on first use.
+NOTIFIED_GO_CAP = 10_000
+_notified_go_issues = OrderedDict()
+_notified_go_lock = threading.Lock()
+_notified_go_loaded = False
+
+# Long-lived pool for the per-repo gh fallbacks, so dashboard polling doesn't spawn threads per request
+_GH_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="gh")
 
 
 # ============ Stage 1: Target Repos ============
@@ -45,7 +64,7 @@ def _enrich_target_via_gh(entry):
     ])
     if result["success"]:
         try:
-            meta = json.loads(result["output"])
+            meta = json_io.loads(result["output"])
             target["meta"] = meta
         except (json.JSONDecodeError, KeyError):
             pass
@@ -86,15 +105,21 @@ def api_oss_stage1_targets():
     local_watchlist = svc.get_local_watchlist()
     targets = []
 
-    if local_watchlist:
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(_enrich_target_via_gh, entry) for entry in local_watchlist]
-            for future in as_completed(futures):
-                try:
-                    targets.append(future.result())
-                except Exception:
-                    pass
+    if not local_watchlist:
+        return {"success": True, "targets": targets, "owner": my_user}
+
+    # One aliased GraphQL query for the whole watchlist; per-repo gh calls if it fails
+    metas = batch_repo_metadata((entry["owner"], entry["repo"]) for entry in local_watchlist)
+    if metas is not None:
+        for entry in local_watchlist:
+            target = {"slug": entry["slug"]}
+            meta = metas.get((entry["owner"], entry["repo"]))
+            if meta:
+                target["meta"] = meta
+            targets.append(target)
+        return {"success": True, "targets": targets, "owner": my_user}
 
+    targets = list(_GH_POOL.map(_enrich_target_via_gh, local_watchlist))
     return {"success": True, "targets": targets, "owner": my_user}
 
 
@@ -210,48 +235,52 @@ def _fetch_repo_issues_fallback(entry):
         "--label", "good first issue",
         "--state", "open",
         "--limit", "30",
-        "--json", "number,title,url,labels,createdAt,updatedAt,comments,assignees"
+        "--json", "number,title,url,labels,createdAt,updatedAt,comments,assignees",
+        # Flatten in gh: label names, assignee logins and a comment count instead of full objects
+        "--jq", "[.[] | .labels |= map(.name) | .assignees |= map(.login) | .comments |= length]",
     ])
     if not result["success"]:
         return []
 
     try:
-        issues = json.loads(result["output"])
+        issues = json_io.loads(result["output"])
     except (json.JSONDecodeError, KeyError):
         return []
 
+    try:
+        return _score_repo_issues(owner, repo, issues, datetime.now(timezone.utc))
+    except (KeyError, TypeError, AttributeError):
+        return []
+
+
+def _claim_go_notification(issue_id):
+    """Record a GO-tier issue as notified. Returns False if it already was."""
+    global _notified_go_loaded
+    with _notified_go_lock:
+        if not _notified_go_loaded:
+            _notified_go_issues.update(dict.fromkeys(OSSService().get_notified_go_issues()))
+            _notified_go_loaded = True
+        if issue_id in _notified_go_issues:
+            return False
+        _notified_go_issues[issue_id] = None
+        while len(_notified_go_issues) > NOTIFIED_GO_CAP:
+            _notified_go_issues.popitem(last=False)
+        OSSService().save_notified_go_issues(list(_notified_go_issues))
+    return True
+
+
+def _score_repo_issues(owner, repo, issues, now):
+    """Score one repo's gh-shaped issues, dropping skip-tier ones."""
     scored = []
-    for issue in issues:
-        score_data = score_issue_fallback(issue)
+    for issue in map(normalize_gh_issue, issues):
+        score_data = score_issue_fallback(issue, now)
         if score_data["cvsTier"] == "skip":
             continue
 
-        # Normalize labels to string[]
-        labels = []
-        for label in issue.get("labels", []):
-            if isinstance(label, dict):
-                labels.append(label.get("name", ""))
-            elif isinstance(label, str):
-                labels.append(label)
-
-        # Normalize assignees to string[]
-        assignees = []
-        for a in issue.get("assignees", []):
-            if isinstance(a, dict):
-                assignees.append(a.get("login", ""))
-            elif isinstance(a, str):
-                assignees.append(a)
-
-        # Normalize comments to count
-        comments = issue.get("comments", 0)
-        if isinstance(comments, list):
-            comments = len(comments)
-
         issue_id = f"github-{owner}-{repo}-{issue['number']}"
 
         # Notify on GO-tier issues (only once per issue)
-        if score_data["cvs"] >= 85 and issue_id not in _notified_go_issues:
-            _notified_go_issues.add(issue_id)
+        if score_data["cvs"] >= 85 and _claim_go_notification(issue_id):
             notify_go_tier_issue(
                 f"{owner}/{repo}", issue["number"],
                 issue["title"], score_data["cvs"],
@@ -267,9 +296,9 @@ def _fetch_repo_issues_fallback(entry):
             "cvsTier": score_data["cvsTier"],
             "lifecycleStage": "unknown",
             "complexity": "unknown",
-            "labels": labels,
-            "commentCount": comments,
-            "assignees": assignees,
+            "labels": issue["labels"],
+            "commentCount": issue["comments"],
+            "assignees": issue["assignees"],
             "claimStatus": "unclaimed",
             "createdAt": issue.get("createdAt", ""),
             "dataCompleteness": "partial",
@@ -301,16 +330,20 @@ def api_oss_stage2_issues():
         return {"success": True, "issues": [], "owner": my_user}
 
     all_issues = []
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        futures = [executor.submit(_fetch_repo_issues_fallback, entry) for entry in local_watchlist]
-        for future in as_completed(futures):
-            try:
-                all_issues.extend(future.result())
-            except Exception:
-                pass
+    # One aliased GraphQL query for the whole watchlist; per-repo gh calls if it fails
+    batched = batch_repo_issues(
+        ((entry["owner"], entry["repo"]) for entry in local_watchlist), "good first issue",
+    )
+    if batched is not None:
+        now = datetime.now(timezone.utc)
+        for (owner, repo), issues in batched.items():
+            all_issues.extend(_score_repo_issues(owner, repo, issues, now))
+    else:
+        for issues in _GH_POOL.map(_fetch_repo_issues_fallback, local_watchlist):
+            all_issues.extend(issues)
 
     # Sort by CVS score descending
-    all_issues.sort(key=lambda x: x["cvs"], reverse=True)
+    all_issues.sort(key=itemgetter("cvs"), reverse=True)
 
     return {"success": True, "issues": all_issues, "owner": my_user}
 
@@ -321,7 +354,7 @@ def api_oss_dossier(slug):
     my_user = get_authenticated_user()
     svc = OSSService()
     dossier = svc.get_dossier(slug)
-    return jsonify({"success": True, "dossier": dossier, "owner": my_user})
+    return json_io.json_response({"success": True, "dossier": dossier, "owner": my_user})
 
 
 # ============ Stage 3: Fork & Assign ============
@@ -417,7 +450,7 @@ def api_oss_fork_and_assign():
             })
 
     # 2. Wait for fork to be ready
-    if not svc.wait_for_fork(my_user, repo, timeout=60, interval=3):
+    if not svc.wait_for_fork(my_user, repo, timeout=60):
         return jsonify({
             "success": False,
             "error": "Fork creation timed out",
@@ -459,9 +492,9 @@ def api_oss_fork_and_assign():
     # 7. Track locally
     svc.save_assignment(origin_owner, repo, issue_number, fork_issue_number, fork_issue_url)
 
-    # 8. Report claim to aggregator (best-effort)
+    # 8. Report claim to aggregator (best-effort, in the background)
     issue_id = f"github-{origin_owner}-{repo}-{issue_number}"
-    svc.report_claim(origin_slug, issue_id, my_user, fork_issue_url)
+    svc.queue_claim_report(origin_slug, issue_id, my_user, fork_issue_url)
 
     return jsonify({
         "success": True,
@@ -473,14 +506,14 @@ def api_oss_fork_and_assign():
 # ============ Stage 4: Review on Fork ============
 
 def _get_fork_prs(my_user, repo, origin_slug):
-    """Fetch PRs from a single forked repo. Used by ThreadPoolExecutor."""
+    """Fetch PRs from a single forked repo. Runs on _GH_POOL."""
     result = run_gh_command([
         "pr", "list", "-R", f"{my_user}/{repo}",
         "--json", "number,title,url,headRefName,additions,deletions,changedFiles,reviewDecision,isDraft,createdAt"
     ])
     if result["success"]:
         try:
-            prs = json.loads(result["output"])
+            prs = json_io.loads(result["output"])
             for pr in prs:
                 pr["repo"] = repo
                 pr["originSlug"] = origin_slug
@@ -496,25 +529,27 @@ def api_oss_stage4_fork_prs():
     my_user = get_authenticated_user()
     svc = OSSService()
 
-    assignments = svc.get_assigned_issues()
-    forked_repos = {(a["origin_slug"], a["repo"]) for a in assignments}
+    forked_repos = svc.get_active_fork_repos()
 
     all_prs = []
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        futures = [
-            executor.submit(_get_fork_prs, my_user, repo, origin_slug)
-            for origin_slug, repo in forked_repos
-        ]
-        for future in as_completed(futures):
-            all_prs.extend(future.result())
+    # One GraphQL query covers every fork; fan out per fork only if it fails
+    batch = batch_open_prs(my_user, {repo for _, repo in forked_repos})
+
+    if batch is not None:
+        for origin_slug, repo in forked_repos:
+            for pr in batch.get(repo, []):
+                all_prs.append({**pr, "repo": repo, "originSlug": origin_slug})
+    else:
+        for prs in _GH_POOL.map(lambda ref: _get_fork_prs(my_user, ref[1], ref[0]), forked_repos):
+            all_prs.extend(prs)
 
     all_prs.sort(key=lambda x: x.get("createdAt", ""), reverse=True)
-    return jsonify({"success": True, "prs": all_prs, "owner": my_user})
+    return json_io.json_response({"success": True, "prs": all_prs, "owner": my_user})
 
 
 @bp.route("/api/oss/fork-pr-details", methods=["POST"])
 def api_oss_fork_pr_details():
-    """Get detailed info about a PR on a fork, including diff."""
+    """Get detailed info about a PR on a fork. The diff is served by /api/oss/fork-pr-diff."""
     data = request.json
     repo = data.get("repo")
     pr_number = data.get("pr_number")
@@ -530,15 +565,8 @@ def api_oss_fork_pr_details():
     ])
 
     if result["success"]:
-        pr_data = json.loads(result["output"])
-
-        diff_result = run_gh_command([
-            "pr", "diff", str(pr_number), "-R", f"{my_user}/{repo}"
-        ])
-        if diff_result["success"]:
-            pr_data["diff"] = diff_result["output"]
-
-        return jsonify({"success": True, "pr": pr_data, "owner": my_user})
+        pr_data = json_io.loads(result["output"])
+        return json_io.json_response({"success": True, "pr": pr_data, "owner": my_user})
 
     return jsonify({
         "success": False,
@@ -547,6 +575,20 @@ def api_oss_fork_pr_details():
     })
 
 
+@bp.route("/api/oss/fork-pr-diff", methods=["GET"])
+def api_oss_fork_pr_diff():
+    """Stream the diff of a PR on a fork as plain text, straight from `gh pr diff`."""
+    repo = request.args.get("repo")
+    pr_number = request.args.get("pr")
+
+    if not repo or not pr_number:
+        return jsonify({"success": False, "error": "Missing required fields"}), 400
+
+    my_user = get_authenticated_user()
+    chunks = stream_gh_command(["pr", "diff", str(pr_number), "-R", f"{my_user}/{repo}"])
+    return Response(stream_with_context(chunks), mimetype="text/plain")
+
+
 @bp.route("/api/oss/approve-fork-pr", methods=["POST"])
 def api_oss_approve_fork_pr():
     """Approve a PR on a fork."""
@@ -593,42 +635,11 @@ def api_oss_merge_fork_pr():
     my_user = get_authenticated_user()
     svc = OSSService()
 
-    # Capture branch name before merge (can't read it after)
-    pr_info = run_gh_command([
-        "pr", "view", str(pr_number), "-R", f"{my_user}/{repo}",
-        "--json", "headRefName,title,baseRefName"
-    ])
-    pr_data = {}
-    if pr_info["success"]:
-        try:
-            pr_data = json.loads(pr_info["output"])
-        except (json.JSONDecodeError, KeyError):
-            pass
-
-    # Check if PR is a draft and mark it as ready first
-    check_result = run_gh_command([
-        "pr", "view", str(pr_number), "-R", f"{my_user}/{repo}",
-        "--json", "isDraft"
-    ])
-    if check_result["success"]:
-        try:
-            draft_data = json.loads(check_result["output"])
-            if draft_data.get("isDraft", False):
-                run_gh_command([
-                    "pr", "ready", str(pr_number),
-                    "-R", f"{my_user}/{repo}"
-                ])
-        except (json.JSONDecodeError, KeyError):
-            pass
-
-    # Merge on fork
-    result = run_gh_command([
-        "pr", "merge", str(pr_number),
-        "-R", f"{my_user}/{repo}",
-        "--squash"
-    ], timeout=60)
+    # One lookup (draft state + branch info, unreadable after the merge) and one mutation
+    result = merge_pull_request(my_user, repo, pr_number)
 
     if result["success"]:
+        pr_data = result["pr"]
         # Move to Stage 5: ready to submit
         svc.save_ready_to_submit(
             origin_slug=origin_slug,
@@ -654,7 +665,7 @@ def api_oss_stage5_submit():
     my_user = get_authenticated_user()
     svc = OSSService()
     items = svc.get_ready_to_submit()
-    return jsonify({"success": True, "ready": items, "owner": my_user})
+    return json_io.json_response({"success": True, "ready": items, "owner": my_user})
 
 
 @bp.route("/api/oss/submit-to-origin", methods=["POST"])
@@ -710,42 +721,31 @@ def api_oss_stage5_tracking():
     my_user = get_authenticated_user()
     svc = OSSService()
     items = svc.get_submitted_prs()
-    return jsonify({"success": True, "submitted": items, "owner": my_user})
-
-
-def _poll_single_pr(pr):
-    """Poll a single submitted PR for status changes. Returns updated entry."""
-    if pr.get("state") != "open":
-        return pr  # Already in terminal state
+    return json_io.json_response({"success": True, "submitted": items, "owner": my_user})
 
-    pr_url = pr.get("pr_url", "")
-    # Parse URL: https://github.com/{owner}/{repo}/pull/{number}
-    try:
-        parts = pr_url.rstrip("/").split("/")
-        pr_number = parts[-1]
-        repo_owner = parts[-4]
-        repo_name = parts[-3]
-    except (IndexError, ValueError):
-        return pr
 
-    result = run_gh_command([
-        "pr", "view", pr_number, "-R", f"{repo_owner}/{repo_name}",
-        "--json", "state,reviewDecision,mergedAt,closedAt"
-    ])
+def _pr_ref(pr):
+    """Return (owner, repo, number) for a tracked PR, or None if it can't be addressed.
 
-    if not result["success"]:
-        return pr
+    Entries saved since repo_owner/repo_name were recorded are read directly;
+    older ones fall back to splitting https://github.com/{owner}/{repo}/pull/{number}.
+    """
+    if pr.get("repo_owner") and pr.get("repo_name") and pr.get("pr_number"):
+        return pr["repo_owner"], pr["repo_name"], pr["pr_number"]
+    parts = pr.get("pr_url", "").rstrip("/").split("/")
+    if len(parts) < 4 or not parts[-1].isdigit():
+        return None
+    return parts[-4], parts[-3], int(parts[-1])
 
-    try:
-        gh_data = json.loads(result["output"])
-    except (json.JSONDecodeError, KeyError):
-        return pr
 
+def _apply_pr_status(pr, gh_data):
+    """Copy gh PR state onto a tracked entry and notify on changes. Returns the entry."""
+    pr_url = pr.get("pr_url", "")
     old_state = pr.get("state")
     old_review = pr.get("review_decision")
 
     # Map gh CLI state to our format
-    new_state = gh_data.get("state", "OPEN").upper()
+    new_state = (gh_data.get("state") or "OPEN").upper()
     if new_state == "MERGED":
         pr["state"] = "merged"
     elif new_state == "CLOSED":
@@ -770,6 +770,53 @@ def _poll_single_pr(pr):
     return pr
 
 
+def _poll_single_pr(pr):
+    """Poll a single submitted PR for status changes. Returns updated entry."""
+    if pr.get("state") != "open":
+        return pr  # Already in terminal state
+
+    ref = _pr_ref(pr)
+    if ref is None:
+        return pr
+    repo_owner, repo_name, pr_number = ref
+
+    # Project the four fields to one TSV line in gh so there's no JSON to parse
+    result = run_gh_command([
+        "pr", "view", str(pr_number), "-R", f"{repo_owner}/{repo_name}",
+        "--json", "state,reviewDecision,mergedAt,closedAt",
+        "--jq", "[.state, .reviewDecision, .mergedAt, .closedAt] | @tsv",
+    ])
+
+    if not result["success"]:
+        return pr
+
+    fields = result["output"].rstrip("\n").split("\t")
+    if len(fields) != 4:
+        return pr
+    # @tsv renders null as an empty field
+    gh_data = dict(zip(("state", "reviewDecision", "mergedAt", "closedAt"), (f or None for f in fields)))
+    return _apply_pr_status(pr, gh_data)
+
+
+def _poll_open_prs_batch(open_prs):
+    """Poll open PRs with one GraphQL query. Returns updated entries, or None if it failed."""
+    refs = {}
+    for pr in open_prs:
+        ref = _pr_ref(pr)
+        if ref:
+            refs[id(pr)] = ref
+
+    states = batch_pr_states(set(refs.values()))
+    if states is None:
+        return None
+
+    updated = []
+    for pr in open_prs:
+        gh_data = states.get(refs.get(id(pr)))
+        updated.append(_apply_pr_status(pr, gh_data) if gh_data else pr)
+    return updated
+
+
 @bp.route("/api/oss/poll-submitted-prs", methods=["POST"])
 def api_oss_poll_submitted_prs():
     """Poll all submitted PRs for status changes and update tracking."""
@@ -780,20 +827,15 @@ def api_oss_poll_submitted_prs():
     if not items:
         return jsonify({"success": True, "submitted": [], "owner": my_user})
 
-    # Poll open PRs in parallel
     open_prs = [pr for pr in items if pr.get("state") == "open"]
     closed_prs = [pr for pr in items if pr.get("state") != "open"]
 
     if open_prs:
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(_poll_single_pr, pr) for pr in open_prs]
-            updated_open = []
-            for future in as_completed(futures):
-                try:
-                    updated_open.append(future.result())
-                except Exception:
-                    pass
-            items = updated_open + closed_prs
+        # One GraphQL query for every open PR; poll each via gh in parallel if it fails
+        updated_open = _poll_open_prs_batch(open_prs)
+        if updated_open is None:
+            updated_open = list(_GH_POOL.map(_poll_single_pr, open_prs))
+        items = updated_open + closed_prs
 
     svc.update_submitted_prs(items)
-    return jsonify({"success": True, "submitted": items, "owner": my_user})
+    return json_io.json_response({"success": True, "submitted": items, "owner": my_user})
@@ -2,66 +2,79 @@
 Pipeline routes - stage-based APIs and cache/monitoring endpoints.
 """
 
-import json
+import heapq
 import time
+from operator import itemgetter
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from flask import request, jsonify
+from flask import request, jsonify, Response, stream_with_context
 
 from . import bp
 
 try:
     from ..services import (
         run_gh_command,
+        stream_gh_command,
+        get_authenticated_user,
+        get_repos,
         get_repo_context,
         get_repo_issues,
-        get_repo_prs,
+        get_repo_prs_cached,
         get_workflow_runs,
+        count_commits_since,
+        batch_repo_query,
+        batch_commit_counts,
+        batch_pr_comments,
         clear_vibecheck_cache,
         clear_cache,
         get_cache_stats,
+        get_cached,
+        set_cached,
         cached_endpoint,
+        fill_lock,
+        json_io,
     )
-    from ..helpers.stage_helpers import is_demo_pr, get_severity_score, check_copilot_completed
+    from ..helpers.stage_helpers import is_demo_pr, get_label_severity, check_copilot_completed
 except ImportError:
     from services import (
         run_gh_command,
+        stream_gh_command,
+        get_authenticated_user,
+        get_repos,
         get_repo_context,
         get_repo_issues,
-        get_repo_prs,
+        get_repo_prs_cached,
         get_workflow_runs,
+        count_commits_since,
+        batch_repo_query,
+        batch_commit_counts,
+        batch_pr_comments,
         clear_vibecheck_cache,
         clear_cache,
         get_cache_stats,
+        get_cached,
+        set_cached,
         cached_endpoint,
+        fill_lock,
+        json_io,
     )
-    from helpers.stage_helpers import is_demo_pr, get_severity_score, check_copilot_completed
+    from helpers.stage_helpers import is_demo_pr, get_label_severity, check_copilot_completed
 
+# Long-lived pool for the per-repo fan-outs, so dashboard polling doesn't spawn threads per request
+_GH_POOL = ThreadPoolExecutor(max_workers=10, thread_name_prefix="pipeline-gh")
 
-# --- Module-level helpers for ThreadPoolExecutor usage ---
 
-def _get_repo_run_info(owner, repo):
-    """Get run info for a repo (used by stage2). Extracted for executor clarity."""
-    repo_name = repo["name"]
-    runs = get_workflow_runs(owner, repo_name, "vibeCheck")
-    last_run = runs[0] if runs else None
-
-    commits_since = 0
-    if last_run:
-        last_run_date = last_run.get("createdAt", "")
-        if last_run_date:
-            commit_result = run_gh_command([
-                "api", f"/repos/{owner}/{repo_name}/commits",
-                "--jq", f'[.[] | select(.commit.author.date > "{last_run_date}")] | length'
-            ])
-            if commit_result["success"]:
-                try:
-                    commits_since = int(commit_result["output"].strip())
-                except (ValueError, AttributeError, TypeError):
-                    commits_since = 0
+# --- Module-level helpers for _GH_POOL usage ---
+
+def _get_last_vibecheck_run(owner, repo):
+    """Return the most recent vibecheck run for a repo, or None."""
+    runs = get_workflow_runs(owner, repo["name"], "vibecheck.yml")
+    return runs[0] if runs else None
+
 
+def _stage2_repo_info(repo, last_run, commits_since):
     return {
-        "name": repo_name,
+        "name": repo["name"],
         "description": repo.get("description", ""),
         "isPrivate": repo.get("isPrivate", False),
         "lastRun": last_run,
@@ -72,16 +85,21 @@ def _get_repo_run_info(owner, repo):
 def _get_repo_prs_with_info(owner, repo):
     """Get filtered PRs with copilot completion status (used by stage4)."""
     repo_name = repo["name"]
-    prs = get_repo_prs(owner, repo_name)
+    return _filter_prs_with_info(owner, repo_name, get_repo_prs_cached(owner, repo_name))
+
+
+def _filter_prs_with_info(owner, repo_name, prs):
+    """Drop demo PRs and tag the rest with repo + copilot completion status."""
     filtered_prs = []
     for pr in prs:
         if is_demo_pr(pr):
             continue
         pr["repo"] = repo_name
-        author = pr.get("author", {}).get("login", "").lower() if pr.get("author") else ""
-        if "copilot" in author:
+        # Comments are only needed for the completion check; keep them out of the response
+        comments = pr.pop("comments", None)
+        if _is_copilot_pr(pr):
             pr["copilotCompleted"] = check_copilot_completed(
-                owner, repo_name, pr.get("number"), pr.get("title", "")
+                owner, repo_name, pr.get("number"), pr.get("title", ""), comments
             )
         else:
             pr["copilotCompleted"] = None
@@ -89,6 +107,41 @@ def _get_repo_prs_with_info(owner, repo):
     return filtered_prs
 
 
+def _is_copilot_pr(pr):
+    """Check whether a PR was authored by Copilot."""
+    author = pr.get("author") or {}
+    return "copilot" in (author.get("login") or "").lower()
+
+
+def _attach_wip_comments(owner, batch):
+    """Fetch comments for every Copilot [WIP] PR in a batch result in one query.
+
+    The comments are stored on each PR so check_copilot_completed can skip its
+    per-PR `gh pr view`. On failure the PRs are left as-is and take that path.
+    """
+    wip_prs = {
+        (repo_name, pr.get("number")): pr
+        for repo_name, repo_data in batch.items()
+        for pr in repo_data["prs"]
+        if _is_copilot_pr(pr) and pr.get("title", "").startswith("[WIP]") and not is_demo_pr(pr)
+    }
+    comments = batch_pr_comments(owner, wip_prs)
+    if comments:
+        for ref, pr_comments in comments.items():
+            wip_prs[ref]["comments"] = pr_comments
+
+
+def _has_copilot_pr(prs):
+    """Check whether any non-demo PR in the list was authored by Copilot."""
+    # The author check is one lookup; the label scan only runs for Copilot PRs
+    return any(_is_copilot_pr(pr) and not is_demo_pr(pr) for pr in prs)
+
+
+def _has_copilot_assignee(issue):
+    """Check whether any of an issue's assignees is Copilot."""
+    return any("copilot" in (a.get("login") or "").lower() for a in issue.get("assignees") or ())
+
+
 # --- Cache/Monitoring routes ---
 
 @bp.route("/api/global-workflow-runs", methods=["GET"])
@@ -120,18 +173,17 @@ def api_global_workflow_runs():
                 result.append(run)
         return result
 
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = [executor.submit(fetch_runs_for_repo, r) for r in repos[:15]]
-        for future in as_completed(futures):
-            all_runs.extend(future.result())
+    for runs in _GH_POOL.map(fetch_runs_for_repo, repos[:15]):
+        all_runs.extend(runs)
 
     print(f"[PERF] Fetched workflow runs in {time.time() - start:.2f}s")
 
-    all_runs.sort(key=lambda x: x.get("createdAt", ""), reverse=True)
+    # Only the 50 newest are returned; select them without sorting the rest
+    latest_runs = heapq.nlargest(50, all_runs, key=lambda x: x.get("createdAt") or "")
 
     print(f"[PERF] Total global-workflow-runs: {time.time() - start_total:.2f}s")
 
-    return {"success": True, "runs": all_runs[:50], "owner": owner}
+    return {"success": True, "runs": latest_runs, "owner": owner}
 
 
 @bp.route("/api/clear-cache", methods=["POST"])
@@ -174,19 +226,97 @@ def api_stage2_repos():
 
     vc_repos = [r for r in repos if status_dict.get(r["name"], False)]
 
-    result = []
+    last_runs = list(_GH_POOL.map(lambda r: _get_last_vibecheck_run(owner, r), vc_repos))
+    counts = _stage2_commit_counts(owner, zip(vc_repos, last_runs))
 
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = [executor.submit(_get_repo_run_info, owner, r) for r in vc_repos[:20]]
-        for future in as_completed(futures):
-            result.append(future.result())
+    result = [
+        _stage2_repo_info(r, run, counts.get(r["name"], 0))
+        for r, run in zip(vc_repos, last_runs)
+    ]
 
-    result.sort(key=lambda x: (x["lastRun"] is None, -x["commitsSinceLastRun"]), reverse=True)
+    _sort_stage2_repos(result)
 
     print(f"[PERF] stage2-repos: {time.time() - start:.2f}s")
     return {"success": True, "repos": result, "owner": owner}
 
 
+def _stage2_commit_counts(owner, repos_with_runs):
+    """Count commits since each repo's last run, given (repo, last_run) pairs.
+
+    Counts for every repo with a run come back from batched GraphQL queries;
+    repos those couldn't resolve are counted one by one.
+    """
+    since_by_repo = {
+        r["name"]: run["createdAt"]
+        for r, run in repos_with_runs
+        if run and run.get("createdAt")
+    }
+    counts = batch_commit_counts(owner, since_by_repo) or {}
+    missing = [name for name in since_by_repo if name not in counts]
+    if missing:
+        fallback = _GH_POOL.map(lambda name: count_commits_since(owner, name, since_by_repo[name]), missing)
+        counts.update(zip(missing, fallback))
+    return counts
+
+
+def _sort_stage2_repos(repos):
+    """Order stage2 repos in place: never-run repos first, then fewest commits since last run."""
+    repos.sort(key=lambda x: (x["lastRun"] is None, -x["commitsSinceLastRun"]), reverse=True)
+
+
+@bp.route("/api/stage2-repos/stream", methods=["GET"])
+def api_stage2_repos_stream():
+    """Stream stage2 repos as NDJSON, one line per repo as soon as it resolves.
+
+    The first line is {"owner": ...}. A warm stage2-repos cache is replayed
+    as-is. Otherwise each repo line arrives as its last run resolves, with
+    commitsSinceLastRun 0, and a final {"commitCounts": {name: n}} line fills
+    the counts from one batched lookup (clients patch them in and sort). Cold
+    fills take the stage2-repos fill lock, so concurrent loads fan out once,
+    and the assembled result warms the cache.
+    """
+    def replay(cached):
+        yield json_io.dumps({"owner": cached.get("owner")}) + b"\n"
+        for repo_info in cached.get("repos", []):
+            yield json_io.dumps(repo_info) + b"\n"
+
+    cached = get_cached("stage2-repos")
+    if cached:
+        return Response(replay(cached), mimetype="application/x-ndjson")
+
+    def generate():
+        with fill_lock("stage2-repos"):
+            # Another request may have filled the cache while this one waited
+            cached = get_cached("stage2-repos")
+            if cached:
+                yield from replay(cached)
+                return
+
+            owner, repos, status_dict = get_repo_context()
+            vc_repos = [r for r in repos if status_dict.get(r["name"], False)]
+            yield json_io.dumps({"owner": owner}) + b"\n"
+
+            result = []
+            last_runs = []
+            futures = {_GH_POOL.submit(_get_last_vibecheck_run, owner, r): r for r in vc_repos}
+            for future in as_completed(futures):
+                repo, last_run = futures[future], future.result()
+                last_runs.append((repo, last_run))
+                repo_info = _stage2_repo_info(repo, last_run, 0)
+                result.append(repo_info)
+                yield json_io.dumps(repo_info) + b"\n"
+
+            counts = _stage2_commit_counts(owner, last_runs)
+            for repo_info in result:
+                repo_info["commitsSinceLastRun"] = counts.get(repo_info["name"], 0)
+            yield json_io.dumps({"commitCounts": counts}) + b"\n"
+
+            _sort_stage2_repos(result)
+            set_cached("stage2-repos", {"success": True, "repos": result, "owner": owner})
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
 @bp.route("/api/stage3-issues", methods=["GET"])
 @cached_endpoint("stage3-issues")
 def api_stage3_issues():
@@ -198,60 +328,54 @@ def api_stage3_issues():
 
     all_issues = []
     repos_with_copilot_prs = set()
-
-    def fetch_repo_issues(repo):
-        repo_name = repo["name"]
-        issues = get_repo_issues(owner, repo_name, labels="vibeCheck")
-        for issue in issues:
-            issue["repo"] = repo_name
-        return issues
-
-    def check_copilot_prs(repo):
-        repo_name = repo["name"]
-        prs = get_repo_prs(owner, repo_name)
-        for pr in prs:
-            if is_demo_pr(pr):
-                continue
-            author = pr.get("author", {})
-            if author and "copilot" in author.get("login", "").lower():
-                return repo_name
-        return None
-
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        issue_futures = [executor.submit(fetch_repo_issues, r) for r in vc_repos[:15]]
-        pr_futures = [executor.submit(check_copilot_prs, r) for r in vc_repos[:15]]
-
-        for future in as_completed(issue_futures):
-            all_issues.extend(future.result())
-
-        for future in as_completed(pr_futures):
-            result = future.result()
-            if result:
-                repos_with_copilot_prs.add(result)
-
-    # Filter out issues assigned to Copilot
-    def has_copilot_assigned(issue):
-        for assignee in issue.get("assignees", []):
-            if "copilot" in assignee.get("login", "").lower():
-                return True
-        return False
-
-    all_issues = [i for i in all_issues if not has_copilot_assigned(i)]
-
-    # Extract unique labels
+    target_repos = vc_repos
+
+    # One GraphQL round trip for every repo; per-repo fan-out only if it fails
+    batch = batch_repo_query(owner, [r["name"] for r in target_repos])
+
+    if batch is not None:
+        for repo_name, repo_data in batch.items():
+            for issue in repo_data["issues"]:
+                issue["repo"] = repo_name
+                all_issues.append(issue)
+            if _has_copilot_pr(repo_data["prs"]):
+                repos_with_copilot_prs.add(repo_name)
+    else:
+        def fetch_repo_issues(repo):
+            """Return (issues, has_copilot_pr) for one repo."""
+            repo_name = repo["name"]
+            issues = get_repo_issues(owner, repo_name, labels="vibeCheck")
+            for issue in issues:
+                issue["repo"] = repo_name
+            # The Copilot check reads only the author and demo label
+            prs = get_repo_prs_cached(owner, repo_name, fields=("number", "author", "labels"))
+            return issues, _has_copilot_pr(prs)
+
+        results = _GH_POOL.map(fetch_repo_issues, target_repos)
+        for repo, (issues, has_copilot_pr) in zip(target_repos, results):
+            all_issues.extend(issues)
+            if has_copilot_pr:
+                repos_with_copilot_prs.add(repo["name"])
+
+    # One pass per issue: drop Copilot-assigned ones, collect label names, score severity
     label_set = set()
+    scored = []
     for issue in all_issues:
-        for label in issue.get("labels", []):
-            label_set.add(label.get("name", ""))
+        if _has_copilot_assignee(issue):
+            continue
+        names = [label.get("name", "") for label in issue.get("labels", [])]
+        label_set.update(names)
+        scored.append((get_label_severity(names), issue))
 
-    # Sort by severity
-    all_issues.sort(key=lambda i: get_severity_score(i))
+    # Sort by severity (stable, so ties keep fetch order)
+    scored.sort(key=itemgetter(0))
+    all_issues = [issue for _, issue in scored]
 
     print(f"[PERF] stage3-issues: {time.time() - start:.2f}s")
     return {
         "success": True,
         "issues": all_issues,
-        "labels": sorted(list(label_set)),
+        "labels": sorted(label_set),
         "repos_with_copilot_prs": list(repos_with_copilot_prs),
         "owner": owner
     }
@@ -262,14 +386,21 @@ def api_stage3_issues():
 def api_stage4_prs():
     """Get open PRs across repos for review."""
     start = time.time()
-    owner, repos, _ = get_repo_context()
+    # Stage4 doesn't need vibecheck status, so skip get_repo_context's probe
+    owner = get_authenticated_user()
+    target_repos = get_repos()
 
     all_prs = []
 
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = [executor.submit(_get_repo_prs_with_info, owner, r) for r in repos[:20]]
-        for future in as_completed(futures):
-            all_prs.extend(future.result())
+    batch = batch_repo_query(owner, [r["name"] for r in target_repos])
+
+    if batch is not None:
+        _attach_wip_comments(owner, batch)
+        for repo_name, repo_data in batch.items():
+            all_prs.extend(_filter_prs_with_info(owner, repo_name, repo_data["prs"]))
+    else:
+        for prs in _GH_POOL.map(lambda r: _get_repo_prs_with_info(owner, r), target_repos):
+            all_prs.extend(prs)
 
     all_prs.sort(key=lambda x: x.get("createdAt", ""), reverse=True)
 
@@ -279,7 +410,7 @@ def api_stage4_prs():
 
 @bp.route("/api/pr-details", methods=["POST"])
 def api_pr_details():
-    """Get detailed info about a specific PR."""
+    """Get detailed info about a specific PR. The diff is served by /api/pr-diff."""
     data = request.json
     owner = data.get("owner")
     repo = data.get("repo")
@@ -294,14 +425,21 @@ def api_pr_details():
     ])
 
     if result["success"]:
-        pr_data = json.loads(result["output"])
+        pr_data = json_io.loads(result["output"])
+        return json_io.json_response({"success": True, "pr": pr_data})
 
-        diff_result = run_gh_command([
-            "pr", "diff", str(pr_number), "-R", f"{owner}/{repo}"
-        ])
-        if diff_result["success"]:
-            pr_data["diff"] = diff_result["output"]
+    return jsonify({"success": False, "error": result.get("error", "Failed to fetch PR")})
 
-        return jsonify({"success": True, "pr": pr_data})
 
-    return jsonify({"success": False, "error": result.get("error", "Failed to fetch PR")})
+@bp.route("/api/pr-diff", methods=["GET"])
+def api_pr_diff():
+    """Stream the diff of a PR as plain text, straight from `gh pr diff`."""
+    owner = request.args.get("owner")
+    repo = request.args.get("repo")
+    pr_number = request.args.get("pr")
+
+    if not all([owner, repo, pr_number]):
+        return jsonify({"success": False, "error": "Missing required fields"}), 400
+
+    chunks = stream_gh_command(["pr", "diff", str(pr_number), "-R", f"{owner}/{repo}"])
+    return Response(stream_with_context(chunks), mimetype="text/plain")
@@ -11,19 +11,33 @@ from . import bp
 try:
     from ..services import (
         run_gh_command,
+        get_repo_contents,
+        put_repo_contents,
         get_repo_context,
         clear_vibecheck_cache,
         cached_endpoint,
     )
-    from ..config import VIBECHECK_WORKFLOW
+    from ..config import VIBECHECK_WORKFLOW, VIBECHECK_WORKFLOW_B64
 except ImportError:
     from services import (
         run_gh_command,
+        get_repo_contents,
+        put_repo_contents,
         get_repo_context,
         clear_vibecheck_cache,
         cached_endpoint,
     )
-    from config import VIBECHECK_WORKFLOW
+    from config import VIBECHECK_WORKFLOW, VIBECHECK_WORKFLOW_B64
+
+WORKFLOW_PATH = ".github/workflows/vibecheck.yml"
+
+
+def _fetch_template_b64():
+    """Get the base64 content of the upstream vibecheck template, or None."""
+    contents = get_repo_contents("WolffM", "vibecheck", "examples/vibecheck.yml")
+    if contents is None:
+        return None
+    return contents.get("content")
 
 
 @bp.route("/api/install-vibecheck", methods=["POST"])
@@ -36,13 +50,7 @@ def api_install_vibecheck():
     if not owner or not repo:
         return jsonify({"success": False, "error": "Missing owner or repo"})
 
-    content_b64 = base64.b64encode(VIBECHECK_WORKFLOW.encode()).decode()
-
-    result = run_gh_command([
-        "api", "-X", "PUT", f"/repos/{owner}/{repo}/contents/.github/workflows/vibecheck.yml",
-        "-f", "message=Add vibeCheck workflow",
-        "-f", f"content={content_b64}"
-    ])
+    result = put_repo_contents(owner, repo, WORKFLOW_PATH, "Add vibeCheck workflow", VIBECHECK_WORKFLOW_B64)
 
     if result["success"]:
         clear_vibecheck_cache()
@@ -53,14 +61,11 @@ def api_install_vibecheck():
 @bp.route("/api/vibecheck-template", methods=["GET"])
 def api_vibecheck_template():
     """Fetch the latest vibecheck workflow template from the vibecheck repo."""
-    result = run_gh_command(
-        ["api", "repos/WolffM/vibecheck/contents/examples/vibecheck.yml", "--jq", ".content"],
-        timeout=30
-    )
+    template_b64 = _fetch_template_b64()
 
-    if result["success"]:
+    if template_b64:
         try:
-            content = base64.b64decode(result["output"].strip()).decode()
+            content = base64.b64decode(template_b64).decode()
             return jsonify({"success": True, "template": content})
         except Exception as e:
             return jsonify({"success": False, "error": f"Failed to decode template: {e}"})
@@ -81,40 +86,34 @@ def api_update_vibecheck():
         return jsonify({"success": False, "error": "Missing owner or repo"})
 
     # Get the current file SHA (required for updates)
-    sha_result = run_gh_command(
-        ["api", f"/repos/{owner}/{repo}/contents/.github/workflows/vibecheck.yml", "--jq", ".sha"],
-        timeout=30
-    )
+    current = get_repo_contents(owner, repo, WORKFLOW_PATH)
 
-    if not sha_result["success"]:
+    if not current or not current.get("sha"):
         return jsonify({"success": False, "error": "Workflow not found - use install instead"})
 
-    sha = sha_result["output"].strip()
+    sha = current["sha"]
 
     # Use provided template or fetch latest from vibecheck repo
     if template:
         workflow_content = template
     else:
-        template_result = run_gh_command(
-            ["api", "repos/WolffM/vibecheck/contents/examples/vibecheck.yml", "--jq", ".content"],
-            timeout=30
-        )
-        if template_result["success"]:
+        template_b64 = _fetch_template_b64()
+        if template_b64:
             try:
-                workflow_content = base64.b64decode(template_result["output"].strip()).decode()
+                workflow_content = base64.b64decode(template_b64).decode()
             except Exception:
                 workflow_content = VIBECHECK_WORKFLOW
         else:
             workflow_content = VIBECHECK_WORKFLOW
 
-    content_b64 = base64.b64encode(workflow_content.encode()).decode()
+    if workflow_content is VIBECHECK_WORKFLOW:
+        content_b64 = VIBECHECK_WORKFLOW_B64
+    else:
+        content_b64 = base64.b64encode(workflow_content.encode()).decode()
 
-    result = run_gh_command([
-        "api", "-X", "PUT", f"/repos/{owner}/{repo}/contents/.github/workflows/vibecheck.yml",
-        "-f", "message=Update vibeCheck workflow to latest version",
-        "-f", f"content={content_b64}",
-        "-f", f"sha={sha}"
-    ], timeout=30)
+    result = put_repo_contents(
+        owner, repo, WORKFLOW_PATH, "Update vibeCheck workflow to latest version", content_b64, sha=sha
+    )
 
     if result["success"]:
         return jsonify({"success": True, "message": "vibeCheck workflow updated!"})
@@ -10,17 +10,36 @@ from .cache import (
     set_cached,
     clear_cache,
     get_cache_stats,
-    cached_endpoint
+    cached_endpoint,
+    fill_lock,
+    get_memoized,
+    set_memoized,
+    clear_memoized
 )
 from .github_api import (
     run_gh_command,
+    stream_gh_command,
     get_authenticated_user,
     get_repos,
     get_repo_issues,
     get_repo_prs,
+    get_repo_prs_cached,
     get_workflow_runs,
+    count_commits_since,
+    get_repo_contents,
+    put_repo_contents,
     check_vibecheck_installed,
     check_vibecheck_installed_batch,
+    run_gh_graphql,
+    batch_repo_query,
+    batch_pr_comments,
+    batch_pr_states,
+    batch_commit_counts,
+    batch_open_prs,
+    batch_repo_metadata,
+    batch_repo_issues,
+    probe_vibecheck_installed,
+    merge_pull_request,
     get_repo_context
 )
 from .oss_service import OSSService
@@ -34,14 +53,33 @@ __all__ = [
     'clear_cache',
     'get_cache_stats',
     'cached_endpoint',
+    'fill_lock',
+    'get_memoized',
+    'set_memoized',
+    'clear_memoized',
     'run_gh_command',
+    'stream_gh_command',
     'get_authenticated_user',
     'get_repos',
     'get_repo_issues',
     'get_repo_prs',
+    'get_repo_prs_cached',
     'get_workflow_runs',
+    'count_commits_since',
+    'get_repo_contents',
+    'put_repo_contents',
     'check_vibecheck_installed',
     'check_vibecheck_installed_batch',
+    'run_gh_graphql',
+    'batch_repo_query',
+    'batch_pr_comments',
+    'batch_pr_states',
+    'batch_commit_counts',
+    'batch_open_prs',
+    'batch_repo_metadata',
+    'batch_repo_issues',
+    'probe_vibecheck_installed',
+    'merge_pull_request',
     'get_repo_context',
     'OSSService'
 ]
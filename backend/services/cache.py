@@ -7,12 +7,17 @@ Caches are stored in .cache/ directory and persist between server restarts.
 
 import hashlib
 import json
+import mmap
 import os
+import threading
 import time
-from functools import wraps
+from collections import OrderedDict
+from functools import lru_cache, wraps
 from typing import Any
 
-from flask import jsonify
+from flask import Response
+
+from . import json_io
 
 # Cache configuration
 CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".cache")
@@ -20,45 +25,164 @@ DEFAULT_TTL = 300  # 5 minutes default
 LOCAL_DEV_TTL = 3600  # 1 hour for local development
 
 
-def _is_local_dev() -> bool:
-    """Check if we're in local development mode (evaluated at runtime)."""
+# Environment-derived settings, read once by refresh_env() rather than on every
+# cache call
+_LOCAL_DEV = True
+_CACHE_ENABLED = True
+_TTL = LOCAL_DEV_TTL
+
+
+def refresh_env():
+    """Re-read the cache settings from the environment (LOCAL_CACHE, FLASK_ENV, URL_PREFIX, CACHE_DISABLED)."""
+    global _LOCAL_DEV, _CACHE_ENABLED, _TTL
     # LOCAL_CACHE=1 or FLASK_ENV=development enables extended caching
     # Also default to local dev mode if running on localhost (no URL_PREFIX override)
-    if os.environ.get("LOCAL_CACHE") == "1":
-        return True
-    if os.environ.get("FLASK_ENV") == "development":
-        return True
-    # Default to local dev when URL_PREFIX is not set (running locally)
-    if not os.environ.get("URL_PREFIX"):
-        return True
-    return False
+    _LOCAL_DEV = (
+        os.environ.get("LOCAL_CACHE") == "1"
+        or os.environ.get("FLASK_ENV") == "development"
+        or not os.environ.get("URL_PREFIX")
+    )
+    _CACHE_ENABLED = os.environ.get("CACHE_DISABLED") != "1"
+    _TTL = LOCAL_DEV_TTL if _LOCAL_DEV else DEFAULT_TTL
+
+
+refresh_env()
+
+
+def _is_local_dev() -> bool:
+    """Check if we're in local development mode."""
+    return _LOCAL_DEV
 
 
 def _is_cache_enabled() -> bool:
-    """Check if caching is enabled (evaluated at runtime)."""
-    return os.environ.get("CACHE_DISABLED") != "1"
+    """Check if caching is enabled."""
+    return _CACHE_ENABLED
+
+# Per-repo vibecheck install status, stored under one cache key as
+# {name: [installed, checked_at]} so it survives restarts
+VIBECHECK_STATUS_TTL = 600
+VIBECHECK_STATUS_KEY = "vibecheck-status"
+_vibecheck_status_lock = threading.Lock()
 
-# Legacy module-level cache for vibecheck status (kept for backward compatibility)
-_vibecheck_cache: dict[str, bool] = {}
-_cache_timestamp = 0
+# In-process memo for small values that are slow to fetch (authenticated user, repo list)
+_memo: dict[str, tuple[Any, float]] = {}
 
+# Bounded LRU of encoded JSON bodies in front of the cache files, so repeat hits
+# in this worker skip the file read (and, for endpoints, the parse and re-encode).
+# Keyed by cache key; (stored_at, body bytes).
+MEMORY_CACHE_SIZE = 256
+_encoded_responses: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+_encoded_lock = threading.Lock()
 
-def _ensure_cache_dir():
-    """Ensure the cache directory exists."""
-    if not os.path.exists(CACHE_DIR):
-        os.makedirs(CACHE_DIR, exist_ok=True)
+# get_cached parses files at least this large straight from a memory map instead
+# of reading them into a bytes copy first
+MMAP_THRESHOLD = 64 * 1024
+
+# One lock per cached endpoint key, so concurrent misses compute once and the
+# rest wait for the stored result instead of repeating the gh fan-out.
+_fill_locks: dict[str, threading.Lock] = {}
+_fill_locks_guard = threading.Lock()
+
+
+# Created once here rather than checked on every cache call; writes recreate it
+# if it is deleted while the server runs
+os.makedirs(CACHE_DIR, exist_ok=True)
+
+
+@lru_cache(maxsize=4096)
+def _key_filename(cache_key: str) -> str:
+    """Hash a cache key into a safe filename (keys are few and repeat constantly)."""
+    return hashlib.blake2b(cache_key.encode(), digest_size=16).hexdigest() + ".json"
 
 
 def _get_cache_path(cache_key: str) -> str:
-    """Get the file path for a cache key."""
-    # Hash the key to create a safe filename
-    key_hash = hashlib.md5(cache_key.encode()).hexdigest()
-    return os.path.join(CACHE_DIR, f"{key_hash}.json")
+    """Get the file path holding a cache key's JSON body."""
+    return os.path.join(CACHE_DIR, _key_filename(cache_key))
 
 
 def _get_ttl() -> int:
     """Get the appropriate TTL based on environment."""
-    return LOCAL_DEV_TTL if _is_local_dev() else DEFAULT_TTL
+    return _TTL
+
+
+def _read_cached_body(cache_key: str, ttl: int | None = None) -> tuple[float, bytes] | None:
+    """Get (stored_at, raw JSON body) for a valid cache entry without parsing the body.
+
+    Served from the in-memory LRU when present; otherwise the file's mtime is
+    the stored time, so expired entries cost one stat.
+    """
+    if not _is_cache_enabled():
+        return None
+
+    effective_ttl = ttl if ttl is not None else _get_ttl()
+    entry = _memory_entry(cache_key, effective_ttl)
+    if entry:
+        return entry
+    found = _fresh_cache_file(cache_key, effective_ttl)
+    if found is None:
+        return None
+    return _read_cache_file(cache_key, *found)
+
+
+def _memory_entry(cache_key: str, ttl: int) -> tuple[float, bytes] | None:
+    """Get an in-memory LRU entry younger than ttl seconds."""
+    with _encoded_lock:
+        entry = _encoded_responses.get(cache_key)
+        if entry and time.time() - entry[0] < ttl:
+            _encoded_responses.move_to_end(cache_key)
+            return entry
+    return None
+
+
+def _fresh_cache_file(cache_key: str, ttl: int) -> tuple[str, os.stat_result] | None:
+    """Get (path, stat) for a cache file whose mtime is within ttl seconds."""
+    cache_path = _get_cache_path(cache_key)
+    try:
+        st = os.stat(cache_path)
+    except OSError:
+        return None
+
+    if time.time() - st.st_mtime >= ttl:
+        print(f"[CACHE] EXPIRED: {cache_key}")
+        return None
+    print(f"[CACHE] HIT: {cache_key} (TTL: {ttl}s)")
+    return cache_path, st
+
+
+def _read_cache_file(cache_key: str, cache_path: str, st: os.stat_result) -> tuple[float, bytes] | None:
+    """Read a fresh cache file's body and keep it in the in-memory LRU."""
+    try:
+        with open(cache_path, "rb") as f:
+            body = f.read()
+    except OSError:
+        return None
+    _remember(cache_key, (st.st_mtime, body))
+    return st.st_mtime, body
+
+
+def _load_mapped(cache_path: str) -> Any:
+    """Parse a cache file through a read-only memory map, without copying it into a bytes object."""
+    with open(cache_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return json_io.loads(view)
+
+
+def _remember(cache_key: str, entry: tuple[float, bytes]) -> None:
+    """Put an entry in the in-memory LRU, evicting the least recently used past MEMORY_CACHE_SIZE."""
+    with _encoded_lock:
+        _encoded_responses[cache_key] = entry
+        _encoded_responses.move_to_end(cache_key)
+        while len(_encoded_responses) > MEMORY_CACHE_SIZE:
+            _encoded_responses.popitem(last=False)
+
+
+def _forget(cache_key: str | None = None) -> None:
+    """Drop one key (or everything) from the in-memory LRU."""
+    with _encoded_lock:
+        if cache_key is None:
+            _encoded_responses.clear()
+        else:
+            _encoded_responses.pop(cache_key, None)
 
 
 def get_cached(cache_key: str, ttl: int | None = None) -> Any | None:
@@ -75,26 +199,21 @@ def get_cached(cache_key: str, ttl: int | None = None) -> Any | None:
     if not _is_cache_enabled():
         return None
 
-    _ensure_cache_dir()
-    cache_path = _get_cache_path(cache_key)
-
-    if not os.path.exists(cache_path):
-        return None
-
+    effective_ttl = ttl if ttl is not None else _get_ttl()
+    entry = _memory_entry(cache_key, effective_ttl)
     try:
-        with open(cache_path, "r", encoding="utf-8") as f:
-            cached = json.load(f)
-
-        cached_time = cached.get("timestamp", 0)
-        effective_ttl = ttl if ttl is not None else _get_ttl()
-
-        if time.time() - cached_time < effective_ttl:
-            print(f"[CACHE] HIT: {cache_key} (TTL: {effective_ttl}s)")
-            return cached.get("data")
-        else:
-            print(f"[CACHE] EXPIRED: {cache_key}")
-            return None
-    except (json.JSONDecodeError, IOError, KeyError):
+        if entry is None:
+            found = _fresh_cache_file(cache_key, effective_ttl)
+            if found is None:
+                return None
+            if found[1].st_size >= MMAP_THRESHOLD:
+                # Large bodies are parsed from the page cache and kept out of the LRU
+                return _load_mapped(found[0])
+            entry = _read_cache_file(cache_key, *found)
+            if entry is None:
+                return None
+        return json_io.loads(entry[1])
+    except (json.JSONDecodeError, OSError, ValueError):
         return None
 
 
@@ -109,19 +228,37 @@ def set_cached(cache_key: str, data: Any) -> None:
     if not _is_cache_enabled():
         return
 
-    _ensure_cache_dir()
-    cache_path = _get_cache_path(cache_key)
+    try:
+        _write_cached_body(cache_key, json_io.dumps(data))
+    except TypeError as e:
+        print(f"[CACHE] ERROR setting {cache_key}: {e}")
 
+
+def _write_cached_body(cache_key: str, body: bytes) -> None:
+    """Store an already-encoded JSON body. The body is stored as-is so hits can serve it unparsed."""
+    _remember(cache_key, (time.time(), body))
+    cache_path = _get_cache_path(cache_key)
+    # Unique per worker process and thread, so concurrent writers never share a temp file
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
     try:
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump({
-                "timestamp": time.time(),
-                "key": cache_key,
-                "data": data
-            }, f, indent=2)
+        try:
+            f = open(tmp_path, "wb")
+        except FileNotFoundError:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            f = open(tmp_path, "wb")
+        with f:
+            f.write(body)
+        # Readers see the old body or the new one, never a torn write, so no
+        # fsync is needed; the rename also gives the entry a fresh mtime, which
+        # is its stored time
+        os.replace(tmp_path, cache_path)
         print(f"[CACHE] SET: {cache_key} (TTL: {_get_ttl()}s)")
-    except (IOError, TypeError) as e:
+    except IOError as e:
         print(f"[CACHE] ERROR setting {cache_key}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
 
 
 def clear_cache(cache_key: str | None = None) -> int:
@@ -134,21 +271,29 @@ def clear_cache(cache_key: str | None = None) -> int:
     Returns:
         Number of cache entries cleared
     """
-    _ensure_cache_dir()
     cleared = 0
 
     if cache_key:
+        _forget(cache_key)
         cache_path = _get_cache_path(cache_key)
         if os.path.exists(cache_path):
             os.remove(cache_path)
             cleared = 1
             print(f"[CACHE] CLEARED: {cache_key}")
     else:
+        _forget()
         # Clear all cache files
-        for filename in os.listdir(CACHE_DIR):
+        try:
+            filenames = os.listdir(CACHE_DIR)
+        except FileNotFoundError:
+            filenames = []
+        for filename in filenames:
             if filename.endswith(".json"):
                 os.remove(os.path.join(CACHE_DIR, filename))
                 cleared += 1
+            elif filename.endswith(".tmp"):
+                # Left behind by a writer that died mid-write
+                os.remove(os.path.join(CACHE_DIR, filename))
         print(f"[CACHE] CLEARED ALL: {cleared} entries")
 
     return cleared
@@ -156,8 +301,6 @@ def clear_cache(cache_key: str | None = None) -> int:
 
 def get_cache_stats() -> dict:
     """Get cache statistics."""
-    _ensure_cache_dir()
-
     stats = {
         "enabled": _is_cache_enabled(),
         "local_dev": _is_local_dev(),
@@ -169,24 +312,26 @@ def get_cache_stats() -> dict:
         "expired_entries": 0
     }
 
-    if not os.path.exists(CACHE_DIR):
-        return stats
-
-    for filename in os.listdir(CACHE_DIR):
-        if filename.endswith(".json"):
-            filepath = os.path.join(CACHE_DIR, filename)
-            stats["entries"] += 1
-            stats["total_size_bytes"] += os.path.getsize(filepath)
-
-            try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    cached = json.load(f)
-                if time.time() - cached.get("timestamp", 0) < _get_ttl():
+    now = time.time()
+    ttl = _get_ttl()
+    try:
+        # DirEntry.stat() reuses what the directory scan already fetched where the OS allows
+        with os.scandir(CACHE_DIR) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                stats["entries"] += 1
+                stats["total_size_bytes"] += st.st_size
+                if now - st.st_mtime < ttl:
                     stats["valid_entries"] += 1
                 else:
                     stats["expired_entries"] += 1
-            except (json.JSONDecodeError, IOError):
-                stats["expired_entries"] += 1
+    except FileNotFoundError:
+        pass
 
     return stats
 
@@ -197,40 +342,119 @@ def cached_endpoint(cache_key):
     """Decorator that adds caching to a Flask route handler.
 
     The decorated function should return a plain dict.
-    The decorator handles cache lookup, storage, and jsonify.
+    The decorator handles cache lookup, storage, and JSON encoding. Hits are
+    served from the stored body without re-encoding (and, while it is in the
+    in-memory LRU, without touching the cache file). Concurrent misses on the
+    same key are coalesced: one request computes, the others wait and serve
+    its result.
+
+    The wrapped view gets a `refresh()` attribute that recomputes and stores
+    the result regardless of the cache, for background warm-ups.
     """
     def decorator(fn):
+        def lookup():
+            # The stored body is the response as-is; serve it without parsing
+            encoded = _read_cached_body(cache_key)
+            if encoded:
+                return Response(encoded[1], mimetype="application/json")
+            return None
+
+        def compute(*args, **kwargs):
+            result = fn(*args, **kwargs)
+            body = json_io.dumps(result)
+            if _is_cache_enabled():
+                _write_cached_body(cache_key, body)
+            return result, Response(body, mimetype="application/json")
+
         @wraps(fn)
         def wrapper(*args, **kwargs):
-            cached = get_cached(cache_key)
-            if cached:
-                return jsonify(cached)
-            result = fn(*args, **kwargs)
-            set_cached(cache_key, result)
-            return jsonify(result)
+            if not _is_cache_enabled():
+                return compute(*args, **kwargs)[1]
+            hit = lookup()
+            if hit is not None:
+                return hit
+            with fill_lock(cache_key):
+                # Another request may have filled the cache while this one waited
+                hit = lookup()
+                if hit is not None:
+                    return hit
+                return compute(*args, **kwargs)[1]
+
+        def refresh(*args, **kwargs):
+            with fill_lock(cache_key):
+                return compute(*args, **kwargs)[0]
+
+        wrapper.refresh = refresh
         return wrapper
     return decorator
 
 
-# ============ Legacy functions for backward compatibility ============
+def fill_lock(cache_key: str) -> threading.Lock:
+    """Get the lock that serializes cache fills for one key (also for fills outside cached_endpoint)."""
+    with _fill_locks_guard:
+        return _fill_locks.setdefault(cache_key, threading.Lock())
+
 
-def get_cached_vibecheck_status():
-    """Get cached vibecheck status for all repos (legacy function)."""
-    global _vibecheck_cache, _cache_timestamp
-    if time.time() - _cache_timestamp < DEFAULT_TTL and _vibecheck_cache:
-        return _vibecheck_cache
+# ============ In-process memo ============
+
+def get_memoized(key: str, ttl: int | None = None) -> Any | None:
+    """Get an in-process memoized value if it is younger than ttl seconds (None = no expiry)."""
+    entry = _memo.get(key)
+    if entry and (ttl is None or time.monotonic() - entry[1] < ttl):
+        return entry[0]
     return None
 
 
+def set_memoized(key: str, value: Any) -> None:
+    """Store a value in the in-process memo."""
+    _memo[key] = (value, time.monotonic())
+
+
+def clear_memoized() -> None:
+    """Drop all in-process memoized values."""
+    _memo.clear()
+
+
+# ============ Vibecheck status ============
+
+def _stored_vibecheck_status(max_age: int) -> dict:
+    """Get the stored status map; empty if it was last written more than max_age seconds ago."""
+    # No entry is newer than the file holding it, so a stale file has nothing fresh
+    stored = get_cached(VIBECHECK_STATUS_KEY, ttl=max_age)
+    return stored if isinstance(stored, dict) else {}
+
+
+def get_cached_vibecheck_status(repo_names=None, max_age=VIBECHECK_STATUS_TTL):
+    """Get vibecheck statuses checked within max_age seconds.
+
+    Returns {name: installed} for the given repos (all known repos if None);
+    repos with no fresh entry are left out. Returns None if nothing is fresh.
+    """
+    stored = _stored_vibecheck_status(max_age)
+    now = time.time()
+    names = stored.keys() if repo_names is None else repo_names
+    fresh = {}
+    for name in names:
+        entry = stored.get(name)
+        try:
+            if entry and now - float(entry[1]) < max_age:
+                fresh[name] = bool(entry[0])
+        except (TypeError, ValueError, IndexError):
+            continue
+    return fresh or None
+
+
 def set_cached_vibecheck_status(status_dict):
-    """Set cached vibecheck status (legacy function)."""
-    global _vibecheck_cache, _cache_timestamp
-    _vibecheck_cache = status_dict
-    _cache_timestamp = time.time()
+    """Record freshly checked statuses ({name: installed}) and persist the map."""
+    with _vibecheck_status_lock:
+        stored = _stored_vibecheck_status(VIBECHECK_STATUS_TTL)
+        now = time.time()
+        for name, installed in status_dict.items():
+            stored[name] = [installed, now]
+        set_cached(VIBECHECK_STATUS_KEY, stored)
 
 
 def clear_vibecheck_cache():
-    """Clear the vibecheck cache (legacy function)."""
-    global _vibecheck_cache, _cache_timestamp
-    _vibecheck_cache = {}
-    _cache_timestamp = 0
+    """Clear the vibecheck status along with the user/repo memo."""
+    clear_cache(VIBECHECK_STATUS_KEY)
+    clear_memoized()
@@ -2,25 +2,104 @@
 GitHub API Service - Wrapper functions for GitHub CLI commands
 """
 
+import os
 import subprocess
 import json
+import random
+import re
 import time
 import sys
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from .cache import get_cached_vibecheck_status, set_cached_vibecheck_status
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import json_io
+from .cache import (
+    get_cached_vibecheck_status,
+    set_cached_vibecheck_status,
+    get_memoized,
+    set_memoized,
+)
 
 # On Windows, prevent subprocess from opening console windows
 _SUBPROCESS_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
 
+GITHUB_API_URL = "https://api.github.com"
+REST_POOL_SIZE = 32
+VIBECHECK_WORKFLOW_PATH = ".github/workflows/vibecheck.yml"
+
+# Shared keep-alive session for direct REST calls (avoids a gh exec + TLS handshake per call)
+_session = requests.Session()
+_session.headers["Accept"] = "application/vnd.github+json"
+# Stage fan-outs run up to 10 workers each and several endpoints load at once;
+# requests' default pool keeps only 10 connections and drops the rest after use.
+# Reads that hit a transient gateway error are retried on the pooled connection
+# (writes aren't: a contents PUT that landed would fail on replay).
+_session.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=REST_POOL_SIZE,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=("GET", "HEAD"),
+        raise_on_status=False,
+    ),
+))
+_token = None
+_token_loaded = False
+_token_lock = threading.Lock()
+# (path, params) -> (etag, normalized payload) for conditional REST list requests
+_rest_etags = {}
+
+# Global cap on concurrent gh processes, whichever endpoints are fanning out;
+# bursts on one token otherwise trip GitHub's secondary rate limits
+GH_MAX_CONCURRENCY = 8
+GH_RATE_LIMIT_RETRIES = 2
+_gh_slots = threading.BoundedSemaphore(GH_MAX_CONCURRENCY)
+_RATE_LIMIT_MARKERS = ("API rate limit exceeded", "secondary rate limit")
+
+# The repo list changes on the order of hours; don't re-fetch it per request
+REPOS_TTL = 300
+CONTEXT_TTL = 30
+_context_lock = threading.Lock()
+
+# `gh ... list --json` field sets; callers that need less can pass a subset
+PR_LIST_FIELDS = (
+    "number", "title", "state", "createdAt", "author", "url",
+    "headRefName", "isDraft", "reviewDecision", "labels", "comments",
+)
+ISSUE_LIST_FIELDS = ("number", "title", "labels", "state", "createdAt", "assignees", "url")
+ISSUE_LIST_LIMIT = 30  # `gh issue list` default
+REPO_LIST_LIMIT = 100
+
 
 def run_gh_command(args, capture_output=True, timeout=30):
     """Run a gh CLI command and return the result.
 
+    At most GH_MAX_CONCURRENCY commands run at once. A command rejected by a
+    GitHub rate limit is retried with jittered exponential backoff.
+
     Args:
         args: Command arguments to pass to gh
         capture_output: Whether to capture stdout/stderr
         timeout: Timeout in seconds (default 30s)
     """
+    for attempt in range(GH_RATE_LIMIT_RETRIES + 1):
+        with _gh_slots:
+            result = _run_gh_once(args, capture_output, timeout)
+        if result["success"] or not any(m in (result["error"] or "") for m in _RATE_LIMIT_MARKERS):
+            break
+        if attempt < GH_RATE_LIMIT_RETRIES:
+            time.sleep(2 ** attempt + random.random())
+    return result
+
+
+def _run_gh_once(args, capture_output, timeout):
+    """Run one gh CLI process. See run_gh_command."""
     try:
         result = subprocess.run(
             ["gh"] + args,
@@ -40,93 +119,864 @@ def run_gh_command(args, capture_output=True, timeout=30):
         return {"success": False, "error": str(e)}
 
 
+def stream_gh_command(args, chunk_size=65536):
+    """Run a gh CLI command and yield its stdout as bytes chunks as they arrive.
+
+    For large outputs (e.g. `pr diff`) that are relayed to the client rather
+    than parsed. Yields nothing if gh can't be started; the process is killed
+    if the consumer stops early. Holds a _gh_slots slot for the life of the
+    process, like run_gh_command.
+    """
+    _gh_slots.acquire()
+    try:
+        try:
+            proc = subprocess.Popen(
+                ["gh"] + args,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                creationflags=_SUBPROCESS_FLAGS,
+            )
+        except OSError:
+            return
+        try:
+            while True:
+                chunk = proc.stdout.read1(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+    finally:
+        _gh_slots.release()
+
+
+def _get_token():
+    """Resolve the GitHub token once per process (GH_TOKEN/GITHUB_TOKEN, then `gh auth token`)."""
+    global _token, _token_loaded
+    if _token_loaded:
+        return _token
+    with _token_lock:
+        if not _token_loaded:
+            token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+            if not token:
+                result = run_gh_command(["auth", "token"], timeout=10)
+                if result["success"]:
+                    token = result["output"].strip()
+            _token = token or None
+            _token_loaded = True
+    return _token
+
+
+def github_rest(method, path, params=None, timeout=30, headers=None, json_body=None):
+    """Call the GitHub REST API over the shared session.
+
+    Returns the requests.Response, or None when no token is available or the
+    request could not be made. Callers fall back to the gh CLI on None.
+    """
+    token = _get_token()
+    if not token:
+        return None
+    request_headers = {"Authorization": f"Bearer {token}"}
+    if headers:
+        request_headers.update(headers)
+    try:
+        return _session.request(
+            method, f"{GITHUB_API_URL}{path}",
+            params=params,
+            json=json_body,
+            headers=request_headers,
+            timeout=timeout,
+        )
+    except requests.RequestException:
+        return None
+
+
 def get_authenticated_user():
-    """Get the currently authenticated GitHub user."""
+    """Get the currently authenticated GitHub user.
+
+    The gh identity doesn't change while the process runs, so a successful
+    lookup is kept until the memo is cleared (e.g. via /api/clear-cache).
+    """
+    cached = get_memoized("user")
+    if cached is not None:
+        return cached
+    resp = github_rest("GET", "/user")
+    if resp is not None and resp.ok:
+        user = json_io.loads(resp.content).get("login")
+        if user:
+            set_memoized("user", user)
+            return user
     result = run_gh_command(["api", "user", "--jq", ".login"])
     if result["success"]:
-        return result["output"].strip()
+        user = result["output"].strip()
+        set_memoized("user", user)
+        return user
     return "unknown"
 
 
-def get_repos(limit=100):
-    """Get all repositories for the authenticated user."""
+def get_repos(limit=REPO_LIST_LIMIT):
+    """Get all repositories for the authenticated user (memoized for REPOS_TTL seconds)."""
+    memo_key = f"repos:{limit}"
+    cached = get_memoized(memo_key, REPOS_TTL)
+    if cached is not None:
+        return cached
+    if limit <= 100:
+        # One REST page covers it; same order and fields as `gh repo list`
+        resp = github_rest("GET", "/user/repos", params={
+            "affiliation": "owner", "sort": "pushed", "per_page": limit,
+        })
+        if resp is not None and resp.ok:
+            repos = [_normalize_rest_repo(r) for r in json_io.loads(resp.content)]
+            set_memoized(memo_key, repos)
+            return repos
     result = run_gh_command(["repo", "list", "--limit", str(limit), "--json", "name,url,isPrivate,description,updatedAt"])
     if result["success"]:
-        return json.loads(result["output"])
+        repos = json_io.loads(result["output"])
+        set_memoized(memo_key, repos)
+        return repos
     return []
 
 
-def get_repo_issues(owner, repo, labels=None):
-    """Get issues for a repository, optionally filtered by labels."""
-    cmd = ["issue", "list", "-R", f"{owner}/{repo}", "--json", "number,title,labels,state,createdAt,assignees,url"]
+def _conditional_rest_get(path, params, normalize):
+    """GET a REST list, revalidating with the last ETag.
+
+    A 304 reuses the previous normalized payload and doesn't count against the
+    rate limit. Returns the normalized payload, [] when the resource is gone
+    (404/410), or None when REST is unavailable or failed otherwise, e.g. a
+    rate limit or a 5xx (callers fall back to gh). Callers get their own
+    copies of the item dicts, so tagging them never leaks into the ETag cache.
+    """
+    etag_key = (path, tuple(sorted(params.items())))
+    cached = _rest_etags.get(etag_key)
+    resp = github_rest(
+        "GET", path, params=params,
+        headers={"If-None-Match": cached[0]} if cached else None,
+    )
+    if resp is None:
+        return None
+    if resp.status_code == 304 and cached:
+        return [dict(item) for item in cached[1]]
+    if resp.status_code in (404, 410):
+        return []
+    if not resp.ok:
+        return None
+    payload = normalize(json_io.loads(resp.content))
+    etag = resp.headers.get("ETag")
+    if etag:
+        _rest_etags[etag_key] = (etag, [dict(item) for item in payload])
+    return payload
+
+
+def _normalize_rest_issues(items):
+    """Map REST issues onto the `gh issue list --json` field names, dropping PRs."""
+    return [
+        {
+            "number": item.get("number"),
+            "title": item.get("title"),
+            "labels": [
+                {"name": label.get("name"), "color": label.get("color"), "description": label.get("description")}
+                for label in item.get("labels") or []
+            ],
+            "state": (item.get("state") or "").upper(),
+            "createdAt": item.get("created_at"),
+            "assignees": [{"login": a.get("login")} for a in item.get("assignees") or []],
+            "url": item.get("html_url"),
+        }
+        for item in items
+        if "pull_request" not in item
+    ]
+
+
+def _normalize_rest_repo(repo):
+    """Map a REST repository onto the `gh repo list --json` field names used here."""
+    return {
+        "name": repo.get("name"),
+        "url": repo.get("html_url"),
+        "isPrivate": repo.get("private", False),
+        "description": repo.get("description") or "",
+        "updatedAt": repo.get("updated_at"),
+    }
+
+
+def get_repo_issues(owner, repo, labels=None, fields=ISSUE_LIST_FIELDS):
+    """Get open issues for a repository, optionally filtered by labels.
+
+    Uses an ETag-revalidated REST request when a token is available; `fields`
+    narrows the `gh issue list --json` set on the gh fallback. Either way up
+    to ISSUE_LIST_LIMIT issues come back, like `gh issue list`'s default.
+    """
+    # The REST issues endpoint also lists PRs; fetch a full page so that
+    # dropping them still leaves ISSUE_LIST_LIMIT issues
+    params = {"state": "open", "per_page": 100}
+    if labels:
+        params["labels"] = labels
+    issues = _conditional_rest_get(f"/repos/{owner}/{repo}/issues", params, _normalize_rest_issues)
+    if issues is not None:
+        return issues[:ISSUE_LIST_LIMIT]
+
+    cmd = ["issue", "list", "-R", f"{owner}/{repo}", "--json", ",".join(fields)]
     if labels:
         cmd.extend(["--label", labels])
     result = run_gh_command(cmd)
     if result["success"]:
-        return json.loads(result["output"])
+        return json_io.loads(result["output"])
     return []
 
 
-def get_repo_prs(owner, repo):
-    """Get pull requests for a repository."""
-    result = run_gh_command(["pr", "list", "-R", f"{owner}/{repo}", "--json", "number,title,state,createdAt,author,url,headRefName,isDraft,reviewDecision,labels"])
+def get_repo_prs(owner, repo, fields=PR_LIST_FIELDS):
+    """Get open pull requests for a repository with the given `gh pr list --json` fields."""
+    result = run_gh_command(["pr", "list", "-R", f"{owner}/{repo}", "--json", ",".join(fields)])
     if result["success"]:
-        return json.loads(result["output"])
+        return json_io.loads(result["output"])
     return []
 
 
-def get_workflow_runs(owner, repo, workflow_name=None, limit=10):
-    """Get recent workflow runs."""
+def get_repo_prs_cached(owner, repo, fields=PR_LIST_FIELDS, ttl=60):
+    """get_repo_prs, memoized for ttl seconds so stage3 and stage4 share one `gh pr list`.
+
+    A request for a subset of PR_LIST_FIELDS is served from a memoized full
+    list when there is one. Returns shallow copies of the PRs; callers tag
+    and trim them in place.
+    """
+    fields = tuple(fields)
+    memo_key = f"prs:{owner}/{repo}:{','.join(fields)}"
+    prs = get_memoized(memo_key, ttl)
+    if prs is None and fields != PR_LIST_FIELDS and set(fields) <= set(PR_LIST_FIELDS):
+        prs = get_memoized(f"prs:{owner}/{repo}:{','.join(PR_LIST_FIELDS)}", ttl)
+    if prs is None:
+        prs = get_repo_prs(owner, repo, fields)
+        set_memoized(memo_key, prs)
+    return [dict(pr) for pr in prs]
+
+
+def _normalize_rest_run(run):
+    """Map a REST workflow run onto the `gh run list --json` field names."""
+    return {
+        "databaseId": run.get("id"),
+        "displayTitle": run.get("display_title"),
+        "status": run.get("status"),
+        "conclusion": run.get("conclusion"),
+        "createdAt": run.get("created_at"),
+        "workflowName": run.get("name"),
+        "url": run.get("html_url"),
+    }
+
+
+def get_workflow_runs(owner, repo, workflow=None, limit=10):
+    """Get recent workflow runs, optionally for one workflow file (e.g. "vibecheck.yml").
+
+    REST responses are revalidated with the last ETag; a 304 reuses the
+    previous runs and doesn't count against the rate limit.
+    """
+    if workflow:
+        path = f"/repos/{owner}/{repo}/actions/workflows/{workflow}/runs"
+    else:
+        path = f"/repos/{owner}/{repo}/actions/runs"
+    runs = _conditional_rest_get(
+        path, {"per_page": limit},
+        lambda body: [_normalize_rest_run(r) for r in body.get("workflow_runs", [])],
+    )
+    if runs is not None:
+        return runs
+
     cmd = ["run", "list", "-R", f"{owner}/{repo}", "--json", "databaseId,displayTitle,status,conclusion,createdAt,workflowName,url", "--limit", str(limit)]
-    if workflow_name:
-        cmd.extend(["-w", workflow_name])
+    if workflow:
+        cmd.extend(["-w", workflow])
     result = run_gh_command(cmd)
     if result["success"]:
-        return json.loads(result["output"])
+        return json_io.loads(result["output"])
     return []
 
 
+_LAST_PAGE_RE = re.compile(r'[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+
+def _count_from_page(link_header, body):
+    """Count items from a per_page=1 response: the last page number, else the body length."""
+    match = _LAST_PAGE_RE.search(link_header or "")
+    if match:
+        return int(match.group(1))
+    try:
+        return len(json_io.loads(body))
+    except (ValueError, TypeError):
+        return 0
+
+
+def count_commits_since(owner, repo, since):
+    """Count commits on the default branch since an ISO 8601 timestamp.
+
+    Asks for one commit per page and reads the total off the Link header's
+    last page, so the size of the response doesn't depend on the count.
+    """
+    path = f"/repos/{owner}/{repo}/commits"
+    params = {"since": since, "per_page": 1}
+    resp = github_rest("GET", path, params=params)
+    if resp is not None:
+        if resp.ok:
+            return _count_from_page(resp.headers.get("Link"), resp.content)
+        return 0
+
+    result = run_gh_command(["api", f"{path}?since={since}&per_page=1", "--include"])
+    if not result["success"]:
+        return 0
+    # --include prefixes the body with the status line and headers
+    head, _, body = result["output"].replace("\r\n", "\n").partition("\n\n")
+    link = ""
+    for line in head.splitlines():
+        name, _, value = line.partition(":")
+        if name.strip().lower() == "link":
+            link = value
+            break
+    return _count_from_page(link, body)
+
+
+def get_repo_contents(owner, repo, path):
+    """Get a file's contents object (`sha`, base64 `content`, ...) from the contents API.
+
+    Returns the parsed dict, or None if the file doesn't exist or the request failed.
+    """
+    api_path = f"/repos/{owner}/{repo}/contents/{path}"
+    resp = github_rest("GET", api_path)
+    if resp is not None:
+        if not resp.ok:
+            return None
+        try:
+            return json_io.loads(resp.content)
+        except json.JSONDecodeError:
+            return None
+
+    result = run_gh_command(["api", api_path])
+    if not result["success"]:
+        return None
+    try:
+        return json_io.loads(result["output"])
+    except json.JSONDecodeError:
+        return None
+
+
+def put_repo_contents(owner, repo, path, message, content_b64, sha=None):
+    """Create or update a file through the contents API.
+
+    `sha` is required when updating an existing file. Returns
+    {"success": True} or {"success": False, "error": str}.
+    """
+    api_path = f"/repos/{owner}/{repo}/contents/{path}"
+    body = {"message": message, "content": content_b64}
+    if sha:
+        body["sha"] = sha
+
+    resp = github_rest("PUT", api_path, json_body=body)
+    if resp is not None:
+        if resp.ok:
+            return {"success": True}
+        try:
+            error = json_io.loads(resp.content).get("message")
+        except (json.JSONDecodeError, AttributeError):
+            error = None
+        return {"success": False, "error": error or f"HTTP {resp.status_code}"}
+
+    args = ["api", "-X", "PUT", api_path, "-f", f"message={message}", "-f", f"content={content_b64}"]
+    if sha:
+        args.extend(["-f", f"sha={sha}"])
+    result = run_gh_command(args)
+    if result["success"]:
+        return {"success": True}
+    return {"success": False, "error": result["error"]}
+
+
 def check_vibecheck_installed(owner, repo):
     """Check if vibecheck workflow is installed in a repo."""
-    result = run_gh_command(["api", f"/repos/{owner}/{repo}/contents/.github/workflows/vibecheck.yml"])
+    path = f"/repos/{owner}/{repo}/contents/{VIBECHECK_WORKFLOW_PATH}"
+    resp = github_rest("HEAD", path)
+    if resp is not None:
+        return resp.status_code == 200
+    result = run_gh_command(["api", path])
     return result["success"]
 
 
 def check_vibecheck_installed_batch(owner, repos, max_workers=10):
-    """Check vibecheck status for multiple repos in parallel."""
-    # Check cache first
-    cached = get_cached_vibecheck_status()
-    if cached:
-        print(f"[PERF] Using cached vibecheck status for {len(cached)} repos")
-        return cached
-    
-    print(f"[PERF] Checking vibecheck status for {len(repos)} repos in parallel...")
+    """Check vibecheck status for multiple repos.
+
+    Repos checked within VIBECHECK_STATUS_TTL are answered from the status
+    cache; only the rest are probed.
+    """
+    names = [r["name"] for r in repos]
+    status_dict = get_cached_vibecheck_status(names) or {}
+    stale = [name for name in names if name not in status_dict]
+    if not stale:
+        print(f"[PERF] Using cached vibecheck status for {len(status_dict)} repos")
+        return status_dict
+
+    print(f"[PERF] Checking vibecheck status for {len(stale)} of {len(names)} repos...")
     start = time.time()
-    
-    status_dict = {}
-    
-    def check_single(repo_name):
-        return repo_name, check_vibecheck_installed(owner, repo_name)
-    
-    # Use thread pool for parallel execution
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(check_single, r["name"]): r["name"] for r in repos}
-        for future in as_completed(futures):
-            repo_name, installed = future.result()
-            status_dict[repo_name] = installed
-    
+
+    # One GraphQL probe for every stale repo; per-repo checks only if it fails
+    checked = probe_vibecheck_installed(owner, stale)
+
+    if checked is None:
+        checked = {}
+
+        def check_single(repo_name):
+            return repo_name, check_vibecheck_installed(owner, repo_name)
+
+        # Use thread pool for parallel execution
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(check_single, name): name for name in stale}
+            for future in as_completed(futures):
+                repo_name, installed = future.result()
+                checked[repo_name] = installed
+
     elapsed = time.time() - start
-    print(f"[PERF] Checked {len(repos)} repos in {elapsed:.2f}s")
-    
-    # Cache the results
-    set_cached_vibecheck_status(status_dict)
-    
+    print(f"[PERF] Checked {len(stale)} repos in {elapsed:.2f}s")
+
+    set_cached_vibecheck_status(checked)
+    status_dict.update(checked)
     return status_dict
 
 
+# ============ GraphQL batching ============
+
+# Repos per batch_repo_query document; each pulls up to 60 PR/issue nodes with
+# nested labels, so larger documents risk GitHub's query complexity limits
+GRAPHQL_BATCH_SIZE = 25
+# Long-lived pool for batch chunks; chunk fetchers only call run_gh_graphql,
+# never _in_batches, so they can't block waiting on their own pool
+_BATCH_POOL = ThreadPoolExecutor(max_workers=GH_MAX_CONCURRENCY, thread_name_prefix="gh-batch")
+
+# Per-repo selection used by batch_repo_query. Field names are chosen so that
+# nodes can be flattened into the same shape `gh pr list` / `gh issue list` emit.
+_REPO_BATCH_SELECTION = """
+    vibecheck: object(expression: "HEAD:.github/workflows/vibecheck.yml") { __typename }
+    pullRequests(first: 30, states: OPEN, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes {
+        number title state createdAt url headRefName isDraft reviewDecision
+        author { login }
+        labels(first: 20) { nodes { name } }
+      }
+    }
+    issues(first: 30, states: OPEN, labels: ["vibeCheck"], orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes {
+        number title state createdAt url
+        labels(first: 20) { nodes { name } }
+        assignees(first: 10) { nodes { login } }
+      }
+    }
+"""
+
+
+def _graphql_args(query, variables=None):
+    """Build `gh api graphql` args. Strings use -f; ints/bools use -F for typed values."""
+    args = ["api", "graphql", "-f", f"query={query}"]
+    for name, value in (variables or {}).items():
+        if isinstance(value, str):
+            args.extend(["-f", f"{name}={value}"])
+        else:
+            args.extend(["-F", f"{name}={json.dumps(value)}"])
+    return args
+
+
+def run_gh_graphql(query, variables=None, timeout=30):
+    """Run a GraphQL query via `gh api graphql`. Returns the "data" dict or None."""
+    result = run_gh_command(_graphql_args(query, variables), timeout=timeout)
+    if not result["success"]:
+        return None
+    try:
+        return json_io.loads(result["output"]).get("data")
+    except (json.JSONDecodeError, AttributeError):
+        return None
+
+
+def _flatten_connections(node):
+    """Replace GraphQL `{nodes: [...]}` connections with plain lists (gh CLI shape)."""
+    for key, value in node.items():
+        if isinstance(value, dict) and "nodes" in value:
+            node[key] = value["nodes"]
+    return node
+
+
+def batch_repo_query(owner, repo_names):
+    """Fetch vibecheck status, open PRs and vibeCheck issues for many repos at once.
+
+    Builds aliased GraphQL documents (r0, r1, ...) of up to GRAPHQL_BATCH_SIZE
+    repos each, so the whole set costs a few concurrent `gh` subprocesses
+    instead of one per repo per resource.
+
+    Returns:
+        {repo_name: {"vibecheckInstalled": bool, "prs": [...], "issues": [...]}},
+        or None if any query failed (callers fall back to the per-repo path).
+    """
+    return _in_batches(list(repo_names), lambda chunk: _batch_repo_query_chunk(owner, chunk))
+
+
+def _in_batches(items, fetch_chunk):
+    """Run an aliased GraphQL batch over items in chunks of GRAPHQL_BATCH_SIZE.
+
+    One oversized document would trip GitHub's node and complexity limits and
+    send every caller down its per-item fallback, so larger sets are split and
+    the chunks run concurrently. fetch_chunk(chunk) returns a results dict or
+    None; the merged dict is returned, or None if any chunk failed.
+    """
+    if not items:
+        return {}
+
+    chunks = [items[i:i + GRAPHQL_BATCH_SIZE] for i in range(0, len(items), GRAPHQL_BATCH_SIZE)]
+    if len(chunks) == 1:
+        return fetch_chunk(chunks[0])
+
+    chunk_results = list(_BATCH_POOL.map(fetch_chunk, chunks))
+    if any(r is None for r in chunk_results):
+        return None
+    results = {}
+    for chunk_result in chunk_results:
+        results.update(chunk_result)
+    return results
+
+
+def _batch_repo_query_chunk(owner, repo_names):
+    """Run one aliased batch_repo_query document. Returns the results dict or None."""
+    aliases = []
+    for i, name in enumerate(repo_names):
+        aliases.append(
+            f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{{_REPO_BATCH_SELECTION}}}"
+        )
+    data = run_gh_graphql("query {\n" + "\n".join(aliases) + "\n}", timeout=60)
+    if data is None:
+        return None
+
+    results = {}
+    for i, name in enumerate(repo_names):
+        repo_data = data.get(f"r{i}")
+        if not repo_data:
+            continue
+        results[name] = {
+            "vibecheckInstalled": repo_data.get("vibecheck") is not None,
+            "prs": [_flatten_connections(pr) for pr in repo_data["pullRequests"]["nodes"]],
+            "issues": [_flatten_connections(issue) for issue in repo_data["issues"]["nodes"]],
+        }
+    return results
+
+
+_OPEN_PRS_SELECTION = """
+    pullRequests(first: 30, states: OPEN, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes { number title url headRefName additions deletions changedFiles reviewDecision isDraft createdAt }
+    }
+"""
+
+
+def batch_open_prs(owner, repo_names):
+    """Fetch open PRs for many of one owner's repos with batched aliased GraphQL queries.
+
+    PR fields match `gh pr list --json number,title,url,headRefName,additions,
+    deletions,changedFiles,reviewDecision,isDraft,createdAt`.
+
+    Returns:
+        {repo_name: [pr, ...]}, or None if any query failed. Repos that
+        couldn't be resolved are left out.
+    """
+    return _in_batches(list(repo_names), lambda chunk: _batch_open_prs_chunk(owner, chunk))
+
+
+def _batch_open_prs_chunk(owner, repo_names):
+    """Run one aliased batch_open_prs document. Returns the results dict or None."""
+    aliases = [
+        f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{{_OPEN_PRS_SELECTION}}}"
+        for i, name in enumerate(repo_names)
+    ]
+    data = run_gh_graphql("query {\n" + "\n".join(aliases) + "\n}")
+    if data is None:
+        return None
+
+    results = {}
+    for i, name in enumerate(repo_names):
+        repo_data = data.get(f"r{i}")
+        if repo_data:
+            results[name] = repo_data["pullRequests"]["nodes"]
+    return results
+
+
+_REPO_META_SELECTION = """
+    stargazerCount
+    primaryLanguage { name }
+    licenseInfo { spdxId }
+    issues(states: OPEN) { totalCount }
+    pullRequests(states: OPEN) { totalCount }
+"""
+
+
+def batch_repo_metadata(repos):
+    """Fetch basic metadata for many (owner, repo) pairs with batched aliased GraphQL queries.
+
+    The meta dicts match the `gh api /repos/{owner}/{repo}` projection used by
+    Stage 1: stars, language, license, openIssueCount (issues + PRs, like
+    REST's open_issues_count) and hasContributing.
+
+    Returns:
+        {(owner, repo): meta}, or None if any query failed. Repos that
+        couldn't be resolved are left out.
+    """
+    return _in_batches(list(repos), _batch_repo_metadata_chunk)
+
+
+def _batch_repo_metadata_chunk(repos):
+    """Run one aliased batch_repo_metadata document. Returns the results dict or None."""
+    aliases = [
+        f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{{_REPO_META_SELECTION}}}"
+        for i, (owner, name) in enumerate(repos)
+    ]
+    data = run_gh_graphql("query {\n" + "\n".join(aliases) + "\n}")
+    if data is None:
+        return None
+
+    results = {}
+    for i, ref in enumerate(repos):
+        repo_data = data.get(f"r{i}")
+        if not repo_data:
+            continue
+        results[ref] = {
+            "stars": repo_data["stargazerCount"],
+            "language": (repo_data.get("primaryLanguage") or {}).get("name"),
+            "license": (repo_data.get("licenseInfo") or {}).get("spdxId"),
+            "openIssueCount": repo_data["issues"]["totalCount"] + repo_data["pullRequests"]["totalCount"],
+            "hasContributing": False,
+        }
+    return results
+
+
+def batch_repo_issues(repos, label, limit=30):
+    """Fetch open issues with one label for many (owner, repo) pairs with batched GraphQL queries.
+
+    Issues match `gh issue list --json number,title,url,labels,createdAt,
+    updatedAt,comments,assignees`, except comments is a count.
+
+    Returns:
+        {(owner, repo): [issue, ...]}, or None if any query failed. Repos that
+        couldn't be resolved are left out.
+    """
+    return _in_batches(list(repos), lambda chunk: _batch_repo_issues_chunk(chunk, label, limit))
+
+
+def _batch_repo_issues_chunk(repos, label, limit):
+    """Run one aliased batch_repo_issues document. Returns the results dict or None."""
+    selection = (
+        f"issues(first: {int(limit)}, states: OPEN, labels: [{json.dumps(label)}],"
+        " orderBy: {field: CREATED_AT, direction: DESC}) { nodes {"
+        " number title url createdAt updatedAt comments { totalCount }"
+        " labels(first: 20) { nodes { name } } assignees(first: 10) { nodes { login } } } }"
+    )
+    aliases = [
+        f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ {selection} }}"
+        for i, (owner, name) in enumerate(repos)
+    ]
+    data = run_gh_graphql("query {\n" + "\n".join(aliases) + "\n}", timeout=60)
+    if data is None:
+        return None
+
+    results = {}
+    for i, ref in enumerate(repos):
+        repo_data = data.get(f"r{i}")
+        if not repo_data:
+            continue
+        issues = []
+        for issue in repo_data["issues"]["nodes"]:
+            issue["comments"] = issue["comments"]["totalCount"]
+            issues.append(_flatten_connections(issue))
+        results[ref] = issues
+    return results
+
+
+def batch_pr_comments(owner, pr_refs, last=20):
+    """Fetch the latest comments for many PRs with batched aliased GraphQL queries.
+
+    Args:
+        pr_refs: iterable of (repo_name, pr_number) pairs.
+
+    Returns:
+        {(repo_name, pr_number): [{"body": ...}, ...]}, or None if any query
+        failed. PRs that couldn't be resolved are left out.
+    """
+    return _in_batches(list(pr_refs), lambda chunk: _batch_pr_comments_chunk(owner, chunk, last))
+
+
+def _batch_pr_comments_chunk(owner, pr_refs, last):
+    """Run one aliased batch_pr_comments document. Returns the results dict or None."""
+    aliases = []
+    for i, (name, number) in enumerate(pr_refs):
+        aliases.append(
+            f"p{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{"
+            f" pullRequest(number: {int(number)}) {{ comments(last: {int(last)}) {{ nodes {{ body }} }} }} }}"
+        )
+    data = run_gh_graphql("query {\n" + "\n".join(aliases) + "\n}")
+    if data is None:
+        return None
+
+    results = {}
+    for i, ref in enumerate(pr_refs):
+        pr = (data.get(f"p{i}") or {}).get("pullRequest")
+        if pr:
+            results[ref] = pr["comments"]["nodes"]
+    return results
+
+
+def batch_pr_states(pr_refs):
+    """Fetch state, review decision and merge/close times for many PRs with batched GraphQL queries.
+
+    Args:
+        pr_refs: iterable of (owner, repo_name, pr_number) triples; owners may differ.
+
+    Returns:
+        {(owner, repo_name, pr_number): {"state", "reviewDecision", "mergedAt",
+        "closedAt"}} with `gh pr view --json` values, or None if any query
+        failed. PRs that couldn't be resolved are left out.
+    """
+    return _in_batches(list(pr_refs), _batch_pr_states_chunk)
+
+
+def _batch_pr_states_chunk(pr_refs):
+    """Run one aliased batch_pr_states document. Returns the results dict or None."""
+    aliases = [
+        f"p{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{"
+        f" pullRequest(number: {int(number)}) {{ state reviewDecision mergedAt closedAt }} }}"
+        for i, (owner, name, number) in enumerate(pr_refs)
+    ]
+    data = run_gh_graphql("query {\n" + "\n".join(aliases) + "\n}")
+    if data is None:
+        return None
+
+    results = {}
+    for i, ref in enumerate(pr_refs):
+        pr = (data.get(f"p{i}") or {}).get("pullRequest")
+        if pr:
+            results[ref] = pr
+    return results
+
+
+def batch_commit_counts(owner, since_by_repo):
+    """Count default-branch commits since a per-repo timestamp with batched GraphQL queries.
+
+    Args:
+        since_by_repo: {repo_name: ISO 8601 timestamp}.
+
+    Returns:
+        {repo_name: int}, or None if any query failed. Repos that couldn't be
+        resolved (or have no default branch) are left out.
+    """
+    return _in_batches(list(since_by_repo), lambda chunk: _batch_commit_counts_chunk(owner, chunk, since_by_repo))
+
+
+def _batch_commit_counts_chunk(owner, repo_names, since_by_repo):
+    """Run one aliased batch_commit_counts document. Returns the results dict or None."""
+    aliases = [
+        f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{"
+        f" defaultBranchRef {{ target {{ ... on Commit {{"
+        f" history(since: {json.dumps(since_by_repo[name])}) {{ totalCount }} }} }} }} }}"
+        for i, name in enumerate(repo_names)
+    ]
+    data = run_gh_graphql("query {\n" + "\n".join(aliases) + "\n}")
+    if data is None:
+        return None
+
+    results = {}
+    for i, name in enumerate(repo_names):
+        branch = (data.get(f"r{i}") or {}).get("defaultBranchRef") or {}
+        history = (branch.get("target") or {}).get("history")
+        if history:
+            results[name] = history["totalCount"]
+    return results
+
+
+def probe_vibecheck_installed(owner, repo_names):
+    """Check which repos have the vibecheck workflow with batched aliased GraphQL queries.
+
+    Returns {repo_name: bool}, or None if any query failed. Repos that couldn't
+    be resolved are reported as not installed.
+    """
+    return _in_batches(list(repo_names), lambda chunk: _probe_vibecheck_installed_chunk(owner, chunk))
+
+
+def _probe_vibecheck_installed_chunk(owner, repo_names):
+    """Run one aliased probe_vibecheck_installed document. Returns the results dict or None."""
+    aliases = [
+        f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{"
+        f' object(expression: "HEAD:{VIBECHECK_WORKFLOW_PATH}") {{ __typename }} }}'
+        for i, name in enumerate(repo_names)
+    ]
+    data = run_gh_graphql("query {\n" + "\n".join(aliases) + "\n}", timeout=60)
+    if data is None:
+        return None
+
+    return {
+        name: ((data.get(f"r{i}") or {}).get("object") is not None)
+        for i, name in enumerate(repo_names)
+    }
+
+
+_PR_MERGE_INFO_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      id isDraft isCrossRepository headRefName baseRefName title
+    }
+  }
+}
+"""
+
+
+def merge_pull_request(owner, repo, pr_number, merge_method="SQUASH", delete_branch=False):
+    """Merge a PR, marking it ready for review first if it is a draft.
+
+    Looks up the PR once, then sends the ready-for-review and merge steps as
+    one GraphQL mutation (mutation fields run in order). The head branch is
+    deleted afterwards only if the merge succeeded.
+
+    Returns:
+        {"success": bool, "error": str (on failure), "pr": {headRefName, baseRefName, title, ...}}
+    """
+    data = run_gh_graphql(_PR_MERGE_INFO_QUERY, {"owner": owner, "name": repo, "number": int(pr_number)})
+    pr = ((data or {}).get("repository") or {}).get("pullRequest")
+    if not pr:
+        return {"success": False, "error": f"Could not find PR #{pr_number} in {owner}/{repo}", "pr": {}}
+
+    steps = []
+    if pr.get("isDraft"):
+        steps.append("ready: markPullRequestReadyForReview(input: {pullRequestId: $id}) { clientMutationId }")
+    steps.append(f"merge: mergePullRequest(input: {{pullRequestId: $id, mergeMethod: {merge_method}}}) {{ pullRequest {{ merged }} }}")
+    mutation = "mutation($id: ID!) {\n  " + "\n  ".join(steps) + "\n}"
+
+    # Merge can take a while, use longer timeout (60s)
+    result = run_gh_command(_graphql_args(mutation, {"id": pr["id"]}), timeout=60)
+    if not result["success"]:
+        return {"success": False, "error": result.get("error", "Merge failed"), "pr": pr}
+
+    if delete_branch and not pr.get("isCrossRepository") and pr.get("headRefName"):
+        ref_path = f"/repos/{owner}/{repo}/git/refs/heads/{pr['headRefName']}"
+        if github_rest("DELETE", ref_path) is None:
+            run_gh_command(["api", "-X", "DELETE", ref_path])
+
+    return {"success": True, "pr": pr}
+
+
 def get_repo_context():
-    """Get common repo context: (owner, repos, status_dict)."""
+    """Get common repo context: (owner, repos, status_dict).
+
+    Memoized per owner for CONTEXT_TTL seconds so sibling stage endpoints
+    fired by one dashboard render share a single repo list + status check.
+    Those endpoints arrive together, so a cold build is done by the first
+    caller while the others wait for its result.
+    """
     owner = get_authenticated_user()
-    repos = get_repos()
-    status_dict = check_vibecheck_installed_batch(owner, repos) if repos else {}
-    return owner, repos, status_dict
+    key = f"context:{owner}"
+    cached = get_memoized(key, CONTEXT_TTL)
+    if cached is not None:
+        return cached
+    with _context_lock:
+        cached = get_memoized(key, CONTEXT_TTL)
+        if cached is not None:
+            return cached
+        repos = get_repos()
+        status_dict = check_vibecheck_installed_batch(owner, repos) if repos else {}
+        context = (owner, repos, status_dict)
+        set_memoized(key, context)
+        return context
@@ -0,0 +1,38 @@
+"""
+JSON helpers — orjson when it is installed, stdlib json otherwise.
+
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+catching json.JSONDecodeError regardless of which parser is active.
+"""
+
+import json
+
+from flask import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def loads(data):
+    """Parse JSON from str, bytes or a bytes-like buffer (bytearray, memoryview)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if not isinstance(data, (str, bytes)):
+        data = bytes(data)
+    return json.loads(data)
+
+
+def dumps(obj, pretty=False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes (compact, or 2-space indented if pretty)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def json_response(obj, status=200):
+    """Build a JSON Flask response without going through jsonify's encoder."""
+    return Response(dumps(obj), status=status, mimetype="application/json")
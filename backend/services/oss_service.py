@@ -6,37 +6,115 @@ and aggregator API communication.
 """
 
 import os
+import copy
 import json
 import time
+import queue
 import base64
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 
-from .cache import CACHE_DIR
+from .cache import CACHE_DIR, get_memoized, set_memoized
+from . import json_io
 from .github_api import run_gh_command, get_authenticated_user
 
 # ============ Constants ============
 
 OSS_DATA_DIR = os.path.join(CACHE_DIR, "oss")
+os.makedirs(OSS_DATA_DIR, exist_ok=True)
 AGGREGATOR_API_URL = os.environ.get("AGGREGATOR_API_URL", "")
+# Tracking files are written compact; DEBUG_PRETTY=1 indents them for hand inspection
+DEBUG_PRETTY = os.environ.get("DEBUG_PRETTY") == "1"
+# Forks whose latest work ended upstream this long ago drop out of Stage 4
+ACTIVE_FORK_GRACE_DAYS = 7
+# Shared keep-alive session for aggregator calls, so each call reuses a pooled
+# connection instead of paying a fresh TCP + TLS handshake
+_agg_session = requests.Session()
+_agg_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+_agg_session.mount("https://", _agg_adapter)
+_agg_session.mount("http://", _agg_adapter)
+# Dossiers are heavy aggregator reads that change slowly; reuse them across Stage 3 selects
+DOSSIER_TTL = 600
 
 
 # ============ Private Helpers ============
 
+# Raw tracking-file bytes and (origin_slug, issue_number) lookups over them, keyed by
+# path. Each entry carries the file's stat signature so outside edits are picked up too.
+_json_cache = {}
+_issue_indexes = {}
+
+
+def _file_signature(path):
+    """Return (mtime_ns, size) for a file, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
 def _load_json(filename):
-    """Load a JSON file from the OSS data directory. Returns [] if missing."""
+    """Load a JSON file from the OSS data directory. Returns [] if missing.
+
+    The file's bytes are reused until its stat signature changes, so repeat
+    loads skip the read. Each call parses afresh, so callers own the result
+    and may edit items, append or filter before a save.
+    """
     path = os.path.join(OSS_DATA_DIR, filename)
-    if os.path.exists(path):
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
-    return []
+    signature = _file_signature(path)
+    if signature is None:
+        return []
+    cached = _json_cache.get(path)
+    if cached and cached[0] == signature:
+        return json_io.loads(cached[1])
+    with open(path, "rb") as f:
+        raw = f.read()
+    _json_cache[path] = (signature, raw)
+    return json_io.loads(raw)
 
 
 def _save_json(filename, data):
-    """Save data as JSON to the OSS data directory."""
-    os.makedirs(OSS_DATA_DIR, exist_ok=True)
+    """Save data as JSON to the OSS data directory.
+
+    Written to a temp file and renamed into place, so a crash mid-write never
+    leaves a truncated tracking file behind.
+    """
     path = os.path.join(OSS_DATA_DIR, filename)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    body = json_io.dumps(data, pretty=DEBUG_PRETTY)
+    try:
+        f = open(tmp_path, "wb")
+    except FileNotFoundError:
+        os.makedirs(OSS_DATA_DIR, exist_ok=True)
+        f = open(tmp_path, "wb")
+    try:
+        with f:
+            f.write(body)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    _json_cache.pop(path, None)
+    _issue_indexes.pop(path, None)
+
+
+def _load_issue_index(filename):
+    """Index a tracking file's items by (origin_slug, issue_number). First match wins."""
+    path = os.path.join(OSS_DATA_DIR, filename)
+    signature = _file_signature(path)
+    cached = _issue_indexes.get(path)
+    if cached and cached[0] == signature:
+        return cached[1]
+    index = {}
+    for item in _load_json(filename):
+        index.setdefault((item["origin_slug"], item["issue_number"]), item)
+    _issue_indexes[path] = (signature, index)
+    return index
 
 
 def _call_aggregator(endpoint, method="GET", data=None, timeout=10):
@@ -46,9 +124,9 @@ def _call_aggregator(endpoint, method="GET", data=None, timeout=10):
     try:
         url = f"{AGGREGATOR_API_URL}{endpoint}"
         if method == "GET":
-            resp = requests.get(url, timeout=timeout)
+            resp = _agg_session.get(url, timeout=timeout)
         else:
-            resp = requests.post(url, json=data, timeout=timeout)
+            resp = _agg_session.post(url, json=data, timeout=timeout)
         if resp.ok:
             return resp.json()
         return None
@@ -56,6 +134,39 @@ def _call_aggregator(endpoint, method="GET", data=None, timeout=10):
         return None
 
 
+# ============ Background claim reports ============
+
+CLAIM_REPORT_ATTEMPTS = 3
+_claim_queue = queue.Queue()
+_claim_worker = None
+_claim_worker_lock = threading.Lock()
+
+
+def _drain_claim_reports():
+    """Worker loop: send queued claim reports, retrying failures with exponential backoff."""
+    while True:
+        report = _claim_queue.get()
+        try:
+            for attempt in range(CLAIM_REPORT_ATTEMPTS):
+                if OSSService().report_claim(*report):
+                    break
+                if attempt + 1 < CLAIM_REPORT_ATTEMPTS:
+                    time.sleep(2 ** attempt)
+        except Exception:
+            pass  # Best-effort — never kill the worker
+        finally:
+            _claim_queue.task_done()
+
+
+def _ensure_claim_worker():
+    """Start the claim report worker thread on first use."""
+    global _claim_worker
+    with _claim_worker_lock:
+        if _claim_worker is None:
+            _claim_worker = threading.Thread(target=_drain_claim_reports, name="claim-reports", daemon=True)
+            _claim_worker.start()
+
+
 # ============ OSSService ============
 
 class OSSService:
@@ -125,8 +236,20 @@ class OSSService:
         return []
 
     def get_dossier(self, slug):
-        """Get a repo dossier from the aggregator. Stub — returns None."""
-        return _call_aggregator(f"/recon/{slug}/dossier")
+        """Get a repo dossier from the aggregator, or None if it is unavailable.
+
+        Successful lookups are memoized for DOSSIER_TTL seconds; misses are
+        retried on the next call. Each caller gets its own copy of the dossier.
+        """
+        memo_key = f"dossier:{slug}"
+        cached = get_memoized(memo_key, DOSSIER_TTL)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        dossier = _call_aggregator(f"/recon/{slug}/dossier")
+        if dossier is not None:
+            set_memoized(memo_key, dossier)
+            return copy.deepcopy(dossier)
+        return None
 
     def trigger_refresh(self, slug):
         """Trigger a re-scrape for a repo. Stub — returns False."""
@@ -171,6 +294,44 @@ class OSSService:
         })
         _save_json("assignments.json", items)
 
+    def get_active_fork_repos(self):
+        """Get {(origin_slug, repo)} for forks that may still have open work.
+
+        Submitted PRs don't record which issue they fix, so each assignment is
+        paired, oldest first, with the earliest PR to its origin submitted after
+        it. A fork drops out only once every assignment on it is paired with a
+        merged or closed PR that ended more than ACTIVE_FORK_GRACE_DAYS ago; an
+        unpaired assignment or a paired PR that is still open keeps it in Stage 4.
+        """
+        assigned = {}
+        for a in self.get_assigned_issues():
+            assigned.setdefault((a["origin_slug"], a["repo"]), []).append(a.get("assigned_at", ""))
+
+        submitted = {}
+        for pr in self.get_submitted_prs():
+            ended_at = pr.get("merged_at") or pr.get("closed_at")
+            finished_at = ended_at if pr.get("state") in ("merged", "closed") and ended_at else None
+            # Older records lack submitted_at; the end time is the best bound we have
+            submitted_at = pr.get("submitted_at") or ended_at or ""
+            submitted.setdefault(pr.get("origin_slug", ""), []).append((submitted_at, finished_at))
+
+        cutoff = time.strftime(
+            "%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() - ACTIVE_FORK_GRACE_DAYS * 86400),
+        )
+        active = set()
+        for key, assigned_times in assigned.items():
+            prs = sorted(submitted.get(key[0], []), key=lambda p: p[0])
+            for assigned_at in sorted(assigned_times):
+                match = next((i for i, p in enumerate(prs) if p[0] >= assigned_at), None)
+                if match is None:
+                    active.add(key)
+                    break
+                finished_at = prs.pop(match)[1]
+                if finished_at is None or finished_at >= cutoff:
+                    active.add(key)
+                    break
+        return active
+
     def get_ready_to_submit(self):
         """Get items ready to submit upstream (merged fork PRs)."""
         return _load_json("ready-to-submit.json")
@@ -200,17 +361,22 @@ class OSSService:
 
     def save_submitted_pr(self, origin_slug, pr_url, title):
         """Record a PR submission to an upstream repo."""
-        # Parse PR number from URL (https://github.com/owner/repo/pull/123)
+        # Parse owner, repo and PR number from URL (https://github.com/owner/repo/pull/123)
+        # once here, so polling can address the PR without re-splitting the URL
+        parts = pr_url.rstrip("/").split("/")
         pr_number = None
         try:
-            pr_number = int(pr_url.rstrip("/").split("/")[-1])
+            pr_number = int(parts[-1])
         except (ValueError, IndexError):
             pass
+        repo_owner, repo_name = (parts[-4], parts[-3]) if len(parts) >= 5 and parts[-2] == "pull" else (None, None)
 
         items = self.get_submitted_prs()
         items.append({
             "origin_slug": origin_slug,
             "pr_url": pr_url,
+            "repo_owner": repo_owner,
+            "repo_name": repo_name,
             "pr_number": pr_number,
             "title": title,
             "state": "open",
@@ -243,13 +409,23 @@ class OSSService:
         result = run_gh_command(["repo", "view", f"{my_user}/{repo}", "--json", "name"])
         return result["success"]
 
-    def wait_for_fork(self, my_user, repo, timeout=60, interval=3):
-        """Poll until fork exists on GitHub. Returns True if ready, False on timeout."""
-        for _ in range(timeout // interval):
+    def wait_for_fork(self, my_user, repo, timeout=60, interval=8):
+        """Poll until fork exists on GitHub. Returns True if ready, False on timeout.
+
+        Forks are usually ready within a few seconds, so the wait between
+        checks starts at 1s and doubles up to `interval`.
+        """
+        delay = 1
+        waited = 0
+        while True:
             if self.check_fork_exists(my_user, repo):
                 return True
-            time.sleep(interval)
-        return False
+            if waited >= timeout:
+                return False
+            step = min(delay, interval, timeout - waited)
+            time.sleep(step)
+            waited += step
+            delay *= 2
 
     # --- Agent context ---
 
@@ -264,7 +440,7 @@ class OSSService:
         original_data = {}
         if original["success"]:
             try:
-                original_data = json.loads(original["output"])
+                original_data = json_io.loads(original["output"])
             except (json.JSONDecodeError, KeyError):
                 pass
 
@@ -331,11 +507,23 @@ Fix the issue described above. Your changes will be submitted as a PR to `{origi
         The conversion happens here — do not "fix" this by changing the stored format.
         """
         slug = origin_slug.replace("/", "-")
-        _call_aggregator(f"/recon/{slug}/claim", method="POST", data={
+        result = _call_aggregator(f"/recon/{slug}/claim", method="POST", data={
             "issueId": issue_id,
             "claimedBy": claimed_by,
             "forkIssueUrl": fork_issue_url,
         })
+        return result is not None
+
+    def queue_claim_report(self, origin_slug, issue_id, claimed_by, fork_issue_url):
+        """Report a claim from a background thread so the caller doesn't wait on the aggregator.
+
+        Failed reports are retried up to CLAIM_REPORT_ATTEMPTS times with backoff.
+        No-op when no aggregator is configured.
+        """
+        if not AGGREGATOR_API_URL:
+            return
+        _ensure_claim_worker()
+        _claim_queue.put((origin_slug, issue_id, claimed_by, fork_issue_url))
 
     def report_unclaim(self, origin_slug, issue_id):
         """Report an unclaim to the aggregator. Best-effort.
@@ -351,14 +539,16 @@ Fix the issue described above. Your changes will be submitted as a PR to `{origi
 
     def find_assignment(self, origin_slug, issue_number):
         """Check if an assignment already exists for this issue. Returns it or None."""
-        for a in self.get_assigned_issues():
-            if a["origin_slug"] == origin_slug and a["issue_number"] == issue_number:
-                return a
-        return None
+        return copy.deepcopy(_load_issue_index("assignments.json").get((origin_slug, issue_number)))
 
     def find_selected_issue(self, origin_slug, issue_number):
         """Check if an issue is already selected. Returns it or None."""
-        for item in self.get_selected_issues():
-            if item["origin_slug"] == origin_slug and item["issue_number"] == issue_number:
-                return item
-        return None
+        return copy.deepcopy(_load_issue_index("selected-issues.json").get((origin_slug, issue_number)))
+
+    def get_notified_go_issues(self):
+        """Get IDs of GO-tier issues already notified, oldest first."""
+        return _load_json("notified-go-issues.json")
+
+    def save_notified_go_issues(self, issue_ids):
+        """Write the notified GO-tier issue IDs (the caller keeps the list bounded)."""
+        _save_json("notified-go-issues.json", issue_ids)
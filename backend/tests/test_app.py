@@ -0,0 +1,106 @@
+"""Tests for app-level response handling and route handlers."""
+
+import gzip
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app import app
+
+
+@pytest.fixture
+def client():
+    """Create a Flask test client."""
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def disable_cache(monkeypatch):
+    """Disable caching for all route tests."""
+    monkeypatch.setattr("services.cache._CACHE_ENABLED", False)
+
+
+PREFIX = "/dispatch"
+
+
+class TestGzipResponse:
+    """Tests for the gzip after_request hook."""
+
+    @patch("routes.oss_routes._call_aggregator", return_value=None)
+    @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
+    @patch("routes.oss_routes.OSSService")
+    def _get_large(self, client, headers, mock_svc_cls, _mock_user, _mock_agg):
+        mock_svc_cls.return_value.get_watchlist.return_value = [f"owner/repo-{i}" for i in range(200)]
+        return client.get(f"{PREFIX}/api/oss/stage1-targets", headers=headers)
+
+    def test_compresses_large_json_when_accepted(self, client):
+        resp = self._get_large(client, {"Accept-Encoding": "gzip, deflate"})
+
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in resp.headers["Vary"]
+        assert b"owner/repo-199" in gzip.decompress(resp.data)
+
+    def test_leaves_response_alone_without_accept_encoding(self, client):
+        resp = self._get_large(client, {})
+
+        assert "Content-Encoding" not in resp.headers
+        assert b"owner/repo-199" in resp.data
+
+    def test_small_responses_not_compressed(self, client):
+        resp = client.get("/", headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in resp.headers
+
+
+class TestMergePR:
+    """Tests for POST /api/merge-pr."""
+
+    @patch("routes.action_routes.merge_pull_request")
+    @patch("routes.action_routes.run_gh_command")
+    def test_known_ready_pr_merges_without_lookup(self, mock_gh, mock_merge, client):
+        mock_gh.return_value = {"success": True, "output": ""}
+
+        resp = client.post(f"{PREFIX}/api/merge-pr", json={
+            "owner": "o", "repo": "r", "pr_number": 5, "is_draft": False,
+        })
+
+        assert resp.get_json()["success"] is True
+        mock_merge.assert_not_called()
+
+    @patch("routes.action_routes.merge_pull_request", return_value={"success": True})
+    @patch("routes.action_routes.run_gh_command")
+    def test_stale_ready_flag_retries_through_draft_aware_merge(self, mock_gh, mock_merge, client):
+        mock_gh.return_value = {"success": False, "error": "Pull request o/r#5 is still a draft"}
+
+        resp = client.post(f"{PREFIX}/api/merge-pr", json={
+            "owner": "o", "repo": "r", "pr_number": 5, "is_draft": False,
+        })
+
+        assert resp.get_json()["success"] is True
+        mock_merge.assert_called_once_with("o", "r", 5, delete_branch=True)
+
+
+class TestStage2Stream:
+    """Tests for GET /api/stage2-repos/stream."""
+
+    @patch("routes.pipeline_routes.count_commits_since")
+    @patch("routes.pipeline_routes.batch_commit_counts", return_value={"alpha": 4})
+    @patch("routes.pipeline_routes.get_workflow_runs")
+    @patch("routes.pipeline_routes.get_repo_context")
+    def test_cold_stream_batches_commit_counts(self, mock_ctx, mock_runs, mock_batch, mock_count, client):
+        mock_ctx.return_value = ("owner", [{"name": "alpha"}, {"name": "beta"}], {"alpha": True, "beta": True})
+        mock_runs.side_effect = lambda owner, name, wf: (
+            [{"createdAt": "2026-01-01T00:00:00Z"}] if name == "alpha" else []
+        )
+
+        resp = client.get(f"{PREFIX}/api/stage2-repos/stream")
+        lines = [json.loads(line) for line in resp.get_data(as_text=True).splitlines()]
+
+        assert lines[0] == {"owner": "owner"}
+        assert sorted(line["name"] for line in lines[1:3]) == ["alpha", "beta"]
+        assert lines[-1] == {"commitCounts": {"alpha": 4}}
+        mock_batch.assert_called_once_with("owner", {"alpha": "2026-01-01T00:00:00Z"})
+        mock_count.assert_not_called()
@@ -0,0 +1,171 @@
+"""Tests for the cached_endpoint decorator."""
+
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from app import app
+from services import cache
+from services.cache import cached_endpoint, clear_cache, set_cached
+
+
+@pytest.fixture(autouse=True)
+def temp_cache_dir(tmp_path, monkeypatch):
+    """Enable caching against a temp directory with no leftover encoded bodies."""
+    monkeypatch.setattr("services.cache._CACHE_ENABLED", True)
+    monkeypatch.setattr("services.cache.CACHE_DIR", str(tmp_path))
+    cache._encoded_responses.clear()
+    yield tmp_path
+    cache._encoded_responses.clear()
+
+
+def _counting_endpoint(key):
+    calls = []
+
+    @cached_endpoint(key)
+    def endpoint():
+        calls.append(1)
+        return {"success": True, "n": len(calls)}
+
+    return endpoint, calls
+
+
+class TestCachedEndpoint:
+    """Tests for in-memory reuse of encoded cached responses."""
+
+    def test_repeat_hit_skips_cache_file(self, monkeypatch):
+        endpoint, calls = _counting_endpoint("test-key")
+        with app.test_request_context():
+            first = endpoint()
+            monkeypatch.setattr("services.cache.get_cached", lambda *_: pytest.fail("file read on hot hit"))
+            second = endpoint()
+
+        assert len(calls) == 1
+        assert second.get_data() == first.get_data()
+        assert json.loads(second.get_data()) == {"success": True, "n": 1}
+
+    def test_clear_and_set_drop_encoded_body(self):
+        endpoint, calls = _counting_endpoint("test-key")
+        with app.test_request_context():
+            endpoint()
+            clear_cache("test-key")
+            assert json.loads(endpoint().get_data())["n"] == 2
+
+            set_cached("test-key", {"success": True, "n": 99})
+            assert json.loads(endpoint().get_data())["n"] == 99
+        assert len(calls) == 2
+
+    def test_concurrent_misses_compute_once(self):
+        calls = []
+        started = threading.Event()
+
+        @cached_endpoint("slow-key")
+        def endpoint():
+            calls.append(1)
+            started.set()
+            time.sleep(0.05)
+            return {"success": True}
+
+        def hit():
+            with app.test_request_context():
+                endpoint()
+
+        first = threading.Thread(target=hit)
+        first.start()
+        started.wait(1)
+        others = [threading.Thread(target=hit) for _ in range(3)]
+        for t in others:
+            t.start()
+        for t in [first, *others]:
+            t.join(1)
+
+        assert len(calls) == 1
+
+    def test_refresh_recomputes_and_serves_new_body(self):
+        endpoint, calls = _counting_endpoint("test-key")
+        with app.test_request_context():
+            endpoint()
+            endpoint.refresh()
+            assert json.loads(endpoint().get_data())["n"] == 2
+        assert len(calls) == 2
+
+    def test_file_hit_serves_stored_body_without_parsing(self, monkeypatch):
+        endpoint, calls = _counting_endpoint("test-key")
+        with app.test_request_context():
+            first = endpoint()
+            cache._encoded_responses.clear()
+            real_loads = cache.json_io.loads
+
+            def loads(data):
+                if data == first.get_data():
+                    pytest.fail("body parsed on hit")
+                return real_loads(data)
+
+            monkeypatch.setattr("services.cache.json_io.loads", loads)
+            second = endpoint()
+
+        assert len(calls) == 1
+        assert second.get_data() == first.get_data()
+
+    def test_entry_expires_by_file_mtime(self):
+        set_cached("test-key", {"success": True})
+        path = cache._get_cache_path("test-key")
+        assert cache.get_cached("test-key", 60) == {"success": True}
+
+        stale = time.time() - 2 * max(120, cache._get_ttl())
+        os.utime(path, (stale, stale))
+        cache._encoded_responses.clear()
+        assert cache.get_cached("test-key", 60) is None
+        assert cache.get_cache_stats()["expired_entries"] == 1
+
+    def test_memory_layer_serves_hits_and_evicts_oldest(self, monkeypatch):
+        monkeypatch.setattr("services.cache.MEMORY_CACHE_SIZE", 2)
+        set_cached("a", {"v": "a"})
+        set_cached("b", {"v": "b"})
+        os.remove(cache._get_cache_path("a"))
+        assert cache.get_cached("a") == {"v": "a"}
+
+        set_cached("c", {"v": "c"})
+        assert list(cache._encoded_responses) == ["a", "c"]
+
+    def test_large_entry_parsed_from_file_and_kept_out_of_memory(self, monkeypatch):
+        monkeypatch.setattr("services.cache.MMAP_THRESHOLD", 16)
+        data = {"items": list(range(50))}
+        set_cached("big", data)
+        cache._encoded_responses.clear()
+
+        assert cache.get_cached("big") == data
+        assert "big" not in cache._encoded_responses
+
+    def test_failed_write_keeps_previous_file(self, monkeypatch, temp_cache_dir):
+        set_cached("test-key", {"v": 1})
+
+        def fail_replace(*_):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("services.cache.os.replace", fail_replace)
+        set_cached("test-key", {"v": 2})
+        cache._encoded_responses.clear()
+
+        assert cache.get_cached("test-key") == {"v": 1}
+        assert not list(temp_cache_dir.glob("*.tmp"))
+
+
+class TestRefreshEnv:
+    """Tests for the once-read environment settings."""
+
+    def test_refresh_env_rereads_settings(self, monkeypatch):
+        monkeypatch.setenv("CACHE_DISABLED", "1")
+        monkeypatch.setenv("URL_PREFIX", "/dispatch")
+        monkeypatch.delenv("LOCAL_CACHE", raising=False)
+        monkeypatch.delenv("FLASK_ENV", raising=False)
+        try:
+            cache.refresh_env()
+            assert not cache._is_cache_enabled()
+            assert cache._get_ttl() == cache.DEFAULT_TTL
+        finally:
+            monkeypatch.undo()
+            cache.refresh_env()
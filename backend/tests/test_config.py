@@ -0,0 +1,9 @@
+"""Tests for configuration constants."""
+
+import base64
+
+from config import VIBECHECK_WORKFLOW, VIBECHECK_WORKFLOW_B64
+
+
+def test_workflow_b64_matches_template():
+    assert base64.b64decode(VIBECHECK_WORKFLOW_B64).decode("utf-8") == VIBECHECK_WORKFLOW
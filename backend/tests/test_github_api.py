@@ -0,0 +1,674 @@
+"""Tests for GitHub API service helpers — GraphQL batching and merges."""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.github_api import (
+    GRAPHQL_BATCH_SIZE,
+    _rest_etags,
+    batch_commit_counts,
+    batch_pr_comments,
+    batch_pr_states,
+    batch_repo_issues,
+    batch_repo_metadata,
+    batch_repo_query,
+    check_vibecheck_installed_batch,
+    count_commits_since,
+    get_repo_context,
+    get_repo_issues,
+    get_repo_prs_cached,
+    get_repos,
+    get_workflow_runs,
+    merge_pull_request,
+    probe_vibecheck_installed,
+    put_repo_contents,
+    run_gh_command,
+    stream_gh_command,
+)
+from services import cache, github_api
+from services.cache import clear_memoized, clear_vibecheck_cache
+
+
+def _completed(returncode, stdout="", stderr=""):
+    return MagicMock(returncode=returncode, stdout=stdout, stderr=stderr)
+
+
+class TestRunGhCommand:
+    """Tests for run_gh_command rate-limit retries."""
+
+    @patch("services.github_api.time.sleep")
+    @patch("services.github_api.subprocess.run")
+    def test_retries_after_rate_limit(self, mock_run, mock_sleep):
+        mock_run.side_effect = [
+            _completed(1, stderr="HTTP 403: API rate limit exceeded for user"),
+            _completed(0, stdout="ok"),
+        ]
+
+        result = run_gh_command(["api", "user"])
+
+        assert result == {"success": True, "output": "ok"}
+        assert mock_run.call_count == 2
+        assert mock_sleep.call_count == 1
+
+    @patch("services.github_api.time.sleep")
+    @patch("services.github_api.subprocess.run")
+    def test_other_errors_are_not_retried(self, mock_run, mock_sleep):
+        mock_run.return_value = _completed(1, stderr="Not Found")
+
+        result = run_gh_command(["api", "user"])
+
+        assert result["success"] is False
+        assert mock_run.call_count == 1
+        mock_sleep.assert_not_called()
+
+
+class TestStreamGhCommand:
+    """Tests for stream_gh_command's use of the shared gh slots."""
+
+    @patch("services.github_api.subprocess.Popen")
+    def test_holds_slot_until_consumer_stops(self, mock_popen):
+        proc = MagicMock()
+        proc.stdout.read1.side_effect = [b"diff", b""]
+        proc.poll.return_value = 0
+        mock_popen.return_value = proc
+        slots = threading.BoundedSemaphore(1)
+
+        with patch.object(github_api, "_gh_slots", slots):
+            stream = stream_gh_command(["pr", "diff", "1"])
+            assert next(stream) == b"diff"
+            assert not slots.acquire(blocking=False)
+            stream.close()
+            assert slots.acquire(blocking=False)
+
+    @patch("services.github_api.subprocess.Popen", side_effect=OSError)
+    def test_releases_slot_when_gh_cannot_start(self, mock_popen):
+        slots = threading.BoundedSemaphore(1)
+
+        with patch.object(github_api, "_gh_slots", slots):
+            assert list(stream_gh_command(["pr", "diff", "1"])) == []
+            assert slots.acquire(blocking=False)
+
+
+class TestBatchRepoQuery:
+    """Tests for batch_repo_query (aliased GraphQL fetch across repos)."""
+
+    @patch("services.github_api.run_gh_command")
+    def test_empty_repo_list_skips_gh(self, mock_gh):
+        assert batch_repo_query("testuser", []) == {}
+        mock_gh.assert_not_called()
+
+    @patch("services.github_api.run_gh_command")
+    def test_single_call_for_all_repos(self, mock_gh):
+        mock_gh.return_value = {"success": True, "output": json.dumps({"data": {
+            "r0": {"vibecheck": {"__typename": "Blob"}, "pullRequests": {"nodes": []}, "issues": {"nodes": []}},
+            "r1": {"vibecheck": None, "pullRequests": {"nodes": []}, "issues": {"nodes": []}},
+        }})}
+
+        result = batch_repo_query("testuser", ["alpha", "beta"])
+
+        assert mock_gh.call_count == 1
+        query = mock_gh.call_args[0][0][3]
+        assert 'r0: repository(owner: "testuser", name: "alpha")' in query
+        assert 'r1: repository(owner: "testuser", name: "beta")' in query
+        assert result["alpha"]["vibecheckInstalled"] is True
+        assert result["beta"]["vibecheckInstalled"] is False
+
+    @patch("services.github_api.run_gh_command")
+    def test_flattens_nodes_to_gh_cli_shape(self, mock_gh):
+        mock_gh.return_value = {"success": True, "output": json.dumps({"data": {
+            "r0": {
+                "vibecheck": None,
+                "pullRequests": {"nodes": [{
+                    "number": 7, "title": "Fix", "author": {"login": "Copilot"},
+                    "labels": {"nodes": [{"name": "demo"}]},
+                }]},
+                "issues": {"nodes": [{
+                    "number": 3, "title": "Bug",
+                    "labels": {"nodes": [{"name": "severity:high"}]},
+                    "assignees": {"nodes": [{"login": "someone"}]},
+                }]},
+            },
+        }})}
+
+        result = batch_repo_query("testuser", ["alpha"])
+
+        pr = result["alpha"]["prs"][0]
+        issue = result["alpha"]["issues"][0]
+        assert pr["labels"] == [{"name": "demo"}]
+        assert pr["author"] == {"login": "Copilot"}
+        assert issue["labels"] == [{"name": "severity:high"}]
+        assert issue["assignees"] == [{"login": "someone"}]
+
+    @patch("services.github_api.run_gh_command")
+    def test_returns_none_on_failure(self, mock_gh):
+        mock_gh.return_value = {"success": False, "error": "GraphQL: Could not resolve"}
+        assert batch_repo_query("testuser", ["alpha"]) is None
+
+    @patch("services.github_api.run_gh_command")
+    def test_large_repo_lists_are_split_into_batches(self, mock_gh):
+        def respond(args, timeout=30):
+            count = args[3].count("repository(")
+            return {"success": True, "output": json.dumps({"data": {
+                f"r{i}": {"vibecheck": None, "pullRequests": {"nodes": []}, "issues": {"nodes": []}}
+                for i in range(count)
+            }})}
+        mock_gh.side_effect = respond
+        names = [f"repo{i}" for i in range(GRAPHQL_BATCH_SIZE + 5)]
+
+        result = batch_repo_query("testuser", names)
+
+        assert mock_gh.call_count == 2
+        assert sorted(result) == sorted(names)
+
+
+class TestBatchRepoMetadata:
+    """Tests for batch_repo_metadata (Stage 1 metadata for many repos)."""
+
+    @patch("services.github_api.run_gh_command")
+    def test_maps_to_rest_projection(self, mock_gh):
+        mock_gh.return_value = {"success": True, "output": json.dumps({"data": {
+            "r0": {
+                "stargazerCount": 1000, "primaryLanguage": {"name": "JavaScript"},
+                "licenseInfo": {"spdxId": "MIT"},
+                "issues": {"totalCount": 40}, "pullRequests": {"totalCount": 2},
+            },
+            "r1": None,
+        }})}
+
+        result = batch_repo_metadata([("fastify", "fastify"), ("gone", "repo")])
+
+        assert mock_gh.call_count == 1
+        assert result == {("fastify", "fastify"): {
+            "stars": 1000, "language": "JavaScript", "license": "MIT",
+            "openIssueCount": 42, "hasContributing": False,
+        }}
+
+
+class TestBatchRepoIssues:
+    """Tests for batch_repo_issues (labelled open issues for many repos)."""
+
+    @patch("services.github_api.run_gh_command")
+    def test_flattens_to_gh_issue_list_shape(self, mock_gh):
+        mock_gh.return_value = {"success": True, "output": json.dumps({"data": {
+            "r0": {"issues": {"nodes": [{
+                "number": 1, "title": "Docs", "comments": {"totalCount": 3},
+                "labels": {"nodes": [{"name": "good first issue"}]},
+                "assignees": {"nodes": []},
+            }]}},
+        }})}
+
+        result = batch_repo_issues([("org", "repo")], "good first issue")
+
+        query = mock_gh.call_args[0][0][3]
+        assert 'labels: ["good first issue"]' in query
+        issue = result[("org", "repo")][0]
+        assert issue["comments"] == 3
+        assert issue["labels"] == [{"name": "good first issue"}]
+        assert issue["assignees"] == []
+
+    @patch("services.github_api.run_gh_command")
+    def test_returns_none_on_failure(self, mock_gh):
+        mock_gh.return_value = {"success": False, "error": "rate limited"}
+        assert batch_repo_issues([("org", "repo")], "good first issue") is None
+
+
+class TestProbeVibecheckInstalled:
+    """Tests for probe_vibecheck_installed (one GraphQL file probe for all repos)."""
+
+    @patch("services.github_api.run_gh_command")
+    def test_single_call_maps_object_presence(self, mock_gh):
+        mock_gh.return_value = {"success": True, "output": json.dumps({"data": {
+            "r0": {"object": {"__typename": "Blob"}},
+            "r1": {"object": None},
+            "r2": None,
+        }})}
+
+        result = probe_vibecheck_installed("testuser", ["alpha", "beta", "gone"])
+
+        assert mock_gh.call_count == 1
+        assert result == {"alpha": True, "beta": False, "gone": False}
+
+    @patch("services.github_api.run_gh_command")
+    def test_returns_none_on_failure(self, mock_gh):
+        mock_gh.return_value = {"success": False, "error": "rate limited"}
+        assert probe_vibecheck_installed("testuser", ["alpha"]) is None
+
+
+class TestBatchPrComments:
+    """Tests for batch_pr_comments (aliased comments fetch for many PRs)."""
+
+    @patch("services.github_api.run_gh_command")
+    def test_single_call_keyed_by_repo_and_number(self, mock_gh):
+        mock_gh.return_value = {"success": True, "output": json.dumps({"data": {
+            "p0": {"pullRequest": {"comments": {"nodes": [{"body": "Completed task"}]}}},
+            "p1": {"pullRequest": None},
+        }})}
+
+        result = batch_pr_comments("testuser", [("alpha", 3), ("beta", 9)])
+
+        assert mock_gh.call_count == 1
+        query = mock_gh.call_args[0][0][3]
+        assert "pullRequest(number: 3)" in query
+        assert "pullRequest(number: 9)" in query
+        assert result == {("alpha", 3): [{"body": "Completed task"}]}
+
+    @patch("services.github_api.run_gh_command")
+    def test_empty_refs_skip_gh(self, mock_gh):
+        assert batch_pr_comments("testuser", []) == {}
+        mock_gh.assert_not_called()
+
+
+class TestBatchPrStates:
+    """Tests for batch_pr_states (poll fields for PRs across owners)."""
+
+    @patch("services.github_api.run_gh_command")
+    def test_single_call_across_owners(self, mock_gh):
+        mock_gh.return_value = {"success": True, "output": json.dumps({"data": {
+            "p0": {"pullRequest": {"state": "MERGED", "reviewDecision": "APPROVED",
+                                   "mergedAt": "2026-02-19T12:00:00Z", "closedAt": None}},
+            "p1": None,
+        }})}
+
+        result = batch_pr_states([("fastify", "fastify", 100), ("vercel", "next.js", 200)])
+
+        assert mock_gh.call_count == 1
+        query = mock_gh.call_args[0][0][3]
+        assert 'repository(owner: "vercel", name: "next.js")' in query
+        assert result == {("fastify", "fastify", 100): {
+            "state": "MERGED", "reviewDecision": "APPROVED",
+            "mergedAt": "2026-02-19T12:00:00Z", "closedAt": None,
+        }}
+
+
+class TestBatchCommitCounts:
+    """Tests for batch_commit_counts (stage2 commits-since-last-run)."""
+
+    @patch("services.github_api.run_gh_command")
+    def test_counts_per_repo_in_one_query(self, mock_gh):
+        mock_gh.return_value = {"success": True, "output": json.dumps({"data": {
+            "r0": {"defaultBranchRef": {"target": {"history": {"totalCount": 4}}}},
+            "r1": {"defaultBranchRef": None},
+        }})}
+
+        result = batch_commit_counts("owner", {"a": "2026-01-01T00:00:00Z", "b": "2026-01-02T00:00:00Z"})
+
+        assert mock_gh.call_count == 1
+        assert 'history(since: "2026-01-01T00:00:00Z")' in mock_gh.call_args[0][0][3]
+        assert result == {"a": 4}
+
+    @patch("services.github_api.run_gh_command", return_value={"success": False, "error": "boom"})
+    def test_failure_returns_none(self, _mock_gh):
+        assert batch_commit_counts("owner", {"a": "2026-01-01T00:00:00Z"}) is None
+
+    @patch("services.github_api.run_gh_command")
+    def test_large_repo_sets_are_split_into_batches(self, mock_gh):
+        def respond(args, timeout=30):
+            count = args[3].count("repository(")
+            return {"success": True, "output": json.dumps({"data": {
+                f"r{i}": {"defaultBranchRef": {"target": {"history": {"totalCount": 1}}}}
+                for i in range(count)
+            }})}
+        mock_gh.side_effect = respond
+        since = {f"repo{i}": "2026-01-01T00:00:00Z" for i in range(GRAPHQL_BATCH_SIZE + 5)}
+
+        result = batch_commit_counts("owner", since)
+
+        assert mock_gh.call_count == 2
+        assert max(call[0][0][3].count("repository(") for call in mock_gh.call_args_list) == GRAPHQL_BATCH_SIZE
+        assert result == {name: 1 for name in since}
+
+    @patch("services.github_api.run_gh_command")
+    def test_any_failed_batch_fails_the_whole_set(self, mock_gh):
+        mock_gh.side_effect = lambda args, timeout=30: (
+            {"success": False, "error": "boom"} if "repo0" in args[3]
+            else {"success": True, "output": json.dumps({"data": {}})}
+        )
+        since = {f"repo{i}": "2026-01-01T00:00:00Z" for i in range(GRAPHQL_BATCH_SIZE + 5)}
+
+        assert batch_commit_counts("owner", since) is None
+
+
+def _pr_info(is_draft):
+    return {"success": True, "output": json.dumps({"data": {"repository": {"pullRequest": {
+        "id": "PR_node", "isDraft": is_draft, "isCrossRepository": False,
+        "headRefName": "fix-branch", "baseRefName": "main", "title": "Fix it",
+    }}}})}
+
+
+class TestMergePullRequest:
+    """Tests for merge_pull_request (lookup + single merge mutation)."""
+
+    @patch("services.github_api.github_rest", return_value=None)
+    @patch("services.github_api.run_gh_command")
+    def test_draft_pr_marked_ready_in_merge_mutation(self, mock_gh, _mock_rest):
+        mock_gh.side_effect = [_pr_info(True), {"success": True, "output": "{}"}]
+
+        result = merge_pull_request("owner", "repo", 5)
+
+        assert result["success"] is True
+        assert result["pr"]["headRefName"] == "fix-branch"
+        mutation = mock_gh.call_args_list[1][0][0][3]
+        assert "markPullRequestReadyForReview" in mutation
+        assert "mergePullRequest" in mutation
+        assert mock_gh.call_count == 2
+
+    @patch("services.github_api.github_rest", return_value=None)
+    @patch("services.github_api.run_gh_command")
+    def test_non_draft_pr_skips_ready_step(self, mock_gh, _mock_rest):
+        mock_gh.side_effect = [_pr_info(False), {"success": True, "output": "{}"}]
+
+        merge_pull_request("owner", "repo", 5)
+
+        mutation = mock_gh.call_args_list[1][0][0][3]
+        assert "markPullRequestReadyForReview" not in mutation
+
+    @patch("services.github_api.github_rest", return_value=None)
+    @patch("services.github_api.run_gh_command")
+    def test_deletes_branch_only_after_successful_merge(self, mock_gh, _mock_rest):
+        mock_gh.side_effect = [_pr_info(False), {"success": False, "error": "not mergeable"}]
+
+        result = merge_pull_request("owner", "repo", 5, delete_branch=True)
+
+        assert result["success"] is False
+        assert "not mergeable" in result["error"]
+        assert mock_gh.call_count == 2
+
+    @patch("services.github_api.run_gh_command")
+    def test_missing_pr_returns_error(self, mock_gh):
+        mock_gh.return_value = {"success": False, "error": "Could not resolve"}
+
+        result = merge_pull_request("owner", "repo", 5)
+
+        assert result["success"] is False
+        assert mock_gh.call_count == 1
+
+
+class TestCountCommitsSince:
+    """Tests for count_commits_since (per_page=1 + Link header last page)."""
+
+    @patch("services.github_api.github_rest", return_value=None)
+    @patch("services.github_api.run_gh_command")
+    def test_reads_count_from_last_page_link(self, mock_gh, _mock_rest):
+        mock_gh.return_value = {"success": True, "output": (
+            "HTTP/2.0 200 OK\r\n"
+            'Link: <https://api.github.com/repositories/1/commits?since=x&per_page=1&page=2>; rel="next", '
+            '<https://api.github.com/repositories/1/commits?since=x&per_page=1&page=42>; rel="last"\r\n'
+            "\r\n"
+            '[{"sha": "abc"}]'
+        )}
+
+        assert count_commits_since("owner", "repo", "2026-01-01T00:00:00Z") == 42
+        assert "since=2026-01-01T00:00:00Z&per_page=1" in mock_gh.call_args[0][0][1]
+
+    @patch("services.github_api.github_rest", return_value=None)
+    @patch("services.github_api.run_gh_command")
+    def test_single_page_counts_body(self, mock_gh, _mock_rest):
+        mock_gh.return_value = {"success": True, "output": "HTTP/2.0 200 OK\n\n[]"}
+        assert count_commits_since("owner", "repo", "2026-01-01T00:00:00Z") == 0
+
+    @patch("services.github_api.github_rest", return_value=None)
+    @patch("services.github_api.run_gh_command")
+    def test_failure_returns_zero(self, mock_gh, _mock_rest):
+        mock_gh.return_value = {"success": False, "error": "Not Found"}
+        assert count_commits_since("owner", "repo", "2026-01-01T00:00:00Z") == 0
+
+
+def _rest_response(status_code, body=None, etag=None):
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.ok = status_code < 400
+    resp.content = json.dumps(body or {}).encode()
+    resp.headers = {"ETag": etag} if etag else {}
+    return resp
+
+
+class TestGetWorkflowRuns:
+    """Tests for get_workflow_runs ETag revalidation."""
+
+    def setup_method(self):
+        _rest_etags.clear()
+
+    @patch("services.github_api.github_rest")
+    def test_not_modified_reuses_previous_runs(self, mock_rest):
+        mock_rest.side_effect = [
+            _rest_response(200, {"workflow_runs": [{"id": 1, "status": "completed"}]}, etag='W/"abc"'),
+            _rest_response(304),
+        ]
+
+        first = get_workflow_runs("owner", "repo", "vibecheck.yml")
+        second = get_workflow_runs("owner", "repo", "vibecheck.yml")
+
+        assert second == first
+        assert first[0]["databaseId"] == 1
+        assert mock_rest.call_args_list[0][1]["headers"] is None
+        assert mock_rest.call_args_list[1][1]["headers"] == {"If-None-Match": 'W/"abc"'}
+
+    @patch("services.github_api.github_rest")
+    def test_caller_edits_do_not_leak_into_not_modified_reply(self, mock_rest):
+        mock_rest.side_effect = [
+            _rest_response(200, {"workflow_runs": [{"id": 1, "status": "completed"}]}, etag='W/"abc"'),
+            _rest_response(304),
+            _rest_response(304),
+        ]
+
+        get_workflow_runs("owner", "repo", "vibecheck.yml")[0]["vibecheck_installed"] = True
+        get_workflow_runs("owner", "repo", "vibecheck.yml")[0]["repo"] = "repo"
+        third = get_workflow_runs("owner", "repo", "vibecheck.yml")
+
+        assert "vibecheck_installed" not in third[0]
+        assert "repo" not in third[0]
+
+
+class TestGetRepoIssues:
+    """Tests for get_repo_issues over ETag-revalidated REST."""
+
+    def setup_method(self):
+        _rest_etags.clear()
+
+    @patch("services.github_api.github_rest")
+    def test_rest_issues_normalized_and_revalidated(self, mock_rest):
+        mock_rest.side_effect = [
+            _rest_response(200, [
+                {"number": 3, "title": "Bug", "state": "open", "created_at": "2026-01-01T00:00:00Z",
+                 "html_url": "https://github.com/o/r/issues/3", "labels": [{"name": "vibeCheck"}],
+                 "assignees": [{"login": "Copilot", "id": 1}]},
+                {"number": 4, "title": "A PR", "state": "open", "pull_request": {}},
+            ], etag='"v1"'),
+            _rest_response(304),
+        ]
+
+        first = get_repo_issues("o", "r", labels="vibeCheck")
+        second = get_repo_issues("o", "r", labels="vibeCheck")
+
+        assert [i["number"] for i in first] == [3]
+        assert first[0]["state"] == "OPEN"
+        assert first[0]["assignees"] == [{"login": "Copilot"}]
+        assert first[0]["labels"][0]["name"] == "vibeCheck"
+        assert second == first
+        assert mock_rest.call_args_list[0][1]["params"]["labels"] == "vibeCheck"
+        assert mock_rest.call_args_list[1][1]["headers"] == {"If-None-Match": '"v1"'}
+
+    @patch("services.github_api.github_rest")
+    def test_pull_requests_do_not_shrink_the_issue_list(self, mock_rest):
+        items = [{"number": n, "title": "PR", "state": "open", "pull_request": {}} for n in range(50)]
+        items += [{"number": 100 + n, "title": "Bug", "state": "open"} for n in range(40)]
+        mock_rest.return_value = _rest_response(200, items)
+
+        issues = get_repo_issues("o", "r")
+
+        assert len(issues) == 30
+        assert mock_rest.call_args[1]["params"]["per_page"] == 100
+
+    @patch("services.github_api.run_gh_command")
+    @patch("services.github_api.github_rest")
+    def test_rate_limited_rest_falls_back_to_gh(self, mock_rest, mock_gh):
+        mock_rest.return_value = _rest_response(403)
+        mock_gh.return_value = {"success": True, "output": json.dumps([{"number": 7}])}
+
+        assert get_repo_issues("o", "r") == [{"number": 7}]
+
+    @patch("services.github_api.run_gh_command")
+    @patch("services.github_api.github_rest")
+    def test_missing_repo_returns_empty_without_gh(self, mock_rest, mock_gh):
+        mock_rest.return_value = _rest_response(404)
+
+        assert get_repo_issues("o", "r") == []
+        mock_gh.assert_not_called()
+
+
+class TestPutRepoContents:
+    """Tests for put_repo_contents (REST first, gh fallback)."""
+
+    @patch("services.github_api.run_gh_command")
+    @patch("services.github_api.github_rest")
+    def test_rest_put_sends_json_body(self, mock_rest, mock_gh):
+        mock_rest.return_value = _rest_response(200)
+
+        result = put_repo_contents("owner", "repo", ".github/workflows/vibecheck.yml", "Update", "Zm9v", sha="abc")
+
+        assert result == {"success": True}
+        args, kwargs = mock_rest.call_args
+        assert args == ("PUT", "/repos/owner/repo/contents/.github/workflows/vibecheck.yml")
+        assert kwargs["json_body"] == {"message": "Update", "content": "Zm9v", "sha": "abc"}
+        mock_gh.assert_not_called()
+
+    @patch("services.github_api.github_rest")
+    def test_rest_error_message_is_surfaced(self, mock_rest):
+        mock_rest.return_value = _rest_response(422, {"message": "sha wasn't supplied"})
+
+        result = put_repo_contents("owner", "repo", "f.yml", "Add", "Zm9v")
+
+        assert result == {"success": False, "error": "sha wasn't supplied"}
+
+    @patch("services.github_api.run_gh_command", return_value={"success": True, "output": "{}"})
+    @patch("services.github_api.github_rest", return_value=None)
+    def test_falls_back_to_gh_without_token(self, _mock_rest, mock_gh):
+        assert put_repo_contents("owner", "repo", "f.yml", "Add", "Zm9v")["success"] is True
+        args = mock_gh.call_args[0][0]
+        assert args[:4] == ["api", "-X", "PUT", "/repos/owner/repo/contents/f.yml"]
+        assert "sha=" not in " ".join(args)
+
+
+class TestGetRepoPrsCached:
+    """Tests for get_repo_prs_cached (shared PR list between stages)."""
+
+    def setup_method(self):
+        clear_memoized()
+
+    def teardown_method(self):
+        clear_memoized()
+
+    @patch("services.github_api.run_gh_command")
+    def test_second_call_reuses_list_and_returns_copies(self, mock_gh):
+        mock_gh.return_value = {"success": True, "output": json.dumps([{"number": 1, "comments": []}])}
+
+        first = get_repo_prs_cached("owner", "repo")
+        first[0].pop("comments")
+        second = get_repo_prs_cached("owner", "repo")
+
+        assert mock_gh.call_count == 1
+        assert second == [{"number": 1, "comments": []}]
+
+    @patch("services.github_api.run_gh_command")
+    def test_field_subset_reuses_full_list_or_fetches_narrow(self, mock_gh):
+        mock_gh.return_value = {"success": True, "output": json.dumps([{"number": 1}])}
+
+        get_repo_prs_cached("owner", "narrow", fields=("number", "author"))
+        assert mock_gh.call_args[0][0][-1] == "number,author"
+
+        get_repo_prs_cached("owner", "full")
+        get_repo_prs_cached("owner", "full", fields=("number", "author"))
+        assert mock_gh.call_count == 2
+
+
+class TestGetRepos:
+    """Tests for get_repos over REST."""
+
+    def setup_method(self):
+        clear_memoized()
+
+    def teardown_method(self):
+        clear_memoized()
+
+    @patch("services.github_api.run_gh_command")
+    @patch("services.github_api.github_rest")
+    def test_rest_repos_use_gh_field_names(self, mock_rest, mock_gh):
+        mock_rest.return_value = _rest_response(200, [{
+            "name": "alpha", "html_url": "https://github.com/o/alpha", "private": True,
+            "description": None, "updated_at": "2026-01-01T00:00:00Z",
+        }])
+
+        repos = get_repos(limit=10)
+
+        assert repos == [{
+            "name": "alpha", "url": "https://github.com/o/alpha", "isPrivate": True,
+            "description": "", "updatedAt": "2026-01-01T00:00:00Z",
+        }]
+        assert mock_rest.call_args[1]["params"]["per_page"] == 10
+        mock_gh.assert_not_called()
+
+
+class TestGetRepoContext:
+    """Tests for get_repo_context memoization."""
+
+    def setup_method(self):
+        clear_memoized()
+
+    def teardown_method(self):
+        clear_memoized()
+
+    @patch("services.github_api.check_vibecheck_installed_batch", return_value={"alpha": True})
+    @patch("services.github_api.get_authenticated_user", return_value="owner")
+    @patch("services.github_api.get_repos")
+    def test_concurrent_cold_calls_build_once(self, mock_repos, _mock_user, mock_status):
+        def slow_repos():
+            time.sleep(0.05)
+            return [{"name": "alpha"}]
+        mock_repos.side_effect = slow_repos
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(get_repo_context())) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(1)
+
+        assert mock_repos.call_count == 1
+        assert mock_status.call_count == 1
+        assert results == [("owner", [{"name": "alpha"}], {"alpha": True})] * 4
+
+
+class TestCheckVibecheckInstalledBatch:
+    """Tests for incremental vibecheck status checks."""
+
+    @pytest.fixture(autouse=True)
+    def temp_cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("services.cache._CACHE_ENABLED", True)
+        monkeypatch.setattr("services.cache.CACHE_DIR", str(tmp_path))
+        clear_vibecheck_cache()
+        yield
+        clear_vibecheck_cache()
+
+    @patch("services.github_api.probe_vibecheck_installed")
+    def test_only_unchecked_repos_are_probed(self, mock_probe):
+        mock_probe.side_effect = lambda owner, names: {name: name == "alpha" for name in names}
+
+        first = check_vibecheck_installed_batch("owner", [{"name": "alpha"}, {"name": "beta"}])
+        second = check_vibecheck_installed_batch("owner", [{"name": "alpha"}, {"name": "beta"}, {"name": "gamma"}])
+
+        assert first == {"alpha": True, "beta": False}
+        assert second == {"alpha": True, "beta": False, "gamma": False}
+        assert mock_probe.call_args_list[1][0] == ("owner", ["gamma"])
+
+    @patch("services.github_api.probe_vibecheck_installed", return_value={"alpha": True})
+    def test_status_survives_process_memory_reset(self, mock_probe):
+        check_vibecheck_installed_batch("owner", [{"name": "alpha"}])
+        cache._encoded_responses.clear()
+
+        assert check_vibecheck_installed_batch("owner", [{"name": "alpha"}]) == {"alpha": True}
+        assert mock_probe.call_count == 1
+
@@ -3,7 +3,7 @@ Integration tests — verify the full route → notification → webhook flow.
 
 Unlike unit tests that mock notification functions at the route level,
 these tests let the real notification code run and instead mock at the
-HTTP boundary (requests.post) to verify Discord webhook payloads.
+HTTP boundary (the notifier session's post) to verify Discord webhook payloads.
 """
 
 import json
@@ -25,7 +25,7 @@ def client():
 @pytest.fixture(autouse=True)
 def disable_cache(monkeypatch):
     """Disable caching for all integration tests."""
-    monkeypatch.setenv("CACHE_DISABLED", "1")
+    monkeypatch.setattr("services.cache._CACHE_ENABLED", False)
 
 
 @pytest.fixture(autouse=True)
@@ -40,20 +40,26 @@ def reset_dedup_sets():
 PREFIX = "/dispatch"
 
 
+def _pr_view_tsv(state, review_decision, merged_at, closed_at):
+    """Mimic `gh pr view --jq '[...] | @tsv'` output (null -> empty field)."""
+    return "\t".join(v or "" for v in (state, review_decision, merged_at, closed_at)) + "\n"
+
+
 class TestPollSubmittedPRsIntegration:
     """
     Integration: hit poll-submitted-prs endpoint, let the full notification
     chain run (route handler → notify_*() → send_discord_notification() →
-    requests.post()), and verify the Discord webhook payload.
+    _session.post()), and verify the Discord webhook payload.
     """
 
-    @patch("helpers.notifications.requests.post")
+    @patch("routes.oss_routes.batch_pr_states", return_value=None)
+    @patch("helpers.notifications._session.post")
     @patch("helpers.notifications.DISCORD_WEBHOOK_URL", "https://discord.com/api/webhooks/test")
     @patch("routes.oss_routes.run_gh_command")
     @patch("routes.oss_routes.OSSService")
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     def test_poll_detects_merge_and_sends_discord_notification(
-        self, _mock_user, mock_svc_cls, mock_gh, mock_discord_post, client
+        self, _mock_user, mock_svc_cls, mock_gh, mock_discord_post, _mock_batch, client
     ):
         svc = mock_svc_cls.return_value
         svc.get_submitted_prs.return_value = [{
@@ -71,12 +77,7 @@ class TestPollSubmittedPRsIntegration:
 
         mock_gh.return_value = {
             "success": True,
-            "output": json.dumps({
-                "state": "MERGED",
-                "reviewDecision": "APPROVED",
-                "mergedAt": "2026-02-19T12:00:00Z",
-                "closedAt": None,
-            })
+            "output": _pr_view_tsv("MERGED", "APPROVED", "2026-02-19T12:00:00Z", None)
         }
 
         resp = client.post(
@@ -107,13 +108,14 @@ class TestPollSubmittedPRsIntegration:
         assert "fastify/fastify" in embed["description"]
         assert embed["color"] == 0x2ECC71  # COLOR_SUCCESS
 
-    @patch("helpers.notifications.requests.post")
+    @patch("routes.oss_routes.batch_pr_states", return_value=None)
+    @patch("helpers.notifications._session.post")
     @patch("helpers.notifications.DISCORD_WEBHOOK_URL", "https://discord.com/api/webhooks/test")
     @patch("routes.oss_routes.run_gh_command")
     @patch("routes.oss_routes.OSSService")
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     def test_poll_detects_review_feedback_and_sends_notification(
-        self, _mock_user, mock_svc_cls, mock_gh, mock_discord_post, client
+        self, _mock_user, mock_svc_cls, mock_gh, mock_discord_post, _mock_batch, client
     ):
         svc = mock_svc_cls.return_value
         svc.get_submitted_prs.return_value = [{
@@ -131,12 +133,7 @@ class TestPollSubmittedPRsIntegration:
 
         mock_gh.return_value = {
             "success": True,
-            "output": json.dumps({
-                "state": "OPEN",
-                "reviewDecision": "CHANGES_REQUESTED",
-                "mergedAt": None,
-                "closedAt": None,
-            })
+            "output": _pr_view_tsv("OPEN", "CHANGES_REQUESTED", None, None)
         }
 
         client.post(
@@ -153,13 +150,14 @@ class TestPollSubmittedPRsIntegration:
         assert "CHANGES_REQUESTED" in embed["description"]
         assert embed["color"] == 0xF39C12  # COLOR_WARNING
 
-    @patch("helpers.notifications.requests.post")
+    @patch("routes.oss_routes.batch_pr_states", return_value=None)
+    @patch("helpers.notifications._session.post")
     @patch("helpers.notifications.DISCORD_WEBHOOK_URL", "https://discord.com/api/webhooks/test")
     @patch("routes.oss_routes.run_gh_command")
     @patch("routes.oss_routes.OSSService")
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     def test_no_notification_when_state_unchanged(
-        self, _mock_user, mock_svc_cls, mock_gh, mock_discord_post, client
+        self, _mock_user, mock_svc_cls, mock_gh, mock_discord_post, _mock_batch, client
     ):
         svc = mock_svc_cls.return_value
         svc.get_submitted_prs.return_value = [{
@@ -177,12 +175,7 @@ class TestPollSubmittedPRsIntegration:
 
         mock_gh.return_value = {
             "success": True,
-            "output": json.dumps({
-                "state": "OPEN",
-                "reviewDecision": None,
-                "mergedAt": None,
-                "closedAt": None,
-            })
+            "output": _pr_view_tsv("OPEN", None, None, None)
         }
 
         client.post(
@@ -192,12 +185,13 @@ class TestPollSubmittedPRsIntegration:
 
         mock_discord_post.assert_not_called()
 
-    @patch("helpers.notifications.requests.post")
+    @patch("routes.oss_routes.batch_pr_states", return_value=None)
+    @patch("helpers.notifications._session.post")
     @patch("routes.oss_routes.run_gh_command")
     @patch("routes.oss_routes.OSSService")
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     def test_no_notification_when_webhook_url_empty(
-        self, _mock_user, mock_svc_cls, mock_gh, mock_discord_post, client
+        self, _mock_user, mock_svc_cls, mock_gh, mock_discord_post, _mock_batch, client
     ):
         with patch("helpers.notifications.DISCORD_WEBHOOK_URL", ""):
             svc = mock_svc_cls.return_value
@@ -216,12 +210,7 @@ class TestPollSubmittedPRsIntegration:
 
             mock_gh.return_value = {
                 "success": True,
-                "output": json.dumps({
-                    "state": "MERGED",
-                    "reviewDecision": "APPROVED",
-                    "mergedAt": "2026-02-19T12:00:00Z",
-                    "closedAt": None,
-                })
+                "output": _pr_view_tsv("MERGED", "APPROVED", "2026-02-19T12:00:00Z", None)
             }
 
             client.post(
@@ -231,13 +220,14 @@ class TestPollSubmittedPRsIntegration:
 
             mock_discord_post.assert_not_called()
 
-    @patch("helpers.notifications.requests.post")
+    @patch("routes.oss_routes.batch_pr_states", return_value=None)
+    @patch("helpers.notifications._session.post")
     @patch("helpers.notifications.DISCORD_WEBHOOK_URL", "https://discord.com/api/webhooks/test")
     @patch("routes.oss_routes.run_gh_command")
     @patch("routes.oss_routes.OSSService")
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     def test_multiple_prs_produce_separate_notifications(
-        self, _mock_user, mock_svc_cls, mock_gh, mock_discord_post, client
+        self, _mock_user, mock_svc_cls, mock_gh, mock_discord_post, _mock_batch, client
     ):
         svc = mock_svc_cls.return_value
         svc.get_submitted_prs.return_value = [
@@ -270,21 +260,11 @@ class TestPollSubmittedPRsIntegration:
         mock_gh.side_effect = [
             {
                 "success": True,
-                "output": json.dumps({
-                    "state": "MERGED",
-                    "reviewDecision": "APPROVED",
-                    "mergedAt": "2026-02-19T12:00:00Z",
-                    "closedAt": None,
-                })
+                "output": _pr_view_tsv("MERGED", "APPROVED", "2026-02-19T12:00:00Z", None)
             },
             {
                 "success": True,
-                "output": json.dumps({
-                    "state": "OPEN",
-                    "reviewDecision": "APPROVED",
-                    "mergedAt": None,
-                    "closedAt": None,
-                })
+                "output": _pr_view_tsv("OPEN", "APPROVED", None, None)
             },
         ]
 
@@ -311,14 +291,15 @@ class TestGoTierNotificationIntegration:
     run, verify Discord webhook payload for GO-tier issues.
     """
 
-    @patch("helpers.notifications.requests.post")
+    @patch("routes.oss_routes.batch_repo_issues", return_value=None)
+    @patch("helpers.notifications._session.post")
     @patch("helpers.notifications.DISCORD_WEBHOOK_URL", "https://discord.com/api/webhooks/test")
     @patch("routes.oss_routes.score_issue_fallback")
     @patch("routes.oss_routes.run_gh_command")
     @patch("routes.oss_routes.OSSService")
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     def test_go_tier_issue_sends_discord_notification(
-        self, _mock_user, mock_svc_cls, mock_gh, mock_score, mock_discord_post, client
+        self, _mock_user, mock_svc_cls, mock_gh, mock_score, mock_discord_post, _mock_batch, client
     ):
         svc = mock_svc_cls.return_value
         svc.get_scored_issues.return_value = []
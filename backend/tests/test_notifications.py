@@ -21,13 +21,13 @@ class TestSendDiscordNotification:
     """Tests for the core send_discord_notification function."""
 
     @patch("helpers.notifications.DISCORD_WEBHOOK_URL", "")
-    @patch("helpers.notifications.requests.post")
+    @patch("helpers.notifications._session.post")
     def test_skips_when_webhook_url_empty(self, mock_post):
         send_discord_notification("Test Title", "Test Description")
         mock_post.assert_not_called()
 
     @patch("helpers.notifications.DISCORD_WEBHOOK_URL", "https://discord.com/api/webhooks/test")
-    @patch("helpers.notifications.requests.post")
+    @patch("helpers.notifications._session.post")
     def test_sends_correct_embed_format(self, mock_post):
         send_discord_notification(
             "Test Title",
@@ -49,7 +49,7 @@ class TestSendDiscordNotification:
         assert embed["fields"][0]["name"] == "Field1"
 
     @patch("helpers.notifications.DISCORD_WEBHOOK_URL", "https://discord.com/api/webhooks/test")
-    @patch("helpers.notifications.requests.post")
+    @patch("helpers.notifications._session.post")
     def test_uses_default_color_when_none_provided(self, mock_post):
         send_discord_notification("Title", "Desc")
 
@@ -59,7 +59,7 @@ class TestSendDiscordNotification:
         assert embed["color"] == COLOR_INFO
 
     @patch("helpers.notifications.DISCORD_WEBHOOK_URL", "https://discord.com/api/webhooks/test")
-    @patch("helpers.notifications.requests.post")
+    @patch("helpers.notifications._session.post")
     def test_omits_fields_when_none(self, mock_post):
         send_discord_notification("Title", "Desc")
 
@@ -69,7 +69,7 @@ class TestSendDiscordNotification:
         assert "fields" not in embed
 
     @patch("helpers.notifications.DISCORD_WEBHOOK_URL", "https://discord.com/api/webhooks/test")
-    @patch("helpers.notifications.requests.post", side_effect=Exception("Connection error"))
+    @patch("helpers.notifications._session.post", side_effect=Exception("Connection error"))
     def test_exception_does_not_raise(self, mock_post):
         # Should silently handle the exception
         send_discord_notification("Title", "Desc")
@@ -81,7 +81,7 @@ class TestNotifyGoTierIssue:
     """Tests for notify_go_tier_issue."""
 
     @patch("helpers.notifications.DISCORD_WEBHOOK_URL", "https://discord.com/api/webhooks/test")
-    @patch("helpers.notifications.requests.post")
+    @patch("helpers.notifications._session.post")
     def test_sends_go_tier_notification(self, mock_post):
         notify_go_tier_issue("fastify/fastify", 42, "Fix memory leak", 92)
 
@@ -99,7 +99,7 @@ class TestNotifyPRReadyForReview:
     """Tests for notify_pr_ready_for_review."""
 
     @patch("helpers.notifications.DISCORD_WEBHOOK_URL", "https://discord.com/api/webhooks/test")
-    @patch("helpers.notifications.requests.post")
+    @patch("helpers.notifications._session.post")
     def test_sends_pr_ready_notification(self, mock_post):
         notify_pr_ready_for_review("my-user/fastify", 7, "Fix memory leak")
 
@@ -116,7 +116,7 @@ class TestNotifyUpstreamMerged:
     """Tests for notify_upstream_merged."""
 
     @patch("helpers.notifications.DISCORD_WEBHOOK_URL", "https://discord.com/api/webhooks/test")
-    @patch("helpers.notifications.requests.post")
+    @patch("helpers.notifications._session.post")
     def test_sends_merged_notification(self, mock_post):
         notify_upstream_merged(
             "fastify/fastify",
@@ -137,7 +137,7 @@ class TestNotifyUpstreamFeedback:
     """Tests for notify_upstream_feedback."""
 
     @patch("helpers.notifications.DISCORD_WEBHOOK_URL", "https://discord.com/api/webhooks/test")
-    @patch("helpers.notifications.requests.post")
+    @patch("helpers.notifications._session.post")
     def test_changes_requested_uses_warning_color(self, mock_post):
         notify_upstream_feedback(
             "fastify/fastify",
@@ -153,7 +153,7 @@ class TestNotifyUpstreamFeedback:
         assert "CHANGES_REQUESTED" in embed["description"]
 
     @patch("helpers.notifications.DISCORD_WEBHOOK_URL", "https://discord.com/api/webhooks/test")
-    @patch("helpers.notifications.requests.post")
+    @patch("helpers.notifications._session.post")
     def test_approved_uses_info_color(self, mock_post):
         notify_upstream_feedback(
             "fastify/fastify",
@@ -1,7 +1,14 @@
 """Tests for oss_helpers — heuristic scoring fallback and PR template formatting."""
 
+from datetime import datetime, timezone
+
 import pytest
-from helpers.oss_helpers import score_issue_fallback, format_upstream_pr_body
+from helpers.oss_helpers import (
+    score_issue_fallback, format_upstream_pr_body, normalize_gh_issue, _parse_gh_timestamp,
+)
+
+# Fixed clock for the scorer; fixture dates are relative to it
+NOW = datetime(2026, 2, 20, tzinfo=timezone.utc)
 
 
 class TestScoreIssueFallback:
@@ -15,7 +22,7 @@ class TestScoreIssueFallback:
             "createdAt": "2026-02-01T00:00:00Z",
             "updatedAt": "2026-02-01T00:00:00Z",
             "comments": 5,
-        })
+        }, now=NOW)
         assert result["cvs"] == 0
         assert result["cvsTier"] == "skip"
         assert result["dataCompleteness"] == "partial"
@@ -28,7 +35,7 @@ class TestScoreIssueFallback:
             "createdAt": "2026-02-01T00:00:00Z",
             "updatedAt": "2026-02-01T00:00:00Z",
             "comments": 0,
-        })
+        }, now=NOW)
         assert result["cvs"] == 0
         assert result["cvsTier"] == "skip"
 
@@ -40,7 +47,7 @@ class TestScoreIssueFallback:
             "createdAt": "2026-02-18T00:00:00Z",
             "updatedAt": "2026-02-18T00:00:00Z",
             "comments": 1,
-        })
+        }, now=NOW)
         assert result["cvs"] > 0
         assert result["cvsTier"] != "skip"
 
@@ -52,7 +59,7 @@ class TestScoreIssueFallback:
             "createdAt": "2026-02-18T00:00:00Z",
             "updatedAt": "2026-02-18T00:00:00Z",
             "comments": 1,
-        })
+        }, now=NOW)
         assert result["cvs"] == 50
         assert result["cvsTier"] == "maybe"
 
@@ -64,7 +71,7 @@ class TestScoreIssueFallback:
             "createdAt": "2026-02-18T00:00:00Z",
             "updatedAt": "2026-02-18T00:00:00Z",
             "comments": 1,
-        })
+        }, now=NOW)
         assert result["cvs"] == 70
         assert result["cvsTier"] == "likely"
 
@@ -76,7 +83,7 @@ class TestScoreIssueFallback:
             "createdAt": "2026-02-18T00:00:00Z",
             "updatedAt": "2026-02-18T00:00:00Z",
             "comments": 1,
-        })
+        }, now=NOW)
         assert result["cvs"] == 70
         assert result["cvsTier"] == "likely"
 
@@ -88,7 +95,7 @@ class TestScoreIssueFallback:
             "createdAt": "2026-02-18T00:00:00Z",
             "updatedAt": "2026-02-18T00:00:00Z",
             "comments": 1,
-        })
+        }, now=NOW)
         assert result["cvs"] == 70
 
     def test_stale_issue_penalty(self):
@@ -99,7 +106,7 @@ class TestScoreIssueFallback:
             "createdAt": "2025-01-01T00:00:00Z",
             "updatedAt": "2025-01-01T00:00:00Z",
             "comments": 1,
-        })
+        }, now=NOW)
         # 50 - 30 (stale) = 20
         assert result["cvs"] == 20
         assert result["cvsTier"] == "risky"
@@ -112,7 +119,7 @@ class TestScoreIssueFallback:
             "createdAt": "2026-01-01T00:00:00Z",
             "updatedAt": "2026-02-18T00:00:00Z",
             "comments": 0,
-        })
+        }, now=NOW)
         # 50 - 10 (no comments, > 14 days old) = 40
         assert result["cvs"] == 40
         assert result["cvsTier"] == "maybe"
@@ -125,7 +132,7 @@ class TestScoreIssueFallback:
             "createdAt": "2025-01-01T00:00:00Z",
             "updatedAt": "2025-01-01T00:00:00Z",
             "comments": 0,
-        })
+        }, now=NOW)
         # 50 - 30 (stale) - 10 (no comments) = 10
         assert result["cvs"] == 10
         assert result["cvsTier"] == "skip"
@@ -138,7 +145,7 @@ class TestScoreIssueFallback:
             "createdAt": "2026-01-01T00:00:00Z",
             "updatedAt": "2026-02-18T00:00:00Z",
             "comments": [{"body": "hello"}, {"body": "world"}],
-        })
+        }, now=NOW)
         # comments=2 (from list length), so no zero-comment penalty
         assert result["cvs"] == 50
 
@@ -150,7 +157,7 @@ class TestScoreIssueFallback:
             "createdAt": "2020-01-01T00:00:00Z",
             "updatedAt": "2020-01-01T00:00:00Z",
             "comments": 0,
-        })
+        }, now=NOW)
         assert result["cvs"] >= 0
 
     def test_tier_boundaries(self):
@@ -160,28 +167,28 @@ class TestScoreIssueFallback:
         likely = score_issue_fallback({
             "assignees": [], "labels": ["good first issue"],
             "createdAt": "2026-02-18T00:00:00Z", "updatedAt": "2026-02-18T00:00:00Z", "comments": 1,
-        })
+        }, now=NOW)
         assert likely["cvsTier"] == "likely"
 
         # maybe: 50 (base only)
         maybe = score_issue_fallback({
             "assignees": [], "labels": [],
             "createdAt": "2026-02-18T00:00:00Z", "updatedAt": "2026-02-18T00:00:00Z", "comments": 1,
-        })
+        }, now=NOW)
         assert maybe["cvsTier"] == "maybe"
 
         # risky: 20 (base - stale)
         risky = score_issue_fallback({
             "assignees": [], "labels": [],
             "createdAt": "2025-01-01T00:00:00Z", "updatedAt": "2025-01-01T00:00:00Z", "comments": 1,
-        })
+        }, now=NOW)
         assert risky["cvsTier"] == "risky"
 
         # skip: 10 (base - stale - no comments)
         skip = score_issue_fallback({
             "assignees": [], "labels": [],
             "createdAt": "2025-01-01T00:00:00Z", "updatedAt": "2025-01-01T00:00:00Z", "comments": 0,
-        })
+        }, now=NOW)
         assert skip["cvsTier"] == "skip"
 
     def test_missing_fields_dont_crash(self):
@@ -196,10 +203,29 @@ class TestScoreIssueFallback:
         result = score_issue_fallback({
             "assignees": [], "labels": ["good first issue"],
             "createdAt": "2026-02-18T00:00:00Z", "updatedAt": "2026-02-18T00:00:00Z", "comments": 5,
-        })
+        }, now=NOW)
         assert result["dataCompleteness"] == "partial"
 
 
+class TestParseGhTimestamp:
+    """Tests for the GitHub timestamp parser used by the scorer."""
+
+    def test_fixed_format_matches_fromisoformat(self):
+        assert _parse_gh_timestamp("2026-02-19T13:45:07Z") == datetime(2026, 2, 19, 13, 45, 7, tzinfo=timezone.utc)
+
+    def test_other_iso_forms_fall_back(self):
+        assert _parse_gh_timestamp("2026-02-19T13:45:07.123+00:00").microsecond == 123000
+
+    def test_explicit_now_drives_staleness(self):
+        """Passing `now` makes the age checks deterministic."""
+        issue = {"assignees": [], "labels": [], "comments": 3,
+                 "createdAt": "2026-01-01T00:00:00Z", "updatedAt": "2026-01-01T00:00:00Z"}
+        fresh = score_issue_fallback(issue, now=datetime(2026, 1, 10, tzinfo=timezone.utc))
+        stale = score_issue_fallback(issue, now=datetime(2026, 6, 1, tzinfo=timezone.utc))
+        assert fresh["cvs"] == 50
+        assert stale["cvs"] == 20
+
+
 class TestFormatUpstreamPrBody:
     """Tests for format_upstream_pr_body — PR template for upstream submissions."""
 
@@ -221,3 +247,30 @@ class TestFormatUpstreamPrBody:
         """Titles with special chars should be included as-is (no escaping needed for markdown)."""
         body = format_upstream_pr_body("org/repo", 1, "Fix `foo` & <bar>", "fix-foo")
         assert "Fix `foo` & <bar>" in body
+
+
+class TestNormalizeGhIssue:
+    """Tests for normalize_gh_issue — gh CLI shape to aggregator shape."""
+
+    def test_flattens_labels_assignees_and_comments(self):
+        issue = normalize_gh_issue({
+            "number": 1,
+            "labels": [{"name": "good first issue", "color": "7057ff"}, "bug"],
+            "assignees": [{"login": "someone"}],
+            "comments": [{"body": "hi"}, {"body": "there"}],
+        })
+        assert issue["number"] == 1
+        assert issue["labels"] == ["good first issue", "bug"]
+        assert issue["assignees"] == ["someone"]
+        assert issue["comments"] == 2
+
+    def test_normalized_issue_scores_the_same(self):
+        raw = {
+            "labels": [{"name": "good first issue"}],
+            "createdAt": "2026-01-01T00:00:00Z",
+            "updatedAt": "2026-01-02T00:00:00Z",
+            "comments": [{"body": "hi"}],
+            "assignees": [],
+        }
+        now = _parse_gh_timestamp("2026-01-05T00:00:00Z")
+        assert score_issue_fallback(normalize_gh_issue(raw), now) == score_issue_fallback(raw, now)
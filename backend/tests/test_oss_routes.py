@@ -1,6 +1,7 @@
 """Tests for OSS routes — all stages and polling endpoints."""
 
 import json
+from datetime import datetime, timezone
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -19,7 +20,7 @@ def client():
 @pytest.fixture(autouse=True)
 def disable_cache(monkeypatch):
     """Disable caching for all route tests."""
-    monkeypatch.setenv("CACHE_DISABLED", "1")
+    monkeypatch.setattr("services.cache._CACHE_ENABLED", False)
 
 
 PREFIX = "/dispatch"
@@ -181,10 +182,11 @@ class TestRefreshTarget:
 class TestStage1Enrichment:
     """Tests for the _enrich_target_via_gh logic in GET /api/oss/stage1-targets."""
 
+    @patch("routes.oss_routes.batch_repo_metadata", return_value=None)
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     @patch("routes.oss_routes.OSSService")
     @patch("routes.oss_routes.run_gh_command")
-    def test_local_watchlist_enriches_via_gh_json_parsing(self, mock_gh, mock_svc_cls, mock_user, client):
+    def test_local_watchlist_enriches_via_gh_json_parsing(self, mock_gh, mock_svc_cls, mock_user, mock_batch, client):
         """Tests that _enrich_target_via_gh actually parses JSON and builds the target dict."""
         svc = mock_svc_cls.return_value
         svc.get_watchlist.return_value = []
@@ -206,10 +208,11 @@ class TestStage1Enrichment:
         assert data["targets"][0]["meta"]["stars"] == 1000
         assert data["targets"][0]["meta"]["language"] == "JavaScript"
 
+    @patch("routes.oss_routes.batch_repo_metadata", return_value=None)
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     @patch("routes.oss_routes.OSSService")
     @patch("routes.oss_routes.run_gh_command")
-    def test_local_watchlist_gh_failure_returns_target_without_meta(self, mock_gh, mock_svc_cls, mock_user, client):
+    def test_local_watchlist_gh_failure_returns_target_without_meta(self, mock_gh, mock_svc_cls, mock_user, mock_batch, client):
         """When gh CLI fails, target should still appear but without meta field."""
         svc = mock_svc_cls.return_value
         svc.get_watchlist.return_value = []
@@ -227,10 +230,11 @@ class TestStage1Enrichment:
         assert data["targets"][0]["slug"] == "fastify-fastify"
         assert "meta" not in data["targets"][0]
 
+    @patch("routes.oss_routes.batch_repo_metadata", return_value=None)
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     @patch("routes.oss_routes.OSSService")
     @patch("routes.oss_routes.run_gh_command")
-    def test_local_watchlist_malformed_json_returns_target_without_meta(self, mock_gh, mock_svc_cls, mock_user, client):
+    def test_local_watchlist_malformed_json_returns_target_without_meta(self, mock_gh, mock_svc_cls, mock_user, mock_batch, client):
         """When gh CLI returns invalid JSON, target appears without meta."""
         svc = mock_svc_cls.return_value
         svc.get_watchlist.return_value = []
@@ -248,17 +252,44 @@ class TestStage1Enrichment:
         assert "meta" not in data["targets"][0]
 
 
+class TestStage1Batch:
+    """Tests for the batched GraphQL path in GET /api/oss/stage1-targets."""
+
+    @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
+    @patch("routes.oss_routes.OSSService")
+    @patch("routes.oss_routes.run_gh_command")
+    @patch("routes.oss_routes.batch_repo_metadata")
+    def test_one_batch_keeps_watchlist_order(self, mock_batch, mock_gh, mock_svc_cls, mock_user, client):
+        svc = mock_svc_cls.return_value
+        svc.get_watchlist.return_value = []
+        svc.get_local_watchlist.return_value = [
+            {"owner": "fastify", "repo": "fastify", "slug": "fastify-fastify"},
+            {"owner": "pallets", "repo": "flask", "slug": "pallets-flask"},
+        ]
+        mock_batch.return_value = {("pallets", "flask"): {"stars": 5, "language": "Python"}}
+
+        data = client.get(f"{PREFIX}/api/oss/stage1-targets").get_json()
+
+        mock_gh.assert_not_called()
+        assert [t["slug"] for t in data["targets"]] == ["fastify-fastify", "pallets-flask"]
+        assert "meta" not in data["targets"][0]
+        assert data["targets"][1]["meta"]["stars"] == 5
+
+
 # ============ Stage 2: Scored Issues ============
 
 
 class TestStage2Issues:
     """Tests for GET /api/oss/stage2-issues — fallback scoring logic."""
 
+    @patch("routes.oss_routes.batch_repo_issues", return_value=None)
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     @patch("routes.oss_routes.OSSService")
     @patch("routes.oss_routes.run_gh_command")
-    def test_fallback_scores_and_structures_issues(self, mock_gh, mock_svc_cls, mock_user, client):
+    @patch("routes.oss_routes.datetime")
+    def test_fallback_scores_and_structures_issues(self, mock_dt, mock_gh, mock_svc_cls, mock_user, mock_batch, client):
         """Tests the _fetch_repo_issues_fallback pipeline: JSON parse → score → build response dict."""
+        mock_dt.now.return_value = datetime(2026, 2, 20, tzinfo=timezone.utc)
         svc = mock_svc_cls.return_value
         svc.get_scored_issues.return_value = []
         svc.get_local_watchlist.return_value = [
@@ -294,10 +325,11 @@ class TestStage2Issues:
         assert issue["dataCompleteness"] == "partial"
         assert issue["id"] == "github-fastify-fastify-1"
 
+    @patch("routes.oss_routes.batch_repo_issues", return_value=None)
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     @patch("routes.oss_routes.OSSService")
     @patch("routes.oss_routes.run_gh_command")
-    def test_fallback_filters_out_assigned_issues(self, mock_gh, mock_svc_cls, mock_user, client):
+    def test_fallback_filters_out_assigned_issues(self, mock_gh, mock_svc_cls, mock_user, mock_batch, client):
         svc = mock_svc_cls.return_value
         svc.get_scored_issues.return_value = []
         svc.get_local_watchlist.return_value = [
@@ -326,10 +358,11 @@ class TestStage2Issues:
         assert data["success"] is True
         assert len(data["issues"]) == 0
 
+    @patch("routes.oss_routes.batch_repo_issues", return_value=None)
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     @patch("routes.oss_routes.OSSService")
     @patch("routes.oss_routes.run_gh_command")
-    def test_fallback_normalizes_dict_labels_to_strings(self, mock_gh, mock_svc_cls, mock_user, client):
+    def test_fallback_normalizes_dict_labels_to_strings(self, mock_gh, mock_svc_cls, mock_user, mock_batch, client):
         svc = mock_svc_cls.return_value
         svc.get_scored_issues.return_value = []
         svc.get_local_watchlist.return_value = [
@@ -357,10 +390,11 @@ class TestStage2Issues:
 
         assert data["issues"][0]["labels"] == ["bug", "good first issue"]
 
+    @patch("routes.oss_routes.batch_repo_issues", return_value=None)
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     @patch("routes.oss_routes.OSSService")
     @patch("routes.oss_routes.run_gh_command")
-    def test_fallback_sorts_by_cvs_descending(self, mock_gh, mock_svc_cls, mock_user, client):
+    def test_fallback_sorts_by_cvs_descending(self, mock_gh, mock_svc_cls, mock_user, mock_batch, client):
         svc = mock_svc_cls.return_value
         svc.get_scored_issues.return_value = []
         svc.get_local_watchlist.return_value = [
@@ -394,10 +428,11 @@ class TestStage2Issues:
         assert data["issues"][0]["cvs"] >= data["issues"][1]["cvs"]
         assert data["issues"][0]["number"] == 2  # GFI issue (70) first
 
+    @patch("routes.oss_routes.batch_repo_issues", return_value=None)
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     @patch("routes.oss_routes.OSSService")
     @patch("routes.oss_routes.run_gh_command")
-    def test_fallback_handles_malformed_json_gracefully(self, mock_gh, mock_svc_cls, mock_user, client):
+    def test_fallback_handles_malformed_json_gracefully(self, mock_gh, mock_svc_cls, mock_user, mock_batch, client):
         """When gh returns invalid JSON, the route should return empty issues (not crash)."""
         svc = mock_svc_cls.return_value
         svc.get_scored_issues.return_value = []
@@ -414,18 +449,45 @@ class TestStage2Issues:
         assert data["issues"] == []
 
 
+class TestStage2Batch:
+    """Tests for the batched GraphQL path in GET /api/oss/stage2-issues."""
+
+    @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
+    @patch("routes.oss_routes.OSSService")
+    @patch("routes.oss_routes.run_gh_command")
+    @patch("routes.oss_routes.batch_repo_issues")
+    def test_scores_batched_issues_without_per_repo_calls(self, mock_batch, mock_gh, mock_svc_cls, mock_user, client):
+        svc = mock_svc_cls.return_value
+        svc.get_scored_issues.return_value = []
+        svc.get_local_watchlist.return_value = [{"owner": "org", "repo": "repo", "slug": "org-repo"}]
+        mock_batch.return_value = {("org", "repo"): [{
+            "number": 3, "title": "Docs", "url": "https://github.com/org/repo/issues/3",
+            "labels": [{"name": "good first issue"}], "createdAt": "2026-02-18T00:00:00Z",
+            "updatedAt": "2026-02-18T00:00:00Z", "comments": 4, "assignees": [],
+        }]}
+
+        data = client.get(f"{PREFIX}/api/oss/stage2-issues").get_json()
+
+        mock_gh.assert_not_called()
+        assert mock_batch.call_args[0][1] == "good first issue"
+        assert data["issues"][0]["id"] == "github-org-repo-3"
+        assert data["issues"][0]["commentCount"] == 4
+        assert data["issues"][0]["labels"] == ["good first issue"]
+
+
 # ============ GO-tier Notification ============
 
 
 class TestGoTierNotification:
     """Tests for GO-tier notification firing in _fetch_repo_issues_fallback."""
 
+    @patch("routes.oss_routes.batch_repo_issues", return_value=None)
     @patch("routes.oss_routes.notify_go_tier_issue")
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     @patch("routes.oss_routes.OSSService")
     @patch("routes.oss_routes.run_gh_command")
     @patch("routes.oss_routes.score_issue_fallback")
-    def test_notification_fires_when_cvs_reaches_85(self, mock_score, mock_gh, mock_svc_cls, mock_user, mock_notify, client):
+    def test_notification_fires_when_cvs_reaches_85(self, mock_score, mock_gh, mock_svc_cls, mock_user, mock_notify, mock_batch, client):
         """Bypass the real scorer and inject CVS >= 85 to test the notification trigger."""
         from routes.oss_routes import _notified_go_issues
         _notified_go_issues.clear()
@@ -457,12 +519,13 @@ class TestGoTierNotification:
 
         mock_notify.assert_called_once_with("org/repo", 99, "Critical fix", 92)
 
+    @patch("routes.oss_routes.batch_repo_issues", return_value=None)
     @patch("routes.oss_routes.notify_go_tier_issue")
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     @patch("routes.oss_routes.OSSService")
     @patch("routes.oss_routes.run_gh_command")
     @patch("routes.oss_routes.score_issue_fallback")
-    def test_notification_deduplicates_by_issue_id(self, mock_score, mock_gh, mock_svc_cls, mock_user, mock_notify, client):
+    def test_notification_deduplicates_by_issue_id(self, mock_score, mock_gh, mock_svc_cls, mock_user, mock_notify, mock_batch, client):
         """Same issue polled twice should only fire notification once."""
         from routes.oss_routes import _notified_go_issues
         _notified_go_issues.clear()
@@ -495,16 +558,51 @@ class TestGoTierNotification:
         assert mock_notify.call_count == 1
 
 
+class TestGoTierNotificationPersistence:
+    """Notified GO-tier IDs are seeded from and written back to OSS tracking."""
+
+    @patch("routes.oss_routes._notified_go_loaded", False)
+    @patch("routes.oss_routes.notify_go_tier_issue")
+    @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
+    @patch("routes.oss_routes.OSSService")
+    @patch("routes.oss_routes.batch_repo_issues")
+    @patch("routes.oss_routes.score_issue_fallback")
+    def test_ids_notified_before_restart_are_not_resent(self, mock_score, mock_batch, mock_svc_cls, mock_user, mock_notify, client):
+        from routes.oss_routes import _notified_go_issues
+        _notified_go_issues.clear()
+
+        svc = mock_svc_cls.return_value
+        svc.get_scored_issues.return_value = []
+        svc.get_local_watchlist.return_value = [{"owner": "org", "repo": "repo", "slug": "org-repo"}]
+        svc.get_notified_go_issues.return_value = ["github-org-repo-99"]
+        mock_batch.return_value = {("org", "repo"): [
+            {"number": 99, "title": "Seen", "labels": [], "comments": 0, "assignees": []},
+            {"number": 100, "title": "New", "labels": [], "comments": 0, "assignees": []},
+        ]}
+        mock_score.return_value = {"cvs": 92, "cvsTier": "go", "dataCompleteness": "partial"}
+
+        client.get(f"{PREFIX}/api/oss/stage2-issues")
+
+        mock_notify.assert_called_once_with("org/repo", 100, "New", 92)
+        svc.save_notified_go_issues.assert_called_once_with(["github-org-repo-99", "github-org-repo-100"])
+
+
 # ============ Poll Submitted PRs ============
 
 
+def _pr_view_tsv(state, review_decision, merged_at, closed_at):
+    """Mimic `gh pr view --jq '[...] | @tsv'` output (null -> empty field)."""
+    return "\t".join(v or "" for v in (state, review_decision, merged_at, closed_at)) + "\n"
+
+
 class TestPollSubmittedPRs:
     """Tests for POST /api/oss/poll-submitted-prs — state detection and notifications."""
 
+    @patch("routes.oss_routes.batch_pr_states", return_value=None)
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     @patch("routes.oss_routes.OSSService")
     @patch("routes.oss_routes.run_gh_command")
-    def test_detects_state_transition_to_merged(self, mock_gh, mock_svc_cls, mock_user, client):
+    def test_detects_state_transition_to_merged(self, mock_gh, mock_svc_cls, mock_user, _mock_batch, client):
         svc = mock_svc_cls.return_value
         svc.get_submitted_prs.return_value = [{
             "origin_slug": "fastify/fastify",
@@ -521,12 +619,7 @@ class TestPollSubmittedPRs:
 
         mock_gh.return_value = {
             "success": True,
-            "output": json.dumps({
-                "state": "MERGED",
-                "reviewDecision": "APPROVED",
-                "mergedAt": "2026-02-19T12:00:00Z",
-                "closedAt": None,
-            })
+            "output": _pr_view_tsv("MERGED", "APPROVED", "2026-02-19T12:00:00Z", None)
         }
 
         resp = client.post(f"{PREFIX}/api/oss/poll-submitted-prs",
@@ -540,9 +633,10 @@ class TestPollSubmittedPRs:
         assert data["submitted"][0]["last_polled_at"] is not None
         svc.update_submitted_prs.assert_called_once()
 
+    @patch("routes.oss_routes.batch_pr_states", return_value=None)
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     @patch("routes.oss_routes.OSSService")
-    def test_skips_polling_for_already_terminal_prs(self, mock_svc_cls, mock_user, client):
+    def test_skips_polling_for_already_terminal_prs(self, mock_svc_cls, mock_user, _mock_batch, client):
         """PRs in merged/closed state should not trigger gh CLI calls."""
         svc = mock_svc_cls.return_value
         svc.get_submitted_prs.return_value = [{
@@ -564,11 +658,12 @@ class TestPollSubmittedPRs:
 
         assert data["submitted"][0]["state"] == "merged"
 
+    @patch("routes.oss_routes.batch_pr_states", return_value=None)
     @patch("routes.oss_routes.notify_upstream_merged")
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     @patch("routes.oss_routes.OSSService")
     @patch("routes.oss_routes.run_gh_command")
-    def test_fires_merge_notification_on_state_change(self, mock_gh, mock_svc_cls, mock_user, mock_notify, client):
+    def test_fires_merge_notification_on_state_change(self, mock_gh, mock_svc_cls, mock_user, mock_notify, _mock_batch, client):
         svc = mock_svc_cls.return_value
         svc.get_submitted_prs.return_value = [{
             "origin_slug": "vercel/next.js",
@@ -585,12 +680,7 @@ class TestPollSubmittedPRs:
 
         mock_gh.return_value = {
             "success": True,
-            "output": json.dumps({
-                "state": "MERGED",
-                "reviewDecision": "APPROVED",
-                "mergedAt": "2026-02-19T12:00:00Z",
-                "closedAt": None,
-            })
+            "output": _pr_view_tsv("MERGED", "APPROVED", "2026-02-19T12:00:00Z", None)
         }
 
         client.post(f"{PREFIX}/api/oss/poll-submitted-prs",
@@ -602,11 +692,12 @@ class TestPollSubmittedPRs:
             "Fix routing",
         )
 
+    @patch("routes.oss_routes.batch_pr_states", return_value=None)
     @patch("routes.oss_routes.notify_upstream_feedback")
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     @patch("routes.oss_routes.OSSService")
     @patch("routes.oss_routes.run_gh_command")
-    def test_fires_feedback_notification_on_review_change(self, mock_gh, mock_svc_cls, mock_user, mock_notify, client):
+    def test_fires_feedback_notification_on_review_change(self, mock_gh, mock_svc_cls, mock_user, mock_notify, _mock_batch, client):
         svc = mock_svc_cls.return_value
         svc.get_submitted_prs.return_value = [{
             "origin_slug": "vercel/next.js",
@@ -623,12 +714,7 @@ class TestPollSubmittedPRs:
 
         mock_gh.return_value = {
             "success": True,
-            "output": json.dumps({
-                "state": "OPEN",
-                "reviewDecision": "CHANGES_REQUESTED",
-                "mergedAt": None,
-                "closedAt": None,
-            })
+            "output": _pr_view_tsv("OPEN", "CHANGES_REQUESTED", None, None)
         }
 
         client.post(f"{PREFIX}/api/oss/poll-submitted-prs",
@@ -640,11 +726,12 @@ class TestPollSubmittedPRs:
             "CHANGES_REQUESTED",
         )
 
+    @patch("routes.oss_routes.batch_pr_states", return_value=None)
     @patch("routes.oss_routes.notify_upstream_feedback")
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     @patch("routes.oss_routes.OSSService")
     @patch("routes.oss_routes.run_gh_command")
-    def test_no_notification_when_review_unchanged(self, mock_gh, mock_svc_cls, mock_user, mock_notify, client):
+    def test_no_notification_when_review_unchanged(self, mock_gh, mock_svc_cls, mock_user, mock_notify, _mock_batch, client):
         """If review_decision hasn't changed, no notification should fire."""
         svc = mock_svc_cls.return_value
         svc.get_submitted_prs.return_value = [{
@@ -662,12 +749,7 @@ class TestPollSubmittedPRs:
 
         mock_gh.return_value = {
             "success": True,
-            "output": json.dumps({
-                "state": "OPEN",
-                "reviewDecision": "APPROVED",  # Same — no change
-                "mergedAt": None,
-                "closedAt": None,
-            })
+            "output": _pr_view_tsv("OPEN", "APPROVED", None, None),  # Same review — no change
         }
 
         client.post(f"{PREFIX}/api/oss/poll-submitted-prs",
@@ -676,6 +758,53 @@ class TestPollSubmittedPRs:
         mock_notify.assert_not_called()
 
 
+class TestPollSubmittedPRsBatch:
+    """Tests for the batched GraphQL path in POST /api/oss/poll-submitted-prs."""
+
+    @patch("routes.oss_routes.notify_upstream_merged")
+    @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
+    @patch("routes.oss_routes.OSSService")
+    @patch("routes.oss_routes.run_gh_command")
+    @patch("routes.oss_routes.batch_pr_states")
+    def test_one_query_updates_open_prs_in_order(self, mock_batch, mock_gh, mock_svc_cls, mock_user, mock_notify, client):
+        svc = mock_svc_cls.return_value
+        svc.get_submitted_prs.return_value = [
+            {"origin_slug": "a/x", "pr_url": "https://github.com/a/x/pull/1", "title": "One", "state": "open"},
+            {"origin_slug": "b/y", "pr_url": "https://github.com/b/y/pull/2", "title": "Two", "state": "open"},
+            {"origin_slug": "c/z", "pr_url": "https://github.com/c/z/pull/3", "title": "Done", "state": "closed"},
+        ]
+        mock_batch.return_value = {
+            ("a", "x", 1): {"state": "MERGED", "reviewDecision": None, "mergedAt": "2026-02-19T12:00:00Z", "closedAt": None},
+        }
+
+        data = client.post(f"{PREFIX}/api/oss/poll-submitted-prs", json={}).get_json()
+
+        mock_gh.assert_not_called()
+        assert mock_batch.call_args[0][0] == {("a", "x", 1), ("b", "y", 2)}
+        assert [pr["state"] for pr in data["submitted"]] == ["merged", "open", "closed"]
+        assert "last_polled_at" not in data["submitted"][1]
+        mock_notify.assert_called_once_with("a/x", "https://github.com/a/x/pull/1", "One")
+
+
+class TestPollSubmittedPRsRefs:
+    """Stored owner/repo/number fields address PRs without parsing the URL."""
+
+    @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
+    @patch("routes.oss_routes.OSSService")
+    @patch("routes.oss_routes.batch_pr_states", return_value={})
+    def test_prefers_stored_fields_over_url(self, mock_batch, mock_svc_cls, mock_user, client):
+        svc = mock_svc_cls.return_value
+        svc.get_submitted_prs.return_value = [
+            {"pr_url": "https://github.com/old/name/pull/7", "repo_owner": "new", "repo_name": "home",
+             "pr_number": 7, "state": "open"},
+            {"pr_url": "https://github.com/a/x/pull/1", "pr_number": 1, "state": "open"},
+        ]
+
+        client.post(f"{PREFIX}/api/oss/poll-submitted-prs", json={})
+
+        assert mock_batch.call_args[0][0] == {("new", "home", 7), ("a", "x", 1)}
+
+
 # ============ Stage 3: Fork & Assign ============
 
 
@@ -851,15 +980,34 @@ class TestForkAndAssign:
 class TestStage4ForkPRs:
     """Tests for GET /api/oss/stage4-fork-prs."""
 
+    @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
+    @patch("routes.oss_routes.OSSService")
+    @patch("routes.oss_routes.batch_open_prs")
+    def test_batch_query_covers_all_forks(self, mock_batch, mock_svc_cls, mock_user, client):
+        """One batched query; each PR is tagged with its fork and origin."""
+        svc = mock_svc_cls.return_value
+        svc.get_active_fork_repos.return_value = {("fastify/fastify", "fastify"), ("pallets/flask", "flask")}
+        mock_batch.return_value = {
+            "fastify": [{"number": 1, "title": "Fix docs", "createdAt": "2026-02-19T00:00:00Z"}],
+            "flask": [{"number": 2, "title": "Fix typo", "createdAt": "2026-02-20T00:00:00Z"}],
+        }
+
+        resp = client.get(f"{PREFIX}/api/oss/stage4-fork-prs")
+        data = resp.get_json()
+
+        mock_batch.assert_called_once()
+        assert mock_batch.call_args[0][1] == {"fastify", "flask"}
+        assert [pr["originSlug"] for pr in data["prs"]] == ["pallets/flask", "fastify/fastify"]
+        assert data["prs"][1]["repo"] == "fastify"
+
+    @patch("routes.oss_routes.batch_open_prs", return_value=None)
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     @patch("routes.oss_routes.OSSService")
     @patch("routes.oss_routes.run_gh_command")
-    def test_injects_repo_and_origin_slug_into_prs(self, mock_gh, mock_svc_cls, mock_user, client):
+    def test_injects_repo_and_origin_slug_into_prs(self, mock_gh, mock_svc_cls, mock_user, mock_batch, client):
         """Tests that _get_fork_prs adds repo/originSlug fields to each PR dict."""
         svc = mock_svc_cls.return_value
-        svc.get_assigned_issues.return_value = [
-            {"origin_slug": "fastify/fastify", "repo": "fastify"},
-        ]
+        svc.get_active_fork_repos.return_value = {("fastify/fastify", "fastify")}
 
         mock_gh.return_value = {
             "success": True,
@@ -879,35 +1027,17 @@ class TestStage4ForkPRs:
         assert data["prs"][0]["repo"] == "fastify"
         assert data["prs"][0]["originSlug"] == "fastify/fastify"
 
-    @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
-    @patch("routes.oss_routes.OSSService")
-    @patch("routes.oss_routes.run_gh_command")
-    def test_deduplicates_forked_repos_via_set(self, mock_gh, mock_svc_cls, mock_user, client):
-        """Two assignments for same repo should only fetch PRs once."""
-        svc = mock_svc_cls.return_value
-        svc.get_assigned_issues.return_value = [
-            {"origin_slug": "fastify/fastify", "repo": "fastify"},
-            {"origin_slug": "fastify/fastify", "repo": "fastify"},
-        ]
-
-        mock_gh.return_value = {"success": True, "output": json.dumps([])}
-
-        client.get(f"{PREFIX}/api/oss/stage4-fork-prs")
-
-        assert mock_gh.call_count == 1
-
 
 class TestForkPRDetails:
     """Tests for POST /api/oss/fork-pr-details."""
 
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     @patch("routes.oss_routes.run_gh_command")
-    def test_merges_diff_into_pr_data(self, mock_gh, mock_user, client):
-        """Tests that the route makes 2 gh calls and injects diff into pr_data."""
-        mock_gh.side_effect = [
-            {"success": True, "output": json.dumps({"number": 1, "title": "Fix docs", "state": "OPEN"})},
-            {"success": True, "output": "diff --git a/README.md b/README.md\n+fixed"},
-        ]
+    def test_returns_metadata_without_diff(self, mock_gh, mock_user, client):
+        """Tests that the route makes a single pr view call; the diff has its own endpoint."""
+        mock_gh.return_value = {
+            "success": True, "output": json.dumps({"number": 1, "title": "Fix docs", "state": "OPEN"}),
+        }
 
         resp = client.post(
             f"{PREFIX}/api/oss/fork-pr-details",
@@ -918,8 +1048,8 @@ class TestForkPRDetails:
 
         assert data["success"] is True
         assert data["pr"]["title"] == "Fix docs"
-        assert "diff" in data["pr"]
-        assert "+fixed" in data["pr"]["diff"]
+        assert "diff" not in data["pr"]
+        assert mock_gh.call_count == 1
 
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     def test_missing_fields(self, mock_user, client):
@@ -934,6 +1064,27 @@ class TestForkPRDetails:
         assert "missing" in data["error"].lower()
 
 
+class TestForkPRDiff:
+    """Tests for GET /api/oss/fork-pr-diff."""
+
+    @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
+    @patch("routes.oss_routes.stream_gh_command")
+    def test_streams_gh_diff_chunks(self, mock_stream, mock_user, client):
+        mock_stream.return_value = iter([b"diff --git a/README.md b/README.md\n", b"+fixed\n"])
+
+        resp = client.get(f"{PREFIX}/api/oss/fork-pr-diff?repo=fastify&pr=1")
+
+        assert resp.mimetype == "text/plain"
+        assert resp.data == b"diff --git a/README.md b/README.md\n+fixed\n"
+        mock_stream.assert_called_once_with(["pr", "diff", "1", "-R", "testuser/fastify"])
+
+    def test_missing_fields(self, client):
+        resp = client.get(f"{PREFIX}/api/oss/fork-pr-diff?repo=fastify")
+
+        assert resp.status_code == 400
+        assert resp.get_json()["success"] is False
+
+
 class TestApproveForkPR:
     """Tests for POST /api/oss/approve-fork-pr."""
 
@@ -954,16 +1105,15 @@ class TestMergeForkPR:
 
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     @patch("routes.oss_routes.OSSService")
-    @patch("routes.oss_routes.run_gh_command")
-    def test_merge_extracts_branch_info_and_saves_to_stage5(self, mock_gh, mock_svc_cls, mock_user, client):
-        """Tests the multi-step merge flow: view → draft check → merge → save_ready_to_submit."""
+    @patch("routes.oss_routes.merge_pull_request")
+    def test_merge_extracts_branch_info_and_saves_to_stage5(self, mock_merge, mock_svc_cls, mock_user, client):
+        """Tests the merge flow: merge_pull_request → save_ready_to_submit with its PR info."""
         svc = mock_svc_cls.return_value
 
-        mock_gh.side_effect = [
-            {"success": True, "output": json.dumps({"headRefName": "fix-docs", "title": "Fix docs", "baseRefName": "main"})},
-            {"success": True, "output": json.dumps({"isDraft": False})},
-            {"success": True, "output": "Merged"},
-        ]
+        mock_merge.return_value = {
+            "success": True,
+            "pr": {"headRefName": "fix-docs", "title": "Fix docs", "baseRefName": "main", "isDraft": True},
+        }
 
         resp = client.post(
             f"{PREFIX}/api/oss/merge-fork-pr",
@@ -973,6 +1123,7 @@ class TestMergeForkPR:
         data = resp.get_json()
 
         assert data["success"] is True
+        mock_merge.assert_called_once_with("testuser", "fastify", 1)
         svc.save_ready_to_submit.assert_called_once_with(
             origin_slug="fastify/fastify",
             repo="fastify",
@@ -983,26 +1134,21 @@ class TestMergeForkPR:
 
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     @patch("routes.oss_routes.OSSService")
-    @patch("routes.oss_routes.run_gh_command")
-    def test_merge_marks_draft_as_ready_before_merge(self, mock_gh, mock_svc_cls, mock_user, client):
-        """Tests the isDraft branch — should call 'pr ready' before 'pr merge'."""
+    @patch("routes.oss_routes.merge_pull_request")
+    def test_failed_merge_does_not_advance_to_stage5(self, mock_merge, mock_svc_cls, mock_user, client):
         svc = mock_svc_cls.return_value
-
-        mock_gh.side_effect = [
-            {"success": True, "output": json.dumps({"headRefName": "fix", "title": "Fix", "baseRefName": "main"})},
-            {"success": True, "output": json.dumps({"isDraft": True})},
-            {"success": True, "output": ""},  # pr ready
-            {"success": True, "output": "Merged"},  # pr merge
-        ]
+        mock_merge.return_value = {"success": False, "error": "Pull request is not mergeable", "pr": {}}
 
         resp = client.post(
             f"{PREFIX}/api/oss/merge-fork-pr",
             json={"repo": "fastify", "pr_number": 1, "origin_slug": "fastify/fastify"},
             content_type="application/json",
         )
+        data = resp.get_json()
 
-        assert resp.get_json()["success"] is True
-        assert mock_gh.call_count == 4  # view + draft check + ready + merge
+        assert data["success"] is False
+        assert "not mergeable" in data["error"]
+        svc.save_ready_to_submit.assert_not_called()
 
     @patch("routes.oss_routes.get_authenticated_user", return_value="testuser")
     def test_missing_fields(self, mock_user, client):
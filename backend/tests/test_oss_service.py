@@ -7,7 +7,7 @@ from unittest.mock import patch, MagicMock
 
 import pytest
 
-from services.oss_service import OSSService, OSS_DATA_DIR, _load_json, _save_json
+from services.oss_service import OSSService, OSS_DATA_DIR, _call_aggregator, _load_json, _save_json, _claim_queue
 
 
 @pytest.fixture(autouse=True)
@@ -128,6 +128,8 @@ class TestSubmittedPRs:
         items = svc.get_submitted_prs()
         assert len(items) == 1
         assert items[0]["pr_number"] == 123
+        assert items[0]["repo_owner"] == "fastify"
+        assert items[0]["repo_name"] == "fastify"
         assert items[0]["state"] == "open"
         assert items[0]["review_decision"] is None
         assert items[0]["merged_at"] is None
@@ -205,6 +207,43 @@ class TestSelectedIssues:
         assert svc.find_selected_issue("fastify/fastify", 99) is None
 
 
+class TestLoadJsonCache:
+    """Tests for the stat-validated read cache behind _load_json."""
+
+    def test_unchanged_file_is_read_once(self, clean_watchlist):
+        _save_json("assignments.json", [{"origin_slug": "a/b", "issue_number": 1}])
+
+        with patch("services.oss_service.open", create=True, wraps=open) as mock_open:
+            _load_json("assignments.json")
+            _load_json("assignments.json")
+
+        assert mock_open.call_count == 1
+
+    def test_save_writes_compact_json_atomically(self, clean_watchlist):
+        _save_json("assignments.json", [{"origin_slug": "a/b", "issue_number": 1}])
+
+        raw = (clean_watchlist / "assignments.json").read_bytes()
+        assert b"\n" not in raw
+        assert not list(clean_watchlist.glob("*.tmp"))
+
+    def test_returned_list_is_a_copy(self, clean_watchlist):
+        _save_json("assignments.json", [{"origin_slug": "a/b", "issue_number": 1}])
+
+        _load_json("assignments.json").append({"origin_slug": "c/d", "issue_number": 2})
+
+        assert len(_load_json("assignments.json")) == 1
+
+    def test_editing_loaded_item_does_not_change_next_load(self, clean_watchlist):
+        _save_json("submitted-prs.json", [{"origin_slug": "a/b", "issue_number": 1, "state": "open"}])
+
+        _load_json("submitted-prs.json")[0]["state"] = "merged"
+        _save_json("assignments.json", [{"origin_slug": "a/b", "issue_number": 1}])
+        OSSService().find_assignment("a/b", 1)["fork_issue_number"] = 9
+
+        assert _load_json("submitted-prs.json")[0]["state"] == "open"
+        assert "fork_issue_number" not in OSSService().find_assignment("a/b", 1)
+
+
 class TestAssignments:
     """Tests for assignment tracking and dedup."""
 
@@ -231,6 +270,25 @@ class TestAssignments:
         svc = OSSService()
         assert svc.find_assignment("fastify/fastify", 99) is None
 
+    def test_find_assignment_sees_saves_after_a_lookup(self, clean_watchlist):
+        """The lookup index is dropped on write, so a miss doesn't stick."""
+        svc = OSSService()
+        assert svc.find_assignment("fastify/fastify", 42) is None
+
+        svc.save_assignment("fastify", "fastify", 42, 1, "https://github.com/testuser/fastify/issues/1")
+
+        assert svc.find_assignment("fastify/fastify", 42)["fork_issue_number"] == 1
+
+    def test_find_assignment_sees_external_file_edits(self, clean_watchlist):
+        svc = OSSService()
+        svc.save_assignment("fastify", "fastify", 42, 1, "https://github.com/testuser/fastify/issues/1")
+        assert svc.find_assignment("fastify/fastify", 42) is not None
+
+        with open(clean_watchlist / "assignments.json", "w", encoding="utf-8") as f:
+            json.dump([], f)
+
+        assert svc.find_assignment("fastify/fastify", 42) is None
+
 
 class TestReadyToSubmit:
     """Tests for ready-to-submit tracking."""
@@ -315,6 +373,17 @@ class TestForkManagement:
         result = svc.wait_for_fork("testuser", "fastify", timeout=6, interval=3)
         assert result is False
 
+    @patch("services.oss_service.time.sleep")
+    @patch("services.oss_service.run_gh_command")
+    def test_wait_for_fork_backs_off_within_timeout(self, mock_gh, mock_sleep):
+        mock_gh.return_value = {"success": False, "error": "Not found"}
+        svc = OSSService()
+
+        svc.wait_for_fork("testuser", "fastify", timeout=20, interval=8)
+
+        delays = [c[0][0] for c in mock_sleep.call_args_list]
+        assert delays == [1, 2, 4, 8, 5]
+
 
 class TestBuildAgentContext:
     """Tests for build_agent_context — markdown body generation for fork issues."""
@@ -423,6 +492,96 @@ class TestBuildAgentContext:
         assert "Quirks" not in body
 
 
+class TestActiveForkRepos:
+    """Tests for get_active_fork_repos (Stage 4 fork selection)."""
+
+    def test_deduplicates_assignments_per_fork(self, clean_watchlist):
+        svc = OSSService()
+        svc.save_assignment("fastify", "fastify", 1, 10, "https://example.com/1")
+        svc.save_assignment("fastify", "fastify", 2, 11, "https://example.com/2")
+
+        assert svc.get_active_fork_repos() == {("fastify/fastify", "fastify")}
+
+    def test_drops_forks_whose_work_ended_upstream_long_ago(self, clean_watchlist):
+        svc = OSSService()
+        _save_json("assignments.json", [
+            {"origin_slug": "old/done", "repo": "done", "assigned_at": "2026-01-01T00:00:00Z"},
+            {"origin_slug": "old/reused", "repo": "reused", "assigned_at": "2026-01-01T00:00:00Z"},
+            {"origin_slug": "old/reused", "repo": "reused", "assigned_at": "2026-01-20T00:00:00Z"},
+        ])
+        _save_json("submitted-prs.json", [
+            {"origin_slug": "old/done", "state": "merged", "merged_at": "2026-01-05T00:00:00Z"},
+            {"origin_slug": "old/reused", "state": "closed", "closed_at": "2026-01-05T00:00:00Z"},
+        ])
+
+        assert svc.get_active_fork_repos() == {("old/reused", "reused")}
+
+    def test_fork_stays_while_another_assignment_is_unfinished(self, clean_watchlist):
+        svc = OSSService()
+        _save_json("assignments.json", [
+            {"origin_slug": "two/issues", "repo": "issues", "issue_number": 1, "assigned_at": "2026-01-01T00:00:00Z"},
+            {"origin_slug": "two/issues", "repo": "issues", "issue_number": 2, "assigned_at": "2026-01-02T00:00:00Z"},
+        ])
+        _save_json("submitted-prs.json", [
+            {"origin_slug": "two/issues", "state": "merged",
+             "submitted_at": "2026-01-03T00:00:00Z", "merged_at": "2026-01-05T00:00:00Z"},
+        ])
+
+        assert svc.get_active_fork_repos() == {("two/issues", "issues")}
+
+        svc.save_submitted_pr("two/issues", "https://github.com/two/issues/pull/8", "Second fix")
+        assert svc.get_active_fork_repos() == {("two/issues", "issues")}
+
+
+class TestCallAggregator:
+    """Tests for aggregator calls over the pooled session."""
+
+    @patch("services.oss_service._agg_session")
+    def test_calls_reuse_shared_session(self, mock_session, monkeypatch):
+        monkeypatch.setattr("services.oss_service.AGGREGATOR_API_URL", "https://agg.example")
+        mock_session.get.return_value = MagicMock(ok=True, json=lambda: {"ok": 1})
+        mock_session.post.return_value = MagicMock(ok=False)
+
+        assert _call_aggregator("/watchlist") == {"ok": 1}
+        assert _call_aggregator("/claims", method="POST", data={"a": 1}) is None
+        mock_session.get.assert_called_once_with("https://agg.example/watchlist", timeout=10)
+        mock_session.post.assert_called_once_with("https://agg.example/claims", json={"a": 1}, timeout=10)
+
+
+class TestGetDossier:
+    """Tests for the in-process dossier memo."""
+
+    def setup_method(self):
+        from services.cache import clear_memoized
+        clear_memoized()
+
+    @patch("services.oss_service._call_aggregator")
+    def test_repeat_lookups_hit_aggregator_once(self, mock_agg):
+        mock_agg.return_value = {"slug": "fastify-fastify"}
+        svc = OSSService()
+
+        assert svc.get_dossier("fastify-fastify") == {"slug": "fastify-fastify"}
+        assert svc.get_dossier("fastify-fastify") == {"slug": "fastify-fastify"}
+        mock_agg.assert_called_once_with("/recon/fastify-fastify/dossier")
+
+    @patch("services.oss_service._call_aggregator")
+    def test_callers_get_independent_copies(self, mock_agg):
+        mock_agg.return_value = {"slug": "fastify-fastify", "notes": ["a"]}
+        svc = OSSService()
+
+        svc.get_dossier("fastify-fastify")["notes"].append("b")
+
+        assert svc.get_dossier("fastify-fastify")["notes"] == ["a"]
+
+    @patch("services.oss_service._call_aggregator", return_value=None)
+    def test_missing_dossier_is_not_memoized(self, mock_agg):
+        svc = OSSService()
+
+        svc.get_dossier("org-repo")
+        svc.get_dossier("org-repo")
+        assert mock_agg.call_count == 2
+
+
 class TestClaimManagement:
     """Tests for report_claim and report_unclaim."""
 
@@ -460,6 +619,27 @@ class TestClaimManagement:
         # Should not raise
         svc.report_claim("org/repo", "id", "user", "url")
 
+    @patch("services.oss_service.time.sleep")
+    @patch("services.oss_service.AGGREGATOR_API_URL", "https://aggregator.test")
+    @patch("services.oss_service._call_aggregator")
+    def test_queued_claim_report_retries_until_accepted(self, mock_agg, mock_sleep):
+        mock_agg.side_effect = [None, {"ok": True}]
+        svc = OSSService()
+
+        svc.queue_claim_report("fastify/fastify", "github-fastify-fastify-42", "testuser", "url")
+        _claim_queue.join()
+
+        assert mock_agg.call_count == 2
+        assert mock_agg.call_args[0][0] == "/recon/fastify-fastify/claim"
+
+    @patch("services.oss_service.AGGREGATOR_API_URL", "")
+    @patch("services.oss_service._call_aggregator")
+    def test_queued_claim_report_skipped_without_aggregator(self, mock_agg):
+        OSSService().queue_claim_report("org/repo", "id", "user", "url")
+        _claim_queue.join()
+
+        mock_agg.assert_not_called()
+
     @patch("services.oss_service._call_aggregator")
     def test_report_unclaim_graceful_when_aggregator_down(self, mock_agg):
         mock_agg.return_value = None
@@ -410,6 +410,25 @@ export async function mockStageAPIs(page: Page): Promise<void> {
     })
   })
 
+  await page.route('**/dispatch/api/stage2-repos/stream', async route => {
+    // Cold-cache NDJSON: owner line, repos in completion order with counts
+    // pending, then the batched commit counts
+    const lines = [
+      { owner: mockOwner },
+      ...[...mockStage2Repos].reverse().map(repo => ({ ...repo, commitsSinceLastRun: 0 })),
+      {
+        commitCounts: Object.fromEntries(
+          mockStage2Repos.map(repo => [repo.name, repo.commitsSinceLastRun])
+        )
+      }
+    ]
+    await route.fulfill({
+      status: 200,
+      contentType: 'application/x-ndjson',
+      body: lines.map(line => JSON.stringify(line)).join('\n') + '\n'
+    })
+  })
+
   await page.route('**/dispatch/api/stage3-issues', async route => {
     await route.fulfill({
       status: 200,
@@ -452,6 +471,14 @@ export async function mockStageAPIs(page: Page): Promise<void> {
       })
     })
   })
+
+  await page.route('**/dispatch/api/pr-diff**', async route => {
+    await route.fulfill({
+      status: 200,
+      contentType: 'text/plain',
+      body: mockPRDetails.diff
+    })
+  })
 }
 
 /**
@@ -71,7 +71,7 @@ test.describe('Stage 2 - Run', () => {
   test('displays repos with vibecheck installed', async ({ page }) => {
     // Set up response wait BEFORE clicking
     await Promise.all([
-      page.waitForResponse('**/dispatch/api/stage2-repos'),
+      page.waitForResponse('**/dispatch/api/stage2-repos/stream'),
       page.getByRole('button', { name: /Run VibeCheck/i }).click()
     ])
 
@@ -79,9 +79,25 @@ test.describe('Stage 2 - Run', () => {
     await expect(page.locator('text=repo-with-vc-1').first()).toBeVisible()
   })
 
+  test('renders streamed repos in stage order', async ({ page }) => {
+    await Promise.all([
+      page.waitForResponse('**/dispatch/api/stage2-repos/stream'),
+      page.getByRole('button', { name: /Run VibeCheck/i }).click()
+    ])
+
+    // The stream sends repo-with-vc-2 first; the store applies the final commit counts
+    // and re-sorts by commits since last run
+    const first = page.locator('text=repo-with-vc-1').first()
+    const second = page.locator('text=repo-with-vc-2').first()
+    await expect(first).toBeVisible()
+    await expect(second).toBeVisible()
+    const [firstBox, secondBox] = await Promise.all([first.boundingBox(), second.boundingBox()])
+    expect(firstBox?.y ?? Infinity).toBeLessThan(secondBox?.y ?? -Infinity)
+  })
+
   test('shows recommended repos section', async ({ page }) => {
     await Promise.all([
-      page.waitForResponse('**/dispatch/api/stage2-repos'),
+      page.waitForResponse('**/dispatch/api/stage2-repos/stream'),
       page.getByRole('button', { name: /Run VibeCheck/i }).click()
     ])
 
@@ -92,7 +108,7 @@ test.describe('Stage 2 - Run', () => {
 
   test('has Run action buttons', async ({ page }) => {
     await Promise.all([
-      page.waitForResponse('**/dispatch/api/stage2-repos'),
+      page.waitForResponse('**/dispatch/api/stage2-repos/stream'),
       page.getByRole('button', { name: /Run VibeCheck/i }).click()
     ])
 
@@ -70,6 +70,57 @@ export function createApiClient(config: ApiClientConfig) {
     }
   }
 
+  async function text(endpoint: string): Promise<string> {
+    const url = `${baseUrl}${endpoint}`
+
+    const headers: HeadersInit = {}
+    const authKey = getAuthKey?.()
+    if (authKey) {
+      headers['X-User-Key'] = authKey
+    }
+
+    const response = await fetch(url, { method: 'GET', headers, credentials: 'include' })
+    if (!response.ok) {
+      const error: ApiError = new Error(`API error: ${response.status} ${response.statusText}`)
+      error.status = response.status
+      throw error
+    }
+    return response.text()
+  }
+
+  async function stream<T>(endpoint: string, onLine: (line: T) => void): Promise<void> {
+    const url = `${baseUrl}${endpoint}`
+
+    const headers: HeadersInit = {}
+    const authKey = getAuthKey?.()
+    if (authKey) {
+      headers['X-User-Key'] = authKey
+    }
+
+    const response = await fetch(url, { method: 'GET', headers, credentials: 'include' })
+    if (!response.ok || !response.body) {
+      const error: ApiError = new Error(`API error: ${response.status} ${response.statusText}`)
+      error.status = response.status
+      throw error
+    }
+
+    // Split the NDJSON body on newlines as chunks arrive
+    const reader = response.body.getReader()
+    const decoder = new TextDecoder()
+    let buffered = ''
+    let chunk = await reader.read()
+    while (!chunk.done) {
+      buffered += decoder.decode(chunk.value, { stream: true })
+      const lines = buffered.split('\n')
+      buffered = lines.pop() ?? ''
+      for (const line of lines) {
+        if (line.trim()) onLine(JSON.parse(line) as T)
+      }
+      chunk = await reader.read()
+    }
+    if (buffered.trim()) onLine(JSON.parse(buffered) as T)
+  }
+
   return {
     /**
      * Make a GET request
@@ -79,7 +130,17 @@ export function createApiClient(config: ApiClientConfig) {
     /**
      * Make a POST request
      */
-    post: <T>(endpoint: string, data?: unknown): Promise<T> => request<T>('POST', endpoint, data)
+    post: <T>(endpoint: string, data?: unknown): Promise<T> => request<T>('POST', endpoint, data),
+
+    /**
+     * GET a plain-text endpoint (e.g. a streamed diff)
+     */
+    text,
+
+    /**
+     * Stream an NDJSON GET endpoint, calling onLine for each parsed line
+     */
+    stream
   }
 }
 
@@ -14,6 +14,7 @@ import type {
   Stage1Response,
   Stage2Response,
   Stage3Response,
+  Stage2Repo,
   Stage4Response,
   WorkflowStatusResponse,
   OSSStage1Response,
@@ -44,6 +45,29 @@ export async function getStage2Repos(): Promise<Stage2Response> {
   return apiClient.get<Stage2Response>('/api/stage2-repos')
 }
 
+type Stage2StreamLine = { owner: string } | { commitCounts: Record<string, number> } | Stage2Repo
+
+/**
+ * Stream Stage 2 repos as each one resolves (NDJSON: owner line, then one repo per line).
+ * On a cold cache repos arrive with commitsSinceLastRun 0 and a final commitCounts
+ * line carries the real counts.
+ */
+export async function streamStage2Repos(
+  onOwner: (owner: string) => void,
+  onRepo: (repo: Stage2Repo) => void,
+  onCommitCounts: (counts: Record<string, number>) => void
+): Promise<void> {
+  return apiClient.stream<Stage2StreamLine>('/api/stage2-repos/stream', line => {
+    if ('owner' in line) {
+      onOwner(line.owner)
+    } else if ('commitCounts' in line) {
+      onCommitCounts(line.commitCounts)
+    } else {
+      onRepo(line)
+    }
+  })
+}
+
 /**
  * Get vibecheck issues for Copilot assignment (Stage 3)
  */
@@ -124,23 +148,27 @@ export async function markPRReady(
 
 /**
  * Merge a pull request
+ *
+ * Pass isDraft when it's already known so the backend can skip its draft lookup.
  */
 export async function mergePR(
   owner: string,
   repo: string,
-  prNumber: number
+  prNumber: number,
+  isDraft?: boolean
 ): Promise<ActionResponse> {
   return apiClient.post<ActionResponse>('/api/merge-pr', {
     owner,
     repo,
-    pr_number: prNumber
+    pr_number: prNumber,
+    is_draft: isDraft
   })
 }
 
 // ============ Detail APIs ============
 
 /**
- * Get detailed info about a PR including diff
+ * Get detailed info about a PR (the diff is served separately by getPRDiff)
  */
 export async function getPRDetails(
   owner: string,
@@ -154,6 +182,14 @@ export async function getPRDetails(
   })
 }
 
+/**
+ * Get the diff of a PR (served as plain text, separate from the details)
+ */
+export async function getPRDiff(owner: string, repo: string, prNumber: number): Promise<string> {
+  const params = new URLSearchParams({ owner, repo, pr: String(prNumber) })
+  return apiClient.text(`/api/pr-diff?${params.toString()}`)
+}
+
 /**
  * Get the status of the latest vibecheck workflow run
  */
@@ -349,6 +385,14 @@ export async function getOSSForkPRDetails(
   })
 }
 
+/**
+ * Get the diff of a PR on a fork (served as plain text, separate from the details)
+ */
+export async function getOSSForkPRDiff(repo: string, prNumber: number): Promise<string> {
+  const params = new URLSearchParams({ repo, pr: String(prNumber) })
+  return apiClient.text(`/api/oss/fork-pr-diff?${params.toString()}`)
+}
+
 export async function approveOSSForkPR(
   repo: string,
   prNumber: number
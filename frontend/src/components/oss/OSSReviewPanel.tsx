@@ -8,7 +8,12 @@
 
 import { useState, useMemo, useCallback } from 'react'
 import { usePipelineStore } from '../../store'
-import { getOSSForkPRDetails, approveOSSForkPR, mergeOSSForkPR } from '../../api/endpoints'
+import {
+  getOSSForkPRDetails,
+  getOSSForkPRDiff,
+  approveOSSForkPR,
+  mergeOSSForkPR
+} from '../../api/endpoints'
 import type { ForkPR, PRDetails } from '../../api/types'
 import { formatTimeAgo } from '../../utils'
 import { LoadingState } from '../common/LoadingState'
@@ -41,9 +46,13 @@ export function OSSReviewPanel() {
       setDetailLoading(true)
 
       try {
-        const result = await getOSSForkPRDetails(pr.repo, pr.number)
+        // Metadata and diff come from separate endpoints; fetch them together
+        const [result, diff] = await Promise.all([
+          getOSSForkPRDetails(pr.repo, pr.number),
+          getOSSForkPRDiff(pr.repo, pr.number).catch(() => '')
+        ])
         if (result.success && result.pr) {
-          setCurrentPR(result.pr)
+          setCurrentPR({ ...result.pr, diff })
         } else {
           addLog(`Failed to load PR details: ${result.error}`, 'error')
         }
@@ -184,7 +184,7 @@ export function StageDetails({ item }: StageDetailsProps) {
           <button
             className="action-btn action-btn-success"
             onClick={() => {
-              void merge(item.repo, pr.number)
+              void merge(item.repo, pr.number, pr.isDraft)
             }}
             disabled={actionLoading}
           >
@@ -95,7 +95,8 @@ function PRReviewContent({ currentItem, currentDetails, detailsLoading }: PRRevi
 
       // Step 3: Merge the PR
       addLog(`Merging ${prRef}...`, 'info')
-      const mergeResult = await mergePR(owner, currentItem.repo, pr.number)
+      // Step 1 already marked any draft as ready
+      const mergeResult = await mergePR(owner, currentItem.repo, pr.number, false)
       if (mergeResult.success) {
         addLog(`Merged ${prRef}`, 'success')
         // Reset loading state BEFORE removing from queue to avoid stuck button on next item
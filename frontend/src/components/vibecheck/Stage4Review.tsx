@@ -8,7 +8,7 @@
 
 import { useState, useMemo, useCallback } from 'react'
 import { usePipelineStore } from '../../store'
-import { getPRDetails, markPRReady } from '../../api/endpoints'
+import { getPRDetails, getPRDiff, markPRReady } from '../../api/endpoints'
 import type { PullRequest, PRDetails } from '../../api/types'
 import { isPRReady } from '../../utils'
 import { useReviewActions } from '../../hooks'
@@ -58,9 +58,13 @@ export function Stage4Review() {
     setLoading(true)
 
     try {
-      const result = await getPRDetails(owner, pr.repo ?? '', pr.number)
+      // Metadata and diff come from separate endpoints; fetch them together
+      const [result, diff] = await Promise.all([
+        getPRDetails(owner, pr.repo ?? '', pr.number),
+        getPRDiff(owner, pr.repo ?? '', pr.number).catch(() => '')
+      ])
       if (result.success && result.pr) {
-        setCurrentPR(result.pr)
+        setCurrentPR({ ...result.pr, diff })
       } else {
         addLog(`Failed to load PR details: ${result.error}`, 'error')
       }
@@ -100,7 +104,7 @@ export function Stage4Review() {
 
   const handleMerge = async () => {
     if (!currentPR) return
-    await merge(currentPR.repo ?? '', currentPR.number)
+    await merge(currentPR.repo ?? '', currentPR.number, currentPR.isDraft)
     showNextPR()
   }
 
@@ -177,7 +181,7 @@ export function Stage4Review() {
                       void approve(pr.repo ?? '', pr.number)
                     }}
                     onMerge={() => {
-                      void merge(pr.repo ?? '', pr.number)
+                      void merge(pr.repo ?? '', pr.number, pr.isDraft)
                     }}
                   />
                 ))}
@@ -48,13 +48,13 @@ export function useReviewActions({
   )
 
   const merge = useCallback(
-    async (repo: string, prNumber: number) => {
+    async (repo: string, prNumber: number, isDraft?: boolean) => {
       if (!owner) return
       setActionLoading(true)
       addLog(`Merging ${repo}#${prNumber}...`, 'info')
 
       try {
-        const result = await mergePR(owner, repo, prNumber)
+        const result = await mergePR(owner, repo, prNumber, isDraft)
         if (result.success) {
           addLog(`Merged ${repo}#${prNumber}`, 'success')
           await onAfterMerge?.(repo, prNumber)
@@ -20,7 +20,7 @@ import type {
 } from '../api/types'
 import {
   getStage1Repos,
-  getStage2Repos,
+  streamStage2Repos,
   getStage3Issues,
   getStage4PRs,
   getOSSTargets,
@@ -157,6 +157,17 @@ function getStatusFromPR(pr: PullRequest): PipelineStatus {
   return 'processing'
 }
 
+// Same order as the stage2-repos endpoint: never-run repos first, then fewest
+// commits since the last run
+function sortStage2Repos(repos: Stage2Repo[]): Stage2Repo[] {
+  return [...repos].sort((a, b) => {
+    if ((a.lastRun === null) !== (b.lastRun === null)) {
+      return a.lastRun === null ? -1 : 1
+    }
+    return a.commitsSinceLastRun - b.commitsSinceLastRun
+  })
+}
+
 // ============ Stage Loader Factory ============
 
 interface StageLoaderConfig<R> {
@@ -366,15 +377,47 @@ export const usePipelineStore = create<PipelineState>((set, get) => ({
     get
   ),
 
-  loadStage2: createStageLoader(
-    {
-      stageKey: 'stage2',
-      fetchFn: getStage2Repos,
-      mapResponse: r => ({ items: r.repos })
-    },
-    set,
-    get
-  ),
+  loadStage2: async () => {
+    // Streamed so the first repos render before the slowest one resolves. On a
+    // refresh the current list stays up until the new one is complete.
+    const progressive = get().stage2.items.length === 0
+    let received: Stage2Repo[] = []
+    const showProgress = () => {
+      if (progressive) {
+        set(state => ({ stage2: { ...state.stage2, items: sortStage2Repos(received) } }))
+      }
+    }
+    set(state => ({ stage2: { ...state.stage2, loading: true, error: null } }))
+    try {
+      await streamStage2Repos(
+        owner => set({ owner }),
+        repo => {
+          received.push(repo)
+          showProgress()
+        },
+        counts => {
+          received = received.map(repo => ({
+            ...repo,
+            commitsSinceLastRun: counts[repo.name] ?? 0
+          }))
+          showProgress()
+        }
+      )
+      set(state => ({
+        stage2: {
+          ...state.stage2,
+          items: sortStage2Repos(received),
+          loading: false,
+          lastFetched: new Date()
+        }
+      }))
+      get().refreshPipelineItems()
+    } catch (err) {
+      set(state => ({
+        stage2: { ...state.stage2, loading: false, error: getErrorMessage(err) }
+      }))
+    }
+  },
 
   loadStage3: createStageLoader(
     {
@@ -6,7 +6,7 @@
 
 import { create } from 'zustand'
 import type { PRDetails, PipelineItem, PullRequest } from '../api/types'
-import { getPRDetails } from '../api/endpoints'
+import { getPRDetails, getPRDiff } from '../api/endpoints'
 import { getErrorMessage } from '../utils'
 
 // ============ Types ============
@@ -110,10 +110,14 @@ export const useReviewQueueStore = create<ReviewQueueState>((set, get) => ({
     set({ detailsLoading: true, detailsError: null })
 
     try {
-      const response = await getPRDetails(owner, currentItem.repo, pr.number)
+      // Metadata and diff come from separate endpoints; fetch them together
+      const [response, diff] = await Promise.all([
+        getPRDetails(owner, currentItem.repo, pr.number),
+        getPRDiff(owner, currentItem.repo, pr.number).catch(() => '')
+      ])
       if (response.success && response.pr) {
         set({
-          currentDetails: response.pr,
+          currentDetails: { ...response.pr, diff },
           detailsLoading: false
         })
       } else {